@@ -9,7 +9,16 @@ Implements Flag2Fail4Intent monitoring (IO/DO/OD layers).
 from dataclasses import dataclass
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+import asyncio
+import concurrent.futures
 import json
+import sys
+
+# __slots__ instead of a per-instance __dict__ where dataclass supports it (3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Per-device budget for the DO layer availability probe (seconds)
+DEVICE_PING_TIMEOUT = 0.1
 
 
 @dataclass
@@ -38,18 +47,26 @@ class IntentState:
     resume_token: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Flag2FailMonitor:
     """Flag2Fail4Intent monitoring result"""
     intent_log_id: int
     layer: str  # IO/DO/OD
     check_type: str
-    expected_value: Any
+    expected_value: Any  # Raw value, stringified only when logged
     actual_value: Any
     passed: bool
     flagged: bool = False
     suggested_action: Optional[str] = None
 
+    @property
+    def expected_str(self) -> str:
+        return str(self.expected_value)
+
+    @property
+    def actual_str(self) -> str:
+        return str(self.actual_value)
+
 
 # ============================================================================
 # HICSS Override Functions
@@ -402,8 +419,8 @@ def monitor_io_layer(
         intent_log_id=intent_id,
         layer="IO",
         check_type="input",
-        expected_value=str(expected_input),
-        actual_value=str(actual_input),
+        expected_value=expected_input,
+        actual_value=actual_input,
         passed=input_passed,
         flagged=not input_passed,
         suggested_action="retry" if not input_passed else None
@@ -415,8 +432,8 @@ def monitor_io_layer(
         intent_log_id=intent_id,
         layer="IO",
         check_type="output",
-        expected_value=str(expected_output),
-        actual_value=str(actual_output),
+        expected_value=expected_output,
+        actual_value=actual_output,
         passed=output_passed,
         flagged=not output_passed,
         suggested_action="split" if not output_passed else None
@@ -425,16 +442,66 @@ def monitor_io_layer(
     return monitors
 
 
+async def ping_device(device: str, timeout: float = DEVICE_PING_TIMEOUT) -> Optional[bool]:
+    """
+    Check device availability with a TCP connect
+
+    Devices addressed as host:port are probed directly; for other
+    identifiers (DIDs) there is no address to probe and this returns None.
+    """
+    host, sep, port = device.rpartition(":")
+    if not sep or not host or not port.isdigit():
+        return None
+
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, int(port)), timeout)
+    except (OSError, asyncio.TimeoutError):
+        return False
+
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass  # Reset on close: the device was still reachable
+    return True
+
+
 def monitor_do_layer(intent_id: int, devices: List[str], conn) -> List[Flag2FailMonitor]:
     """
     Monitor DO (Device-Output) layer
     Checks if devices are responding correctly
+
+    Blocking wrapper around monitor_do_layer_async.
     """
-    monitors = []
+    return _run_sync(monitor_do_layer_async(intent_id, devices, conn))
 
-    for device in devices:
-        # Check device availability (stub - in production, ping device)
-        device_available = True  # TODO: Actual device health check
+
+async def monitor_do_layer_async(
+    intent_id: int,
+    devices: List[str],
+    conn
+) -> List[Flag2FailMonitor]:
+    """
+    monitor_do_layer for callers already inside an event loop
+
+    All host:port devices are pinged concurrently, so the layer costs ~1 RTT
+    instead of one RTT per device. DIDs cannot be probed and pass
+    unchecked, as before pinging was added.
+    """
+    availability = await asyncio.gather(*(ping_device(device) for device in devices))
+
+    monitors = []
+    for device_available in availability:
+        if device_available is None:
+            monitors.append(Flag2FailMonitor(
+                intent_log_id=intent_id,
+                layer="DO",
+                check_type="device_availability",
+                expected_value="online",
+                actual_value="unchecked",
+                passed=True
+            ))
+            continue
 
         monitors.append(Flag2FailMonitor(
             intent_log_id=intent_id,
@@ -467,8 +534,8 @@ def monitor_od_layer(
         intent_log_id=intent_id,
         layer="OD",
         check_type="device_response",
-        expected_value=str(expected_response),
-        actual_value=str(actual_response),
+        expected_value=expected_response,
+        actual_value=actual_response,
         passed=response_passed,
         flagged=not response_passed,
         suggested_action="halt" if not response_passed else None
@@ -486,7 +553,7 @@ def log_flag2fail_monitor(monitor: Flag2FailMonitor, conn) -> int:
         RETURNING id
     """, (
         monitor.intent_log_id, monitor.layer, monitor.check_type,
-        str(monitor.expected_value), str(monitor.actual_value),
+        monitor.expected_str, monitor.actual_str,
         monitor.passed, monitor.flagged, monitor.suggested_action
     ))
     monitor_id = cur.fetchone()[0]
@@ -507,6 +574,9 @@ def check_all_layers(
     """
     Run all Flag2Fail4Intent checks (IO/DO/OD)
     Returns aggregated results with flags
+
+    From async code, use check_all_layers_async; called inside a running
+    event loop, the DO pings run on a helper thread's own loop.
     """
     all_monitors = []
 
@@ -518,6 +588,41 @@ def check_all_layers(
     do_monitors = monitor_do_layer(intent_id, devices, conn)
     all_monitors.extend(do_monitors)
 
+    return _log_and_aggregate(all_monitors, conn)
+
+
+async def check_all_layers_async(
+    intent_id: int,
+    expected_input: Any,
+    actual_input: Any,
+    expected_output: Any,
+    actual_output: Any,
+    devices: List[str],
+    conn
+) -> Dict[str, Any]:
+    """check_all_layers for callers already inside an event loop"""
+    all_monitors = monitor_io_layer(
+        intent_id, expected_input, actual_input, expected_output, actual_output, conn
+    )
+    all_monitors.extend(await monitor_do_layer_async(intent_id, devices, conn))
+
+    return _log_and_aggregate(all_monitors, conn)
+
+
+def _run_sync(coro):
+    """asyncio.run(coro), also when this thread already runs an event loop"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    # asyncio.run() refuses to nest: give the coroutine a loop on another thread
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+def _log_and_aggregate(all_monitors: List[Flag2FailMonitor], conn) -> Dict[str, Any]:
+    """Log all monitors and build the check_all_layers result"""
     # Log all monitors
     for monitor in all_monitors:
         log_flag2fail_monitor(monitor, conn)
@@ -535,8 +640,8 @@ def check_all_layers(
             {
                 "layer": m.layer,
                 "check_type": m.check_type,
-                "expected": m.expected_value,
-                "actual": m.actual_value,
+                "expected": m.expected_str,
+                "actual": m.actual_str,
                 "suggested_action": m.suggested_action
             }
             for m in flagged_monitors
@@ -14,7 +14,11 @@ Examples:
 
 import re
 import logging
-from typing import Dict, List, Optional, Tuple
+import threading
+import time
+from collections import namedtuple
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 import psycopg2
 from psycopg2.extras import RealDictCursor
@@ -25,17 +29,150 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Security database config, resolved once at import (shared, read-only)
+_DB_CONFIG = MappingProxyType({
+    'host': os.getenv('SECURITY_DB_HOST', '192.168.4.76'),
+    'port': int(os.getenv('SECURITY_DB_PORT', 5432)),
+    'database': os.getenv('SECURITY_DB_NAME', 'jtel_security'),
+    'user': os.getenv('SECURITY_DB_USER', 'jtel_security_user'),
+    'password': os.getenv('SECURITY_DB_PASSWORD', 'secure_password_here')
+})
+
+# Severity ordering as small ints (a textual DESC sort would put 'warning'
+# above 'critical')
+SEVERITY_RANK = {'critical': 4, 'error': 3, 'warning': 2, 'info': 1}
+SEVERITY_RANK_SQL = "CASE severity {} ELSE 0 END".format(
+    " ".join(f"WHEN '{name}' THEN {rank}" for name, rank in SEVERITY_RANK.items())
+)
+
+# Rows fetched per round trip by server-side (named) cursors
+STREAM_ITERSIZE = 500
+
+# Columns read on the hot check_snaft path (tuple cursor, no per-row dict)
+SNAFT_RULE_COLUMNS = (
+    'id', 'rule_type', 'intent_pattern', 'capability_limit',
+    'constraint_check', 'reason', 'severity', 'immutable'
+)
+SNAFTRule = namedtuple('SNAFTRule', SNAFT_RULE_COLUMNS)
+
+# Rule type -> field that must be set for the rule to be evaluated
+SNAFT_RULE_TYPES = {
+    'intent_block': 'intent_pattern',
+    'capability_limit': 'capability_limit',
+    'safety_constraint': 'constraint_check',
+}
+
+
+class IntentBlockIndex:
+    """
+    Intent-block rules split into literal and regex patterns
+
+    Patterns without regex metacharacters are looked up by hash on the
+    lowercased intent prefix (re.match is anchored at the start only);
+    the rest are precompiled. Rules come as (rank, rule) pairs, rank being
+    the rule's position in SQL order; the lowest-ranked match wins.
+    """
+
+    def __init__(self, rules: List[Tuple[int, SNAFTRule]]):
+        self.literals: Dict[str, Tuple[int, SNAFTRule]] = {}
+        self.regexes: List[Tuple[int, re.Pattern, SNAFTRule]] = []
+
+        for rank, rule in rules:
+            pattern = rule.intent_pattern
+            if re.escape(pattern) == pattern:
+                self.literals.setdefault(pattern.lower(), (rank, rule))
+            else:
+                self.regexes.append((rank, re.compile(pattern, re.IGNORECASE), rule))
+
+        self.literal_lengths = sorted({len(literal) for literal in self.literals})
+
+    def match(self, intent: str) -> Optional[Tuple[int, SNAFTRule]]:
+        """Return (rank, rule) of the highest-ranked rule blocking this intent, or None"""
+        hit = None
+
+        intent_lower = intent.lower()
+        for length in self.literal_lengths:
+            if length > len(intent_lower):
+                break
+            entry = self.literals.get(intent_lower[:length])
+            if entry and (hit is None or entry[0] < hit[0]):
+                hit = entry
+
+        for rank, regex, rule in self.regexes:
+            if hit and rank > hit[0]:
+                break
+            if regex.match(intent):
+                return rank, rule
+
+        return hit
+
+
+def bucket_snaft_rules(rules) -> Dict:
+    """
+    Group rules by rule_type as (rank, rule) pairs
+
+    rank is the rule's position in the input (SQL severity) order, so
+    _find_violation can still return the first violated rule overall.
+    """
+    buckets = {rule_type: [] for rule_type in SNAFT_RULE_TYPES}
+    for rank, rule in enumerate(rules):
+        field = SNAFT_RULE_TYPES.get(rule.rule_type)
+        if field and getattr(rule, field):
+            if rule.rule_type == 'capability_limit':
+                # Limits as (key, limit) pairs, checked against parameters by lookup
+                rule = rule._replace(capability_limit=tuple(rule.capability_limit.items()))
+            buckets[rule.rule_type].append((rank, rule))
+
+    buckets['intent_block'] = IntentBlockIndex(buckets['intent_block'])
+    return buckets
+
+
 class SNAFTEngine:
     """SNAFT (System Not Authorized For That) firewall engine"""
 
+    # Seconds a loaded rule set is reused before it is read again
+    RULES_TTL_S = 30.0
+
     def __init__(self):
-        self.security_db_config = {
-            'host': os.getenv('SECURITY_DB_HOST', '192.168.4.76'),
-            'port': int(os.getenv('SECURITY_DB_PORT', 5432)),
-            'database': os.getenv('SECURITY_DB_NAME', 'jtel_security'),
-            'user': os.getenv('SECURITY_DB_USER', 'jtel_security_user'),
-            'password': os.getenv('SECURITY_DB_PASSWORD', 'secure_password_here')
-        }
+        self.security_db_config = _DB_CONFIG
+        # (device_type, manufacturer) -> (expires_at, buckets), see invalidate_rules()
+        self._rule_buckets: Dict[Tuple[str, str], Tuple[float, Dict]] = {}
+
+    def invalidate_rules(self):
+        """Drop the loaded rule sets (call after changing snaft_rules)"""
+        self._rule_buckets.clear()
+
+    def _load_rule_buckets(self, device_type: str, manufacturer: str) -> Dict:
+        """
+        Bucketed rules for this device type and manufacturer
+
+        Read and indexed once per RULES_TTL_S (or until invalidate_rules()),
+        so check_snaft only connects to the database to log a violation.
+        """
+        key = (device_type, manufacturer)
+        now = time.monotonic()
+        cached = self._rule_buckets.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        conn = self.get_security_conn()
+        try:
+            cursor = conn.cursor()
+            # Get all SNAFT rules for this device type and manufacturer
+            cursor.execute(f"""
+                SELECT {', '.join(SNAFT_RULE_COLUMNS)} FROM snaft_rules
+                WHERE (device_type = %s OR device_type = 'all')
+                  AND (manufacturer = %s OR manufacturer = 'all')
+                  AND enabled = true
+                ORDER BY {SEVERITY_RANK_SQL} DESC, immutable DESC
+            """, (device_type, manufacturer))
+            buckets = bucket_snaft_rules(SNAFTRule(*row) for row in cursor.fetchall())
+            cursor.close()
+        finally:
+            conn.close()
+
+        self._rule_buckets[key] = (now + self.RULES_TTL_S, buckets)
+        return buckets
 
     def get_security_conn(self):
         """Get connection to security database"""
@@ -65,82 +202,37 @@ class SNAFTEngine:
             - violation_info: Dict with violation details if blocked, None if allowed
         """
         try:
-            conn = self.get_security_conn()
-            cursor = conn.cursor(cursor_factory=RealDictCursor)
-
-            # Get all SNAFT rules for this device type and manufacturer
-            cursor.execute("""
-                SELECT * FROM snaft_rules
-                WHERE (device_type = %s OR device_type = 'all')
-                  AND (manufacturer = %s OR manufacturer = 'all')
-                  AND enabled = true
-                ORDER BY severity DESC, immutable DESC
-            """, (device_type, manufacturer))
-
-            rules = cursor.fetchall()
-
-            for rule in rules:
-                violated = False
-                violation_detail = None
-
-                # Check intent pattern blocking
-                if rule['rule_type'] == 'intent_block' and rule['intent_pattern']:
-                    pattern = rule['intent_pattern']
-                    if re.match(pattern, intent, re.IGNORECASE):
-                        violated = True
-                        violation_detail = f"Intent '{intent}' matches blocked pattern '{pattern}'"
-
-                # Check capability limits
-                elif rule['rule_type'] == 'capability_limit' and rule['capability_limit']:
-                    limits = rule['capability_limit']
-                    if parameters:
-                        # Check each limit against parameters
-                        for param_key, param_value in parameters.items():
-                            if param_key in limits:
-                                limit = limits[param_key]
-                                if isinstance(param_value, (int, float)) and param_value > limit:
-                                    violated = True
-                                    violation_detail = f"Parameter '{param_key}' ({param_value}) exceeds limit ({limit})"
-                                    break
-
-                # Check safety constraints
-                elif rule['rule_type'] == 'safety_constraint' and rule['constraint_check']:
-                    # Evaluate safety constraint (custom logic)
-                    constraint_result = self._evaluate_constraint(
-                        rule['constraint_check'],
-                        intent,
-                        parameters
-                    )
-                    if not constraint_result:
-                        violated = True
-                        violation_detail = f"Failed safety constraint: {rule['constraint_check']}"
-
-                if violated:
-                    # Log SNAFT violation
-                    violation_info = self._log_snaft_violation(
-                        cursor,
-                        did=did,
-                        device_type=device_type,
-                        manufacturer=manufacturer,
-                        intent=intent,
-                        parameters=parameters,
-                        rule_id=rule['id'],
-                        rule_type=rule['rule_type'],
-                        reason=rule['reason'],
-                        severity=rule['severity'],
-                        violation_detail=violation_detail,
-                        immutable=rule['immutable']
-                    )
-
-                    conn.commit()
-                    cursor.close()
-                    conn.close()
-
-                    return False, violation_info
+            buckets = self._load_rule_buckets(device_type, manufacturer)
+            violation = self._find_violation(buckets, intent, parameters)
+
+            if violation:
+                rule, violation_detail = violation
+                conn = self.get_security_conn()
+                cursor = conn.cursor()
+
+                # Log SNAFT violation
+                violation_info = self._log_snaft_violation(
+                    cursor,
+                    did=did,
+                    device_type=device_type,
+                    manufacturer=manufacturer,
+                    intent=intent,
+                    parameters=parameters,
+                    rule_id=rule.id,
+                    rule_type=rule.rule_type,
+                    reason=rule.reason,
+                    severity=rule.severity,
+                    violation_detail=violation_detail,
+                    immutable=rule.immutable
+                )
+
+                conn.commit()
+                cursor.close()
+                conn.close()
+
+                return False, violation_info
 
             # No violations - intent is allowed
-            cursor.close()
-            conn.close()
             return True, None
 
         except Exception as e:
@@ -152,6 +244,58 @@ class SNAFTEngine:
                 'severity': 'critical'
             }
 
+    def _find_violation(
+        self,
+        buckets: Dict,
+        intent: str,
+        parameters: Optional[Dict]
+    ) -> Optional[Tuple[SNAFTRule, str]]:
+        """
+        Walk the rule buckets relevant to this call
+
+        Returns (rule, violation_detail) for the first violated rule in SQL
+        (severity) order across all rule types, None if allowed. Each bucket
+        is only scanned up to the rank of the best violation found so far.
+        """
+        best = None  # (rank, rule, violation_detail)
+
+        # Check intent pattern blocking
+        hit = buckets['intent_block'].match(intent)
+        if hit:
+            rank, rule = hit
+            best = (rank, rule,
+                    f"Intent '{intent}' matches blocked pattern '{rule.intent_pattern}'")
+
+        # Check capability limits (only relevant when parameters are given)
+        if parameters:
+            for rank, rule in buckets['capability_limit']:
+                if best and rank > best[0]:
+                    break
+                violation_detail = self._check_limits(rule, parameters)
+                if violation_detail:
+                    best = (rank, rule, violation_detail)
+                    break
+
+        # Check safety constraints (custom logic)
+        for rank, rule in buckets['safety_constraint']:
+            if best and rank > best[0]:
+                break
+            if not self._evaluate_constraint(rule.constraint_check, intent, parameters):
+                best = (rank, rule, f"Failed safety constraint: {rule.constraint_check}")
+                break
+
+        return best[1:] if best else None
+
+    @staticmethod
+    def _check_limits(rule: SNAFTRule, parameters: Dict) -> Optional[str]:
+        """Violation detail for the first parameter over its limit, None if within limits"""
+        # Iterate the (usually smaller) limits, not the parameters
+        for param_key, limit in rule.capability_limit:
+            param_value = parameters.get(param_key)
+            if isinstance(param_value, (int, float)) and param_value > limit:
+                return f"Parameter '{param_key}' ({param_value}) exceeds limit ({limit})"
+        return None
+
     def _evaluate_constraint(
         self,
         constraint_check: str,
@@ -228,17 +372,17 @@ class SNAFTEngine:
                 flag_type='snaft_violation',
                 severity=severity,
                 description=f"SNAFT violation: {reason}",
-                metadata={
-                    'intent': intent,
-                    'rule_type': rule_type,
-                    'violation_detail': violation_detail,
-                    'immutable': immutable
-                }
+                intent=intent,
+                rule_type=rule_type,
+                violation_detail=violation_detail,
+                immutable=immutable
             )
 
+        violation_id, timestamp = result
+
         return {
-            'violation_id': result['id'],
-            'timestamp': result['timestamp'],
+            'violation_id': violation_id,
+            'timestamp': timestamp,
             'reason': reason,
             'severity': severity,
             'violation_detail': violation_detail,
@@ -271,91 +415,127 @@ class SNAFTEngine:
         flag_type: str,
         severity: str,
         description: str,
-        metadata: Dict
+        intent: str,
+        rule_type: str,
+        violation_detail: str,
+        immutable: bool
     ):
         """Create security flag for SNAFT violation"""
 
+        # Metadata is composed by Postgres, no Python-side JSON encoding
         cursor.execute("""
             INSERT INTO security_flags
             (did, flag_type, severity, description, metadata, raised_at)
-            VALUES (%s, %s, %s, %s, %s, NOW())
+            VALUES (%s, %s, %s, %s, jsonb_build_object(
+                'intent', %s::text,
+                'rule_type', %s::text,
+                'violation_detail', %s::text,
+                'immutable', %s::boolean
+            ), NOW())
         """, (
             did,
             flag_type,
             severity,
             description,
-            psycopg2.extras.Json(metadata)
+            intent,
+            rule_type,
+            violation_detail,
+            immutable
         ))
 
-    def get_snaft_rules(
+    def _stream_rows(self, cursor_name: str, query: str, params: List):
+        """Yield rows as dicts from a server-side cursor, itersize rows per round trip"""
+        conn = self.get_security_conn()
+        try:
+            cursor = conn.cursor(name=cursor_name, cursor_factory=RealDictCursor)
+            cursor.itersize = STREAM_ITERSIZE
+            cursor.execute(query, params)
+            for row in cursor:
+                yield dict(row)
+            cursor.close()
+        finally:
+            conn.close()
+
+    def iter_snaft_rules(
         self,
         device_type: Optional[str] = None,
         manufacturer: Optional[str] = None
-    ) -> List[Dict]:
-        """Get all SNAFT rules (for admin/debugging)"""
+    ) -> Iterator[Dict]:
+        """Stream SNAFT rules without materializing the full result"""
 
-        try:
-            conn = self.get_security_conn()
-            cursor = conn.cursor(cursor_factory=RealDictCursor)
+        query = "SELECT * FROM snaft_rules WHERE enabled = true"
+        params = []
 
-            query = "SELECT * FROM snaft_rules WHERE enabled = true"
-            params = []
+        if device_type:
+            query += " AND device_type = %s"
+            params.append(device_type)
 
-            if device_type:
-                query += " AND device_type = %s"
-                params.append(device_type)
+        if manufacturer:
+            query += " AND manufacturer = %s"
+            params.append(manufacturer)
 
-            if manufacturer:
-                query += " AND manufacturer = %s"
-                params.append(manufacturer)
+        query += f" ORDER BY {SEVERITY_RANK_SQL} DESC, immutable DESC"
 
-            query += " ORDER BY severity DESC, immutable DESC"
+        return self._stream_rows('snaft_rules_stream', query, params)
 
-            cursor.execute(query, params)
-            rules = cursor.fetchall()
-
-            cursor.close()
-            conn.close()
+    def get_snaft_rules(
+        self,
+        device_type: Optional[str] = None,
+        manufacturer: Optional[str] = None
+    ) -> List[Dict]:
+        """Get all SNAFT rules (for admin/debugging)"""
 
-            return [dict(rule) for rule in rules]
+        try:
+            return list(self.iter_snaft_rules(device_type, manufacturer))
 
         except Exception as e:
             logger.error(f"Error fetching SNAFT rules: {e}")
             return []
 
-    def get_snaft_violations(
+    def iter_snaft_violations(
         self,
         did: Optional[str] = None,
-        limit: int = 100
-    ) -> List[Dict]:
-        """Get SNAFT violation history"""
+        limit: int = 100,
+        before: Optional[datetime] = None
+    ) -> Iterator[Dict]:
+        """
+        Stream SNAFT violation history, newest first
 
-        try:
-            conn = self.get_security_conn()
-            cursor = conn.cursor(cursor_factory=RealDictCursor)
+        Pass the timestamp of the last row seen as `before` to fetch the
+        next page (keyset pagination, no OFFSET scan).
+        """
 
-            query = """
-                SELECT sv.*, sr.reason as rule_reason
-                FROM snaft_violations sv
-                LEFT JOIN snaft_rules sr ON sv.rule_id = sr.id
-                WHERE 1=1
-            """
-            params = []
+        query = """
+            SELECT sv.*, sr.reason as rule_reason
+            FROM snaft_violations sv
+            LEFT JOIN snaft_rules sr ON sv.rule_id = sr.id
+            WHERE 1=1
+        """
+        params = []
 
-            if did:
-                query += " AND sv.did = %s"
-                params.append(did)
+        if did:
+            query += " AND sv.did = %s"
+            params.append(did)
 
-            query += " ORDER BY sv.timestamp DESC LIMIT %s"
-            params.append(limit)
+        if before:
+            query += " AND sv.timestamp < %s"
+            params.append(before)
 
-            cursor.execute(query, params)
-            violations = cursor.fetchall()
+        query += " ORDER BY sv.timestamp DESC LIMIT %s"
+        params.append(limit)
 
-            cursor.close()
-            conn.close()
+        return self._stream_rows('snaft_violations_stream', query, params)
 
-            return [dict(v) for v in violations]
+    def get_snaft_violations(
+        self,
+        did: Optional[str] = None,
+        limit: int = 100,
+        before: Optional[datetime] = None
+    ) -> List[Dict]:
+        """Get SNAFT violation history"""
+
+        try:
+            return list(self.iter_snaft_violations(did, limit, before))
 
         except Exception as e:
             logger.error(f"Error fetching SNAFT violations: {e}")
@@ -364,10 +544,13 @@ class SNAFTEngine:
 
 # Singleton instance
 _snaft_engine = None
+_snaft_engine_lock = threading.Lock()
 
 def get_snaft_engine() -> SNAFTEngine:
-    """Get singleton SNAFT engine instance"""
+    """Get singleton SNAFT engine instance (thread-safe)"""
     global _snaft_engine
     if _snaft_engine is None:
-        _snaft_engine = SNAFTEngine()
+        with _snaft_engine_lock:
+            if _snaft_engine is None:
+                _snaft_engine = SNAFTEngine()
     return _snaft_engine
@@ -23,7 +23,7 @@ __philosophy__ = "Kwalisatie niet Kwantisatie"
 from .lazy_loader import LazyGPULoader, ModelLayer, StreamingBuffer
 from .tibet_gpu import TIBETGPUToken, TIBETGPUChain
 from .snaft_gpu import SNAFTGPUFirewall, GPURequest, GPUIntent, SNAFTVerdict
-from .betti_budget import BETTIGPUBudget, GPUBudget, ComputeCost
+from .betti_budget import BETTIGPUBudget, GPUBudget, ComputeCost, Verdict
 
 __all__ = [
     # Lazy Loader
@@ -45,6 +45,7 @@ __all__ = [
     "BETTIGPUBudget",
     "GPUBudget",
     "ComputeCost",
+    "Verdict",
 ]
 
 
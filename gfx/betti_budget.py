@@ -10,10 +10,29 @@ BETTI = Budget Enforcement Through Transparent Intent
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
+import bisect
+import json
 import math
+import sys
+import time
+
+try:
+    import numpy as np
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# __slots__ instead of a per-instance __dict__ where dataclass supports it (3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class BudgetState(Enum):
@@ -24,7 +43,21 @@ class BudgetState(Enum):
     BLOCKED = "blocked"  # Harde limiet bereikt
 
 
-@dataclass
+# State per whole percent: 0-69 GREEN, 70-89 YELLOW, 90-99 ORANGE, 100+ RED
+_STATE_BUCKETS = (
+    (BudgetState.GREEN,) * 70
+    + (BudgetState.YELLOW,) * 20
+    + (BudgetState.ORANGE,) * 10
+    + (BudgetState.RED,)
+)
+
+
+def budget_state(pct: float) -> BudgetState:
+    """Map usage percentage to BudgetState (table lookup, no branch chain)."""
+    return _STATE_BUCKETS[min(int(pct), 100)]
+
+
+@dataclass(**_SLOTS)
 class GPUBudget:
     """Budget voor een actor/service."""
     actor: str
@@ -43,9 +76,30 @@ class GPUBudget:
     
     # Tracking
     last_reset: datetime = field(default_factory=datetime.now)
-    last_request: Optional[datetime] = None
+    last_request_ns: int = 0  # time.monotonic_ns() of last charge, 0 = never
     request_count: int = 0
     
+    # Kepler queue score √(r³)/mass, cached at construction; BETTIGPUBudget
+    # keeps actors sorted by it, so change orbit/mass via register_actor
+    wait_score: float = field(init=False, default=0.0)
+    
+    # Kepler orbit time √(K·r³), set by BETTIGPUBudget.register_actor
+    orbit_time: float = field(init=False, default=0.0)
+    
+    # Fair-share virtual time: decayed compute usage (SLURM-style half-life)
+    vt: float = 0.0
+    
+    def __post_init__(self):
+        self.wait_score = math.sqrt(self.priority_orbit ** 3) / self.mass
+    
+    @property
+    def last_request(self) -> Optional[datetime]:
+        """Wall-clock time of the last charge (None = never), from last_request_ns."""
+        if not self.last_request_ns:
+            return None
+        elapsed_ns = time.monotonic_ns() - self.last_request_ns
+        return datetime.now() - timedelta(microseconds=elapsed_ns // 1000)
+    
     def get_remaining_vram_seconds(self) -> float:
         return max(0, self.daily_vram_seconds - self.used_vram_seconds)
     
@@ -58,17 +112,25 @@ class GPUBudget:
         return max(vram_pct, compute_pct)
     
     def get_state(self) -> BudgetState:
-        pct = self.get_usage_percentage()
-        if pct >= 100:
-            return BudgetState.RED
-        elif pct >= 90:
-            return BudgetState.ORANGE
-        elif pct >= 70:
-            return BudgetState.YELLOW
-        return BudgetState.GREEN
+        return budget_state(self.get_usage_percentage())
 
 
-@dataclass
+class Verdict(Enum):
+    """Budget verdict voor een GPU operatie."""
+    CONTINUE = "continue"
+    DENIED_VRAM = "denied_vram"
+    DENIED_COMPUTE = "denied_compute"
+
+
+# Reason per verdict; deny templates take (nodig, beschikbaar)
+_DENY_REASONS = {
+    Verdict.CONTINUE: "Budget OK",
+    Verdict.DENIED_VRAM: "VRAM budget overschreden: nodig {:.0f}, beschikbaar {:.0f}",
+    Verdict.DENIED_COMPUTE: "Compute budget overschreden: nodig {:.0f}, beschikbaar {:.0f}",
+}
+
+
+@dataclass(**_SLOTS)
 class ComputeCost:
     """Berekende kosten voor een GPU operatie."""
     vram_seconds: float      # VRAM × duration
@@ -76,7 +138,46 @@ class ComputeCost:
     energy_cost: float       # E = m × c² (simplified)
     orbit_time: float        # Kepler T² ∝ r³
     allowed: bool
-    reason: str
+    reason: Optional[str] = None  # Derived from verdict/reason_args when not given
+    verdict: Verdict = Verdict.CONTINUE
+    reason_args: Tuple[float, ...] = ()  # (nodig, beschikbaar) bij denial
+    
+    def __post_init__(self):
+        if self.reason is None:
+            template = _DENY_REASONS[self.verdict]
+            # Only denials carry numbers to format
+            self.reason = template.format(*self.reason_args) if self.reason_args else template
+
+
+def _json_default(obj):
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _cost_kernel(vram_mb, durations, complexities, remaining_vram, remaining_compute,
+                     vram_to_mass, c_light):
+        n = vram_mb.shape[0]
+        out_vs = np.empty(n)
+        out_cu = np.empty(n)
+        out_energy = np.empty(n)
+        out_allowed = np.empty(n, np.bool_)
+        for i in range(n):
+            vs = vram_mb[i] * durations[i]
+            ci = complexities[i] * 10.0
+            if ci > c_light:
+                ci = c_light
+            energy = vram_mb[i] * vram_to_mass * ci * ci
+            cu = energy * durations[i] * 0.001
+            out_vs[i] = vs
+            out_cu[i] = cu
+            out_energy[i] = energy
+            out_allowed[i] = remaining_vram[i] >= vs and remaining_compute[i] >= cu
+        return out_vs, out_cu, out_energy, out_allowed
 
 
 class BETTIGPUBudget:
@@ -97,13 +198,33 @@ class BETTIGPUBudget:
     COMPUTE_SPEED_OF_LIGHT = 100  # Max compute intensity
     KEPLER_CONSTANT = 1.0         # Orbital constant
     
+    # Fair-share: half-life of accumulated usage (vt), decay at most 1×/sec
+    VT_HALF_LIFE_SECONDS = 4 * 3600
+    VT_DECAY_INTERVAL_NS = 1_000_000_000
+    
+    # Batches smaller than this skip the compiled kernel (array packing dominates)
+    BATCH_KERNEL_MIN = 32
+    
     def __init__(self, 
                  total_vram_mb: int = 12000,  # RTX 3060 = 12GB
                  max_concurrent: int = 3):
         self.total_vram = total_vram_mb
         self.max_concurrent = max_concurrent
         self.budgets: Dict[str, GPUBudget] = {}
+        # Actors ordered by (Kepler wait score, registration order), index
+        # rebuilt lazily
+        self._sorted_actors: List[Tuple[float, int, str]] = []
+        self._actor_order: Dict[str, int] = {}
+        self._actor_index: Optional[Dict[str, int]] = None
+        # Actors ordered by fair-share vt, kept sorted on every vt change
+        self._vt_sorted: List[Tuple[float, str]] = []
         self.active_jobs: List[Dict] = []
+        # Pooled dashboard, refreshed per dirty actor (None = full rebuild)
+        self._dashboard: Optional[Dict] = None
+        self._dirty_actors: set = set()
+        # Bumped whenever any actor's vt changes (charge or decay)
+        self.vt_epoch = 0
+        self._last_decay_ns = time.monotonic_ns()
         self.daily_stats = {
             "total_vram_seconds": 0,
             "total_compute_units": 0,
@@ -122,9 +243,109 @@ class BETTIGPUBudget:
             priority_orbit=priority_orbit,
             mass=mass
         )
+        budget.orbit_time = math.sqrt(self.KEPLER_CONSTANT * priority_orbit ** 3)
+        previous = self.budgets.get(actor)
+        if previous is not None:
+            self._sorted_actors.remove((previous.wait_score, self._actor_order[actor], actor))
+            self._vt_sorted.remove((previous.vt, actor))
         self.budgets[actor] = budget
+        # Equal scores keep first-registration order (re-registering keeps the slot)
+        order = self._actor_order.setdefault(actor, len(self._actor_order))
+        bisect.insort(self._sorted_actors, (budget.wait_score, order, actor))
+        bisect.insort(self._vt_sorted, (budget.vt, actor))
+        self._actor_index = None
+        self._dashboard = None  # Queue positions shift for everyone
+        return budget
+    
+    def decay_vt(self):
+        """Apply exponential half-life decay to every actor's vt (≤ 1×/sec)."""
+        now_ns = time.monotonic_ns()
+        elapsed_ns = now_ns - self._last_decay_ns
+        if elapsed_ns < self.VT_DECAY_INTERVAL_NS:
+            return
+        self._last_decay_ns = now_ns
+        
+        factor = 2 ** (-(elapsed_ns / 1e9) / self.VT_HALF_LIFE_SECONDS)
+        for budget in self.budgets.values():
+            budget.vt *= factor
+        # Uniform scaling keeps the order, only the keys change
+        self._vt_sorted = [(vt * factor, actor) for vt, actor in self._vt_sorted]
+        self.vt_epoch += 1
+    
+    def get_vt(self, actor: str) -> float:
+        """Return actor's decayed usage (0.0 for unknown actors)."""
+        budget = self.budgets.get(actor)
+        return budget.vt if budget is not None else 0.0
+    
+    def _add_vt(self, budget: GPUBudget, amount: float):
+        vt_sorted = self._vt_sorted
+        del vt_sorted[bisect.bisect_left(vt_sorted, (budget.vt, budget.actor))]
+        budget.vt += amount
+        bisect.insort(vt_sorted, (budget.vt, budget.actor))
+    
+    def min_vt_actor(self) -> Optional[str]:
+        """Actor met de laagste vt (next in line for fair share), None if empty."""
+        return self._vt_sorted[0][1] if self._vt_sorted else None
+    
+    def get_fair_share_position(self, actor: str) -> int:
+        """1-based rank by vt (lowest usage first), 999 for unknown actors."""
+        budget = self.budgets.get(actor)
+        if budget is None:
+            return 999
+        return bisect.bisect_left(self._vt_sorted, (budget.vt, actor)) + 1
+    
+    def _get_or_register(self, actor: str) -> GPUBudget:
+        budget = self.budgets.get(actor)
+        if budget is None:
+            # Auto-register met default budget
+            budget = self.register_actor(actor)
         return budget
     
+    def _cost_terms(self,
+                    vram_mb: int,
+                    duration_seconds: float,
+                    model_complexity: float) -> Tuple[float, float, float]:
+        """Return (vram_seconds, energy_cost, compute_units)."""
+        # VRAM-seconds (primary metric)
+        vram_seconds = vram_mb * duration_seconds
+        
+        # E = m × c² 
+        # m = model size (VRAM), c = compute intensity (capped at c)
+        compute_intensity = model_complexity * 10
+        if compute_intensity > self.COMPUTE_SPEED_OF_LIGHT:
+            compute_intensity = self.COMPUTE_SPEED_OF_LIGHT
+        energy_cost = vram_mb * self.VRAM_TO_MASS * compute_intensity * compute_intensity
+        
+        # Compute units (energy-based)
+        compute_units = energy_cost * duration_seconds * 0.001
+        
+        return vram_seconds, energy_cost, compute_units
+    
+    @staticmethod
+    def _verdict(budget: GPUBudget, vram_seconds: float, compute_units: float) -> Verdict:
+        if budget.get_remaining_vram_seconds() < vram_seconds:
+            return Verdict.DENIED_VRAM
+        if budget.get_remaining_compute() < compute_units:
+            return Verdict.DENIED_COMPUTE
+        return Verdict.CONTINUE
+    
+    def evaluate_cost(self,
+                      actor: str,
+                      vram_mb: int,
+                      duration_seconds: float,
+                      model_complexity: float = 1.0) -> Tuple[Verdict, float, float]:
+        """
+        Snelle budget check zonder ComputeCost allocatie.
+        
+        Returns:
+            (verdict, vram_seconds, compute_units)
+        """
+        self.decay_vt()
+        budget = self._get_or_register(actor)
+        vram_seconds, _, compute_units = self._cost_terms(
+            vram_mb, duration_seconds, model_complexity)
+        return self._verdict(budget, vram_seconds, compute_units), vram_seconds, compute_units
+    
     def calculate_cost(self, 
                        actor: str,
                        vram_mb: int,
@@ -137,60 +358,70 @@ class BETTIGPUBudget:
         - E = m × c²: Energy scales with model size and compute squared
         - T² ∝ r³: Wait time scales with priority orbit cubed
         """
-        if actor not in self.budgets:
-            # Auto-register met default budget
-            self.register_actor(actor)
-        
-        budget = self.budgets[actor]
-        
-        # VRAM-seconds (primary metric)
-        vram_seconds = vram_mb * duration_seconds
+        self.decay_vt()
+        budget = self._get_or_register(actor)
+        vram_seconds, energy_cost, compute_units = self._cost_terms(
+            vram_mb, duration_seconds, model_complexity)
+        verdict = self._verdict(budget, vram_seconds, compute_units)
         
-        # E = m × c² 
-        # m = model size (VRAM), c = compute intensity
-        mass = vram_mb * self.VRAM_TO_MASS
-        compute_intensity = min(model_complexity * 10, self.COMPUTE_SPEED_OF_LIGHT)
-        energy_cost = mass * (compute_intensity ** 2)
+        reason_args = ()
+        if verdict is Verdict.DENIED_VRAM:
+            reason_args = (vram_seconds, budget.get_remaining_vram_seconds())
+        elif verdict is Verdict.DENIED_COMPUTE:
+            reason_args = (compute_units, budget.get_remaining_compute())
         
-        # Compute units (energy-based)
-        compute_units = energy_cost * duration_seconds / 1000
+        return ComputeCost(
+            vram_seconds=vram_seconds,
+            compute_units=compute_units,
+            energy_cost=energy_cost,
+            orbit_time=budget.orbit_time,  # Kepler T² ∝ r³, cached per actor
+            allowed=verdict is Verdict.CONTINUE,
+            verdict=verdict,
+            reason_args=reason_args
+        )
+    
+    def calculate_costs_batch(self,
+                              actors: List[str],
+                              vram_mb: List[int],
+                              durations: List[float],
+                              complexities: List[float]
+                              ) -> Tuple[List[float], List[float], List[float], List[bool]]:
+        """
+        Bereken kosten voor een batch operaties (zelfde formules als calculate_cost).
         
-        # Kepler's law: T² ∝ r³
-        # Queue priority based on orbit position
-        orbit_time = math.sqrt(self.KEPLER_CONSTANT * (budget.priority_orbit ** 3))
+        Uses the Numba kernel when numba/numpy are installed and the batch is
+        large enough; otherwise a plain loop. Nothing is charged.
         
-        # Check budget
-        can_afford_vram = budget.get_remaining_vram_seconds() >= vram_seconds
-        can_afford_compute = budget.get_remaining_compute() >= compute_units
+        Returns:
+            Parallel lists (vram_seconds, compute_units, energy_cost, allowed)
+        """
+        self.decay_vt()
+        budgets = [self._get_or_register(actor) for actor in actors]
         
-        if not can_afford_vram:
-            return ComputeCost(
-                vram_seconds=vram_seconds,
-                compute_units=compute_units,
-                energy_cost=energy_cost,
-                orbit_time=orbit_time,
-                allowed=False,
-                reason=f"VRAM budget overschreden: nodig {vram_seconds:.0f}, beschikbaar {budget.get_remaining_vram_seconds():.0f}"
+        if HAS_NUMBA and len(budgets) >= self.BATCH_KERNEL_MIN:
+            vs, cu, energy, allowed = _cost_kernel(
+                np.asarray(vram_mb, dtype=np.float64),
+                np.asarray(durations, dtype=np.float64),
+                np.asarray(complexities, dtype=np.float64),
+                np.array([b.get_remaining_vram_seconds() for b in budgets], dtype=np.float64),
+                np.array([b.get_remaining_compute() for b in budgets], dtype=np.float64),
+                float(self.VRAM_TO_MASS),
+                float(self.COMPUTE_SPEED_OF_LIGHT),
             )
+            return vs.tolist(), cu.tolist(), energy.tolist(), allowed.tolist()
         
-        if not can_afford_compute:
-            return ComputeCost(
-                vram_seconds=vram_seconds,
-                compute_units=compute_units,
-                energy_cost=energy_cost,
-                orbit_time=orbit_time,
-                allowed=False,
-                reason=f"Compute budget overschreden: nodig {compute_units:.0f}, beschikbaar {budget.get_remaining_compute():.0f}"
+        out_vs, out_cu, out_energy, out_allowed = [], [], [], []
+        cost_terms = self._cost_terms
+        for budget, mb, duration, complexity in zip(budgets, vram_mb, durations, complexities):
+            vram_seconds, energy_cost, compute_units = cost_terms(mb, duration, complexity)
+            out_vs.append(vram_seconds)
+            out_cu.append(compute_units)
+            out_energy.append(energy_cost)
+            out_allowed.append(
+                budget.get_remaining_vram_seconds() >= vram_seconds
+                and budget.get_remaining_compute() >= compute_units
             )
-        
-        return ComputeCost(
-            vram_seconds=vram_seconds,
-            compute_units=compute_units,
-            energy_cost=energy_cost,
-            orbit_time=orbit_time,
-            allowed=True,
-            reason="Budget OK"
-        )
+        return out_vs, out_cu, out_energy, out_allowed
     
     def charge(self, actor: str, cost: ComputeCost) -> bool:
         """Debit budget voor uitgevoerde operatie."""
@@ -201,7 +432,10 @@ class BETTIGPUBudget:
         budget.used_vram_seconds += cost.vram_seconds
         budget.used_compute_units += cost.compute_units
         budget.request_count += 1
-        budget.last_request = datetime.now()
+        budget.last_request_ns = time.monotonic_ns()
+        self._add_vt(budget, cost.compute_units)
+        self.vt_epoch += 1
+        self._dirty_actors.add(actor)
         
         # Global stats
         self.daily_stats["total_vram_seconds"] += cost.vram_seconds
@@ -210,6 +444,53 @@ class BETTIGPUBudget:
         
         return True
     
+    def charge_many(self, charges: Iterable[Tuple[str, ComputeCost]]) -> int:
+        """
+        Debit een batch operaties in één keer.
+        
+        Aggregates per actor first, then commits each actor and the global
+        stats once. Unknown actors are skipped, like charge().
+        
+        Returns:
+            Number of operations charged
+        """
+        totals: Dict[str, List[float]] = {}  # actor -> [vram_seconds, compute_units, count]
+        for actor, cost in charges:
+            agg = totals.get(actor)
+            if agg is None:
+                if actor not in self.budgets:
+                    continue
+                agg = totals[actor] = [0.0, 0.0, 0]
+            agg[0] += cost.vram_seconds
+            agg[1] += cost.compute_units
+            agg[2] += 1
+        
+        if not totals:
+            return 0
+        
+        now_ns = time.monotonic_ns()
+        total_vram = total_compute = 0.0
+        total_count = 0
+        for actor, (vram_seconds, compute_units, count) in totals.items():
+            budget = self.budgets[actor]
+            budget.used_vram_seconds += vram_seconds
+            budget.used_compute_units += compute_units
+            budget.request_count += count
+            budget.last_request_ns = now_ns
+            self._add_vt(budget, compute_units)
+            self._dirty_actors.add(actor)
+            total_vram += vram_seconds
+            total_compute += compute_units
+            total_count += count
+        self.vt_epoch += 1
+        
+        # Global stats
+        self.daily_stats["total_vram_seconds"] += total_vram
+        self.daily_stats["total_compute_units"] += total_compute
+        self.daily_stats["total_requests"] += total_count
+        
+        return total_count
+    
     def get_queue_position(self, actor: str) -> Tuple[int, float]:
         """
         Bereken queue positie gebaseerd op Kepler orbit.
@@ -220,22 +501,11 @@ class BETTIGPUBudget:
         if actor not in self.budgets:
             return (999, float("inf"))
         
-        budget = self.budgets[actor]
-        
-        # T² ∝ r³ → T = √(r³)
-        base_wait = math.sqrt(budget.priority_orbit ** 3)
+        if self._actor_index is None:
+            self._actor_index = {a: i for i, (_, _, a) in enumerate(self._sorted_actors)}
         
-        # Adjust for mass (heavier = faster in our system, like gravity)
-        wait_adjusted = base_wait / budget.mass
-        
-        # Calculate position among all actors
-        all_waits = [(a, math.sqrt(b.priority_orbit ** 3) / b.mass) 
-                     for a, b in self.budgets.items()]
-        all_waits.sort(key=lambda x: x[1])
-        
-        position = next((i for i, (a, _) in enumerate(all_waits) if a == actor), 999)
-        
-        return (position + 1, wait_adjusted)
+        # T² ∝ r³ → T = √(r³), adjusted for mass (heavier = faster, like gravity)
+        return (self._actor_index[actor] + 1, self.budgets[actor].wait_score)
     
     def reset_daily_budgets(self):
         """Reset alle dagbudgetten (run at midnight)."""
@@ -254,29 +524,64 @@ class BETTIGPUBudget:
             "total_requests": 0,
             "rejected_requests": 0
         }
+        self._dashboard = None
         return archived
     
+    def to_json(self) -> str:
+        """Serialize get_dashboard() (orjson when installed, else stdlib json)."""
+        data = self.get_dashboard()
+        if orjson is not None:
+            return orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(data, indent=2, default=_json_default)
+    
     def get_dashboard(self) -> Dict:
-        """Return budget dashboard voor alle actors."""
-        dashboard = {
-            "total_vram_mb": self.total_vram,
-            "active_jobs": len(self.active_jobs),
-            "daily_stats": self.daily_stats,
-            "actors": {}
-        }
+        """
+        Return budget dashboard voor alle actors.
         
-        for actor, budget in self.budgets.items():
-            pos, wait = self.get_queue_position(actor)
-            dashboard["actors"][actor] = {
-                "state": budget.get_state().value,
-                "usage_pct": round(budget.get_usage_percentage(), 1),
-                "remaining_vram_sec": round(budget.get_remaining_vram_seconds()),
-                "remaining_compute": round(budget.get_remaining_compute()),
-                "queue_position": pos,
-                "orbit_wait_sec": round(wait, 2),
-                "requests_today": budget.request_count
+        The dashboard dict is pooled: only actors charged since the last
+        call are refreshed in place. Treat the result as read-only.
+        """
+        dashboard = self._dashboard
+        if dashboard is None:
+            dashboard = self._dashboard = {
+                "total_vram_mb": self.total_vram,
+                "active_jobs": 0,
+                "daily_stats": self.daily_stats,
+                "actors": {}
             }
+            refresh = [actor for _, _, actor in self._sorted_actors]
+        else:
+            refresh = self._dirty_actors
+        
+        dashboard["active_jobs"] = len(self.active_jobs)
+        
+        # Read each budget's counters once, derive everything from them
+        budgets = self.budgets
+        actors = dashboard["actors"]
+        for actor in refresh:
+            budget = budgets[actor]
+            pos, wait = self.get_queue_position(actor)
+            daily_vram = budget.daily_vram_seconds
+            used_vram = budget.used_vram_seconds
+            daily_compute = budget.daily_compute_units
+            used_compute = budget.used_compute_units
+            
+            vram_pct = used_vram / daily_vram * 100
+            compute_pct = used_compute / daily_compute * 100
+            pct = vram_pct if vram_pct > compute_pct else compute_pct
+            
+            entry = actors.get(actor)
+            if entry is None:
+                entry = actors[actor] = {}
+            entry["state"] = budget_state(pct).value
+            entry["usage_pct"] = round(pct, 1)
+            entry["remaining_vram_sec"] = round(max(0, daily_vram - used_vram))
+            entry["remaining_compute"] = round(max(0, daily_compute - used_compute))
+            entry["queue_position"] = pos
+            entry["orbit_wait_sec"] = round(wait, 2)
+            entry["requests_today"] = budget.request_count
         
+        self._dirty_actors.clear()
         return dashboard
 
 
@@ -309,5 +614,4 @@ if __name__ == "__main__":
     
     # Dashboard
     print(f"\n=== Dashboard ===")
-    import json
-    print(json.dumps(betti.get_dashboard(), indent=2))
+    print(betti.to_json())
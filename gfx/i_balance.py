@@ -12,11 +12,25 @@ GPU nodes communiceren via I-Poll:
 "Je hoeft niet één 4090 te kopen als je 4x 3060 hebt" - Jasper
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
 from datetime import datetime
 from enum import Enum
+import heapq
 import json
+import sys
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# __slots__ instead of a per-instance __dict__ where dataclass supports it (3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+if TYPE_CHECKING:
+    from .betti_budget import BETTIGPUBudget
 
 
 class GPUNodeStatus(Enum):
@@ -26,9 +40,89 @@ class GPUNodeStatus(Enum):
     OFFLINE = "offline"       # Niet bereikbaar
 
 
-@dataclass
-class GPUNode:
-    """Een GPU node in het netwerk."""
+# Well-known capability tokens, interned so set lookups hit on identity
+KNOWN_CAPABILITIES = tuple(sys.intern(c) for c in (
+    "security", "transcription", "inference", "heavy", "embedding", "70b-staging"
+))
+HEAVY = sys.intern("heavy")
+_NO_NAMES: FrozenSet[str] = frozenset()  # Shared immutable default for GPUNode sets
+
+# One bit per capability; unknown capabilities get the next free bit on first use
+CAP_BITS: Dict[str, int] = {c: 1 << i for i, c in enumerate(KNOWN_CAPABILITIES)}
+
+
+def capability_mask(capabilities) -> int:
+    """OR the CAP_BITS of all capabilities, assigning bits to new ones."""
+    mask = 0
+    for cap in capabilities:
+        bit = CAP_BITS.get(cap)
+        if bit is None:
+            bit = CAP_BITS[sys.intern(cap)] = 1 << len(CAP_BITS)
+        mask |= bit
+    return mask
+
+# Mutable node state packed into one int: status(4) | current_tasks(12) | vram_used_mb(24).
+# A heartbeat computes the whole word and stores it with a single assignment,
+# so route() never observes a half-updated node.
+_VRAM_MASK = (1 << 24) - 1
+_TASKS_SHIFT = 24
+_TASKS_MASK = (1 << 12) - 1
+_STATUS_SHIFT = 36
+_STATUSES = tuple(GPUNodeStatus)
+_STATUS_INDEX = {s: i for i, s in enumerate(_STATUSES)}
+_OFFLINE_INDEX = _STATUS_INDEX[GPUNodeStatus.OFFLINE]
+# Bit per status index: statuses that take new tasks
+_READY_STATUSES = (
+    1 << _STATUS_INDEX[GPUNodeStatus.IDLE]
+    | 1 << _STATUS_INDEX[GPUNodeStatus.BUSY]
+)
+
+
+def pack_node_state(status: GPUNodeStatus, current_tasks: int, vram_used_mb: int) -> int:
+    """
+    Pack status/tasks/vram into one int.
+    
+    Heartbeat values outside a field's range are clamped into it, as the
+    GPUNode fields keep the exact values.
+    """
+    current_tasks = min(max(int(current_tasks), 0), _TASKS_MASK)
+    vram_used_mb = min(max(int(vram_used_mb), 0), _VRAM_MASK)
+    return (
+        _STATUS_INDEX[status] << _STATUS_SHIFT
+        | current_tasks << _TASKS_SHIFT
+        | vram_used_mb
+    )
+
+
+# GPUNode fields mirrored in the packed _state word
+_STATE_FIELDS = frozenset({"status", "current_tasks", "vram_used_mb"})
+# GPUNode name sets, stored as interned frozensets
+_NAME_SET_FIELDS = frozenset({"capabilities", "warm_models"})
+# GPUNode stats that route() and get_cluster_status() never read
+_STATS_FIELDS = frozenset({"last_heartbeat_ns", "tasks_completed", "avg_latency_ms"})
+
+
+def _name_set(names) -> FrozenSet[str]:
+    """Interned frozenset of names; empty input keeps the shared default."""
+    if not names:
+        return _NO_NAMES
+    return frozenset(sys.intern(n) for n in names)
+
+
+class _NodeSlots:
+    """Internal GPUNode slots, kept out of the dataclass fields (repr/asdict)."""
+    __slots__ = ("_state", "cap_mask", "_owner")
+
+
+@dataclass(**_SLOTS)
+class GPUNode(_NodeSlots):
+    """
+    Een GPU node in het netwerk.
+    
+    capabilities and warm_models are frozensets: any iterable is accepted
+    and converted on assignment (which also recomputes cap_mask), but they
+    cannot be changed in place - reassign instead of calling .append/.add.
+    """
     name: str
     host: str
     port: int = 11434
@@ -38,45 +132,114 @@ class GPUNode:
     vram_mb: int = 0
     ram_mb: int = 0
     
-    # Current state
+    # Current state (also packed into _state, which route() reads)
     status: GPUNodeStatus = GPUNodeStatus.OFFLINE
     vram_used_mb: int = 0
     current_tasks: int = 0
     
-    # Capabilities
-    capabilities: List[str] = field(default_factory=list)
-    warm_models: List[str] = field(default_factory=list)
+    # Capabilities (any iterable; stored as interned frozensets)
+    capabilities: FrozenSet[str] = _NO_NAMES
+    warm_models: FrozenSet[str] = _NO_NAMES
     
     # I-Poll address
     ipoll_actor: str = ""
     
     # Stats
-    last_heartbeat: Optional[datetime] = None
+    last_heartbeat_ns: int = 0  # time.monotonic_ns() of last heartbeat, 0 = never
     tasks_completed: int = 0
     avg_latency_ms: float = 0
     
+    def __post_init__(self):
+        self._state = pack_node_state(self.status, self.current_tasks, self.vram_used_mb)
+        self._owner = None  # IBalance this node is registered with
+    
+    def __setattr__(self, name, value):
+        if name in _NAME_SET_FIELDS:
+            value = _name_set(value)
+            if name == "capabilities":
+                object.__setattr__(self, "cap_mask", capability_mask(value))
+        
+        # Keep _state in step with single-field writes (after __init__ set it up)
+        if name in _STATE_FIELDS and hasattr(self, "_state"):
+            state = {
+                "status": self.status,
+                "current_tasks": self.current_tasks,
+                "vram_used_mb": self.vram_used_mb,
+            }
+            state[name] = value
+            packed = pack_node_state(**state)
+            object.__setattr__(self, name, value)
+            object.__setattr__(self, "_state", packed)
+        else:
+            object.__setattr__(self, name, value)
+        
+        # Direct writes on a registered node invalidate its balancer's routes
+        if name[0] != "_" and name not in _STATS_FIELDS:
+            owner = getattr(self, "_owner", None)
+            if owner is not None:
+                owner._node_changed(self)
+    
+    def set_state(self, status: GPUNodeStatus, current_tasks: int, vram_used_mb: int) -> None:
+        """
+        Set status, tasks and vram together (from a heartbeat).
+        
+        _state is stored last, in a single assignment: route() sees either
+        the old or the new state, never a mix.
+        """
+        packed = pack_node_state(status, current_tasks, vram_used_mb)
+        object.__setattr__(self, "status", status)
+        object.__setattr__(self, "current_tasks", current_tasks)
+        object.__setattr__(self, "vram_used_mb", vram_used_mb)
+        object.__setattr__(self, "_state", packed)
+        if self._owner is not None:
+            self._owner._node_changed(self)
+    
     def load_factor(self) -> float:
         """Return load factor 0.0-1.0."""
         if self.vram_mb == 0:
             return 1.0
         return self.vram_used_mb / self.vram_mb
     
+    @property
+    def online(self) -> bool:
+        return self._state >> _STATUS_SHIFT != _OFFLINE_INDEX
+    
+    @property
+    def ready(self) -> bool:
+        """IDLE or BUSY: takes new tasks (not OVERLOADED/OFFLINE)."""
+        return (_READY_STATUSES >> (self._state >> _STATUS_SHIFT)) & 1 == 1
+    
     def can_accept(self, vram_needed: int) -> bool:
         """Kan deze node de taak accepteren?"""
-        if self.status in [GPUNodeStatus.OVERLOADED, GPUNodeStatus.OFFLINE]:
-            return False
-        return (self.vram_mb - self.vram_used_mb) >= vram_needed
+        return self.ready and (self.vram_mb - (self._state & _VRAM_MASK)) >= vram_needed
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class BalanceDecision:
-    """I-Balance routing beslissing."""
+    """I-Balance routing beslissing (immutable, gedeeld via de route cache)."""
     target_node: str
     reason: str
     estimated_wait_ms: float
     fallback_node: Optional[str] = None
 
 
+class _Candidate(NamedTuple):
+    """Route candidate (positional tuple, no per-node dict)."""
+    name: str
+    node: GPUNode
+    load: float
+    can_accept: bool
+    model_warm: bool
+
+
+def _json_default(obj):
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
 class IBalance:
     """
     I-Balance: Software SLI via I-Poll.
@@ -92,12 +255,33 @@ class IBalance:
     - BALANCE_ACCEPT: Node accepteert taak
     - BALANCE_HEARTBEAT: Status update
     - BALANCE_OFFLOAD: Stuur taak naar andere node
+    
+    Met een BETTIGPUBudget gekoppeld worden nodes met gelijke load
+    gekozen op laagste fair-share vt van hun ipoll_actor.
     """
     
-    def __init__(self):
+    def __init__(self, budget: Optional["BETTIGPUBudget"] = None):
         self.nodes: Dict[str, GPUNode] = {}
+        self.budget = budget
         self.routing_history: List[Dict] = []
         
+        # Route decisions per (task_type, vram_needed, preferred_model), valid
+        # until the next cluster state change (epoch bump) or budget vt_epoch
+        self._cluster_epoch = 0
+        self._route_cache: Dict[Tuple, BalanceDecision] = {}
+        self._route_vt_epoch = 0
+        
+        # Min-heap of (load, registration_order, version, name). Heartbeats
+        # push a fresh entry; entries with an outdated version are dropped
+        # lazily when popped.
+        self._load_heap: List[Tuple[float, int, int, str]] = []
+        self._heap_version: Dict[str, int] = {}
+        self._node_order: Dict[str, int] = {}
+        
+        # Pooled per-node status entries, refreshed only for dirty nodes
+        self._node_status: Dict[str, Dict] = {}
+        self._dirty_nodes: Dict[str, None] = {}  # Ordered set
+        
         # Pre-configure known nodes
         self._init_known_nodes()
     
@@ -136,9 +320,68 @@ class IBalance:
         #     ...
         # ))
     
+    def _bump_epoch(self):
+        """Cluster state changed: invalidate cached route decisions."""
+        self._cluster_epoch += 1
+        self._route_cache.clear()
+    
+    def _push_load(self, node: GPUNode):
+        """Record the node's current load in the load heap."""
+        version = self._heap_version.get(node.name, 0) + 1
+        self._heap_version[node.name] = version
+        heapq.heappush(self._load_heap, (
+            node.load_factor(), self._node_order[node.name], version, node.name
+        ))
+        
+        # Compact once stale entries dominate
+        if len(self._load_heap) > 4 * len(self.nodes) + 16:
+            self._load_heap = [
+                e for e in self._load_heap if self._heap_version[e[3]] == e[2]
+            ]
+            heapq.heapify(self._load_heap)
+    
+    def _pop_tie_group(self, popped: List[Tuple]) -> List[Tuple[float, str]]:
+        """
+        Pop all live heap entries sharing the lowest load.
+        
+        Live entries are recorded in `popped` for the caller to push back;
+        stale ones are dropped. Ties are ordered by fair-share vt when a
+        budget is attached (stable, so registration order breaks vt ties).
+        """
+        heap = self._load_heap
+        group = []
+        while heap:
+            load, _, version, name = heap[0]
+            if self._heap_version.get(name) != version:
+                heapq.heappop(heap)  # Stale entry, superseded by a later heartbeat
+                continue
+            if group and load != group[0][0]:
+                break
+            popped.append(heapq.heappop(heap))
+            group.append((load, name))
+        
+        if len(group) > 1 and self.budget is not None:
+            get_vt = self.budget.get_vt
+            nodes = self.nodes
+            group.sort(key=lambda entry: get_vt(nodes[entry[1]].ipoll_actor))
+        return group
+    
+    def _node_changed(self, node: GPUNode):
+        """A registered node changed state: refresh its load, status entry and routes."""
+        if self.nodes.get(node.name) is not node:
+            return
+        self._push_load(node)
+        self._dirty_nodes[node.name] = None
+        self._bump_epoch()
+    
     def register_node(self, node: GPUNode):
         """Register GPU node."""
         self.nodes[node.name] = node
+        self._node_order.setdefault(node.name, len(self._node_order))
+        self._push_load(node)
+        self._dirty_nodes[node.name] = None
+        self._bump_epoch()
+        node._owner = self
     
     def update_status(self, node_name: str, status: Dict):
         """Update node status (from I-Poll heartbeat)."""
@@ -146,18 +389,19 @@ class IBalance:
             return
         
         node = self.nodes[node_name]
-        node.vram_used_mb = status.get("vram_used_mb", 0)
-        node.current_tasks = status.get("current_tasks", 0)
-        node.last_heartbeat = datetime.now()
+        vram_used_mb = status.get("vram_used_mb", 0)
         
         # Determine status
-        load = node.load_factor()
+        load = vram_used_mb / node.vram_mb if node.vram_mb else 1.0
         if load > 0.9:
-            node.status = GPUNodeStatus.OVERLOADED
+            new_status = GPUNodeStatus.OVERLOADED
         elif load > 0.5:
-            node.status = GPUNodeStatus.BUSY
+            new_status = GPUNodeStatus.BUSY
         else:
-            node.status = GPUNodeStatus.IDLE
+            new_status = GPUNodeStatus.IDLE
+        
+        node.last_heartbeat_ns = time.monotonic_ns()
+        node.set_state(new_status, status.get("current_tasks", 0), vram_used_mb)
     
     def route(self, 
               task_type: str,
@@ -170,29 +414,79 @@ class IBalance:
         1. Als preferred_model warm is ergens -> die node
         2. Anders: laagste load die capability heeft
         3. Fallback: queue op drukste node
+        
+        Decisions are memoized until the cluster state (a heartbeat,
+        registration or direct GPUNode field write, or with a budget
+        attached any fair-share vt) changes.
         """
-        candidates = []
+        if self.budget is not None:
+            self.budget.decay_vt()
+            # Fair-share vts moved: every cached decision may be stale
+            if self.budget.vt_epoch != self._route_vt_epoch:
+                self._route_vt_epoch = self.budget.vt_epoch
+                self._route_cache.clear()
         
-        for name, node in self.nodes.items():
-            if node.status == GPUNodeStatus.OFFLINE:
-                continue
-            
-            # Check capability
-            if task_type not in node.capabilities and "heavy" not in node.capabilities:
-                continue
-            
-            # Check warm model preference
-            model_warm = preferred_model in node.warm_models if preferred_model else False
-            
-            candidates.append({
-                "name": name,
-                "node": node,
-                "load": node.load_factor(),
-                "can_accept": node.can_accept(vram_needed),
-                "model_warm": model_warm
-            })
+        key = (task_type, vram_needed, preferred_model)
+        decision = self._route_cache.get(key)
+        if decision is None:
+            decision = self._select_node(task_type, vram_needed, preferred_model)
+            self._route_cache[key] = decision
+        return decision
+    
+    def _select_node(self,
+                     task_type: str,
+                     vram_needed: int,
+                     preferred_model: Optional[str]) -> BalanceDecision:
+        """
+        Run the routing strategy against the current cluster state.
+        
+        Nodes are visited in load order from the load heap in one pass
+        (equal loads by fair-share vt), tracking the best warm, accepting
+        and overall candidate, and stopping once the decision is settled.
+        """
+        best_warm = best_accept = best_any = runner_up = None
+        popped = []
+        task_mask = CAP_BITS.get(task_type, 0) | CAP_BITS[HEAVY]
+        settled = False
         
-        if not candidates:
+        try:
+            while not settled:
+                group = self._pop_tie_group(popped)
+                if not group:
+                    break
+                
+                for load, name in group:
+                    node = self.nodes[name]
+                    # Capability (or heavy) and online, as two int tests
+                    if not node.cap_mask & task_mask or not node.online:
+                        continue
+                    
+                    # Check warm model preference
+                    model_warm = preferred_model in node.warm_models if preferred_model else False
+                    
+                    c = _Candidate(name, node, load, node.can_accept(vram_needed), model_warm)
+                    
+                    # Visiting in (load, vt) order: the first hit in each class is its best
+                    if best_any is None:
+                        best_any = c
+                    elif runner_up is None:
+                        runner_up = c
+                    if c.can_accept and best_accept is None:
+                        best_accept = c
+                    if model_warm:
+                        best_warm = c
+                        settled = True  # Lowest-load warm node wins outright
+                        break
+                    
+                    # Without a model preference: accepting node plus a fallback
+                    if not preferred_model and best_accept and runner_up:
+                        settled = True
+                        break
+        finally:
+            for entry in popped:
+                heapq.heappush(self._load_heap, entry)
+        
+        if best_any is None:
             return BalanceDecision(
                 target_node="",
                 reason="Geen beschikbare GPU nodes",
@@ -200,32 +494,28 @@ class IBalance:
             )
         
         # Prioritize warm models
-        warm_candidates = [c for c in candidates if c["model_warm"]]
-        if warm_candidates:
-            best = min(warm_candidates, key=lambda x: x["load"])
+        if best_warm:
             return BalanceDecision(
-                target_node=best["name"],
-                reason=f"Model '{preferred_model}' is warm op {best['name']}",
-                estimated_wait_ms=best["load"] * 1000
+                target_node=best_warm.name,
+                reason=f"Model '{preferred_model}' is warm op {best_warm.name}",
+                estimated_wait_ms=best_warm.load * 1000
             )
         
         # Otherwise lowest load that can accept
-        accepting = [c for c in candidates if c["can_accept"]]
-        if accepting:
-            best = min(accepting, key=lambda x: x["load"])
+        if best_accept:
+            fallback = runner_up if best_accept is best_any else best_any
             return BalanceDecision(
-                target_node=best["name"],
-                reason=f"Laagste load ({best['load']:.1%}) met capaciteit",
-                estimated_wait_ms=best["load"] * 500,
-                fallback_node=candidates[0]["name"] if len(candidates) > 1 else None
+                target_node=best_accept.name,
+                reason=f"Laagste load ({best_accept.load:.1%}) met capaciteit",
+                estimated_wait_ms=best_accept.load * 500,
+                fallback_node=fallback.name if fallback else None
             )
         
         # Queue on least loaded
-        best = min(candidates, key=lambda x: x["load"])
         return BalanceDecision(
-            target_node=best["name"],
-            reason=f"Alle nodes druk, queue op {best['name']}",
-            estimated_wait_ms=(best["load"] + 0.5) * 2000
+            target_node=best_any.name,
+            reason=f"Alle nodes druk, queue op {best_any.name}",
+            estimated_wait_ms=(best_any.load + 0.5) * 2000
         )
     
     def create_ipoll_message(self, msg_type: str, content: Dict) -> Dict:
@@ -238,30 +528,51 @@ class IBalance:
             "version": "0.1.0"
         }
     
+    def to_json(self) -> str:
+        """Serialize get_cluster_status() (orjson when installed, else stdlib json)."""
+        data = self.get_cluster_status()
+        if orjson is not None:
+            return orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(data, indent=2, default=_json_default)
+    
     def get_cluster_status(self) -> Dict:
-        """Return cluster-wide GPU status."""
-        total_vram = sum(n.vram_mb for n in self.nodes.values())
-        used_vram = sum(n.vram_used_mb for n in self.nodes.values())
+        """
+        Return cluster-wide GPU status.
+        
+        Per-node entries are pooled and only rebuilt for nodes that were
+        registered or sent a heartbeat since the last call.
+        """
+        total_vram = 0
+        used_vram = 0
+        nodes_online = 0
+        
+        for node in self.nodes.values():
+            total_vram += node.vram_mb
+            used_vram += node.vram_used_mb
+            if node.online:
+                nodes_online += 1
+        
+        node_status = self._node_status
+        for name in self._dirty_nodes:
+            node = self.nodes[name]
+            node_status[name] = {
+                "gpu": node.gpu_model,
+                "status": node.status.value,
+                "load": f"{node.load_factor():.1%}",
+                "vram": f"{node.vram_used_mb}/{node.vram_mb}MB",
+                "warm_models": sorted(node.warm_models),
+                "capabilities": sorted(node.capabilities)
+            }
+        self._dirty_nodes.clear()
         
         return {
             "cluster": {
                 "total_vram_gb": round(total_vram / 1024, 1),
                 "used_vram_gb": round(used_vram / 1024, 1),
                 "utilization": round((used_vram / total_vram * 100) if total_vram > 0 else 0, 1),
-                "nodes_online": sum(1 for n in self.nodes.values() 
-                                    if n.status != GPUNodeStatus.OFFLINE)
+                "nodes_online": nodes_online
             },
-            "nodes": {
-                name: {
-                    "gpu": node.gpu_model,
-                    "status": node.status.value,
-                    "load": f"{node.load_factor():.1%}",
-                    "vram": f"{node.vram_used_mb}/{node.vram_mb}MB",
-                    "warm_models": node.warm_models,
-                    "capabilities": node.capabilities
-                }
-                for name, node in self.nodes.items()
-            }
+            "nodes": node_status
         }
 
 
@@ -278,8 +589,7 @@ if __name__ == "__main__":
     
     # Cluster status
     print("Cluster Status:")
-    import json
-    print(json.dumps(balance.get_cluster_status(), indent=2))
+    print(balance.to_json())
     
     # Route decisions
     print("\n--- Routing Tests ---")
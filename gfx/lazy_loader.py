@@ -10,45 +10,123 @@ Quad-channel RAM als staging area voor GPU streaming.
 Jasper's visie: Kwalisatie niet kwantisatie!
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Tuple
 from enum import Enum
 from datetime import datetime
+import asyncio
+import json
+import sys
 import threading
 import time
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# __slots__ instead of a per-instance __dict__ where dataclass supports it (3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class LayerState(Enum):
     DISK = "disk"          # Op NVMe, niet geladen
     RAM_STAGING = "ram"    # In RAM staging buffer
+    RAM_REGISTERED = "registered"  # Bronbuffer in-place gepind, transfer zonder staging
     GPU_LOADING = "loading" # Bezig met GPU transfer
     GPU_READY = "ready"     # In VRAM, klaar voor inference
     GPU_ACTIVE = "active"   # Actief in gebruik
     EVICTING = "evicting"   # Wordt verwijderd uit VRAM
 
 
-@dataclass
+def _to_ns(value: datetime) -> int:
+    return int(value.timestamp() * 1e9)
+
+
+_VRAM_STATES = frozenset({LayerState.GPU_READY, LayerState.GPU_ACTIVE})
+_COMPLETION_TYPES = frozenset({"attention", "lm_head", "embedding"})
+
+
+@dataclass(init=False, **_SLOTS)
 class ModelLayer:
-    """Een laag van een model (attention, FFN, embedding, etc)."""
+    """
+    Een laag van een model (attention, FFN, embedding, etc).
+    
+    Use is stamped as time.time_ns() in last_used_ns; last_used is
+    materialized as a (naive, local) datetime on access.
+    """
     name: str
     size_mb: float
     layer_type: str  # "attention", "ffn", "embedding", "lm_head"
-    state: LayerState = LayerState.DISK
-    priority: int = 5  # 1=highest, 10=lowest
-    last_used: Optional[datetime] = None
-    load_time_ms: float = 0
+    state: LayerState
+    priority: int  # 1=highest, 10=lowest
+    last_used_ns: int  # time.time_ns() of last load/hit, 0 = never
+    load_time_ms: float
+    touch_seq: int      # Loader-wide use counter at last load/hit (higher = more recent)
+    loaded_at: float    # time.time() when last loaded into VRAM
+    source: Any = field(repr=False)  # Host weights (e.g. mmap'd ndarray), if known
+    
+    def __init__(self,
+                 name: str,
+                 size_mb: float,
+                 layer_type: str,
+                 state: LayerState = LayerState.DISK,
+                 priority: int = 5,
+                 last_used: Optional[datetime] = None,
+                 load_time_ms: float = 0,
+                 *,
+                 last_used_ns: int = 0,
+                 touch_seq: int = 0,
+                 loaded_at: float = 0,
+                 source: Any = None):
+        self.name = name
+        self.size_mb = size_mb
+        self.layer_type = layer_type
+        self.state = state
+        self.priority = priority
+        self.last_used_ns = last_used_ns if last_used is None else _to_ns(last_used)
+        self.load_time_ms = load_time_ms
+        self.touch_seq = touch_seq
+        self.loaded_at = loaded_at
+        self.source = source
+    
+    @property
+    def last_used(self) -> Optional[datetime]:
+        ns = self.last_used_ns
+        return datetime.fromtimestamp(ns / 1e9) if ns else None
+    
+    @last_used.setter
+    def last_used(self, value: Optional[datetime]):
+        self.last_used_ns = 0 if value is None else _to_ns(value)
     
     def is_in_vram(self) -> bool:
-        return self.state in [LayerState.GPU_READY, LayerState.GPU_ACTIVE]
+        return self.state in _VRAM_STATES
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class StreamingBuffer:
     """Quad-channel RAM buffer voor GPU streaming."""
     channel_count: int = 4
     channel_size_mb: int = 16000  # 64GB / 4 = 16GB per channel
     used_per_channel: List[float] = field(default_factory=lambda: [0, 0, 0, 0])
     
+    # Optional in-place pinning hooks (e.g. cudaHostRegister/cudaHostUnregister).
+    # host_register returns a handle, or None when the buffer can't be pinned
+    # (not page-aligned, ...) so the layer goes through a staging channel.
+    host_register: Optional[Callable[[Any], Any]] = field(default=None, repr=False)
+    host_unregister: Optional[Callable[[Any], None]] = field(default=None, repr=False)
+    
+    def register_inplace(self, buf: Any) -> Any:
+        """Pin caller-provided buffer in place; None = use staging."""
+        if self.host_register is None or buf is None:
+            return None
+        return self.host_register(buf)
+    
+    def unregister(self, handle: Any):
+        if handle is not None and self.host_unregister is not None:
+            self.host_unregister(handle)
+    
     def get_free_channel(self) -> Optional[int]:
         """Vind vrij kanaal voor streaming."""
         for i, used in enumerate(self.used_per_channel):
@@ -63,6 +141,11 @@ class StreamingBuffer:
         return self.channel_count * self.channel_size_mb
 
 
+def simulated_transfer(layer: ModelLayer, channel: Optional[int]) -> None:
+    """Default transfer_fn: block for the simulated PCIe time (~5GB/s)."""
+    time.sleep(layer.size_mb / 5000)
+
+
 class LazyGPULoader:
     """
     Lazy GPU Loader - Layer-by-layer intelligent loading.
@@ -80,19 +163,52 @@ class LazyGPULoader:
     CPU <RAM<>RAM<>RAM<>RAM> GPU
     
     Elke RAM channel kan parallel streamen naar GPU!
+    
+    transfer_fn(layer, channel) does the actual host-to-device copy for one
+    layer on one RAM channel (e.g. cudaMemcpyAsync on that channel's stream
+    plus a stream sync) and blocks until it is done. load_layer_async runs
+    it in a worker thread, so transfers on different channels overlap.
+    A layer in state RAM_REGISTERED has its source pinned in place and is
+    copied straight from it (channel is None).
     """
     
+    PCIE_MB_PER_S = 2000  # Estimate: ~2GB/s PCIe transfer
+    STATUS_TTL_S = 0.1    # get_vram_status memo lifetime (dropped on load/evict)
+    
     def __init__(self,
                  gpu_vram_mb: int = 12000,
                  ram_buffer: Optional[StreamingBuffer] = None,
-                 prefetch_next_n: int = 2):
+                 prefetch_next_n: int = 2,
+                 transfer_fn: Optional[Callable[[ModelLayer, Optional[int]], None]] = None):
         self.gpu_vram_mb = gpu_vram_mb
         self.ram_buffer = ram_buffer or StreamingBuffer()
         self.prefetch_n = prefetch_next_n
+        self.transfer_fn = transfer_fn or simulated_transfer
         
         self.models: Dict[str, List[ModelLayer]] = {}
+        # Per model: layer name -> layer, and layer_type -> layers in registration order
+        self._layer_index: Dict[str, Dict[str, ModelLayer]] = {}
+        # Per model: layer_type -> total size_mb (fixed after register_model)
+        self._type_sizes: Dict[str, Dict[str, float]] = {}
+        self._by_type: Dict[str, Dict[str, List[ModelLayer]]] = {}
         self.vram_used: float = 0
-        self.load_queue: List[ModelLayer] = []
+        # Layers in VRAM keyed by (model, layer), oldest use first
+        self._resident: "OrderedDict[Tuple[str, str], ModelLayer]" = OrderedDict()
+        self._touch_counter: int = 0
+        # (include_layers, iso_times) -> (expires_at, status)
+        self._status_cache: Dict[Tuple[bool, bool], Tuple[float, Dict]] = {}
+        # Async transfers in flight, so concurrent callers share one copy
+        self._loading: Dict[Tuple[str, str], "asyncio.Future"] = {}
+        self.load_queue: List[ModelLayer] = []  # Prefetch requests when no prefetcher runs
+        
+        # Background prefetcher (start_prefetcher): bounded queue, one consumer
+        self._prefetch_q: Optional["asyncio.Queue"] = None
+        self._prefetch_task: Optional["asyncio.Task"] = None
+        self._prefetch_inflight_mb: float = 0
+        self._prefetch_keys: set = set()
+        
+        # Layers expected by the next call per model (set_next_hint)
+        self._next_hint: Dict[str, List[ModelLayer]] = {}
         self.eviction_lock = threading.Lock()
         
         # Stats
@@ -120,11 +236,25 @@ class LazyGPULoader:
                 name=layer["name"],
                 size_mb=layer["size_mb"],
                 layer_type=layer.get("type", "unknown"),
-                priority=i + 1  # Earlier layers = higher priority
+                priority=i + 1,  # Earlier layers = higher priority
+                source=layer.get("source")
             ))
         self.models[model_name] = model_layers
+        by_type: Dict[str, List[ModelLayer]] = {}
+        type_sizes: Dict[str, float] = {}
+        for layer in model_layers:
+            by_type.setdefault(layer.layer_type, []).append(layer)
+            type_sizes[layer.layer_type] = type_sizes.get(layer.layer_type, 0) + layer.size_mb
+        self._by_type[model_name] = by_type
+        self._type_sizes[model_name] = type_sizes
+        self._layer_index[model_name] = {layer.name: layer for layer in model_layers}
         return True
     
+    def set_next_hint(self, model_name: str, layer_names: List[str]):
+        """Hint welke layers de volgende call nodig heeft (merged into the inference load_plan)."""
+        index = self._layer_index.get(model_name, {})
+        self._next_hint[model_name] = [index[n] for n in dict.fromkeys(layer_names) if n in index]
+    
     def prepare_for_intent(self, model_name: str, intent: str) -> Dict:
         """
         Bereid model voor op basis van intent.
@@ -133,30 +263,39 @@ class LazyGPULoader:
         - "inference": All layers sequentially
         - "embedding": Only embedding layer
         - "completion": Focus on attention + lm_head
+        
+        result["load_plan"] lists the layer names to load, in order. Unloaded
+        layers (plus, for inference, the next-call hint) are ranked by
+        size_mb / priority, so large early layers go first. The plan is then
+        cut at the first layer that no longer fits next to the needed layers
+        already in VRAM, so no transfer starts that can't be used.
         """
         if model_name not in self.models:
             return {"error": f"Model '{model_name}' niet geregistreerd"}
         
         layers = self.models[model_name]
+        type_sizes = self._type_sizes[model_name]
         layers_needed = []
         
         if intent == "embedding":
             # Alleen embedding layer
-            layers_needed = [l for l in layers if l.layer_type == "embedding"]
+            layers_needed = self._by_type[model_name].get("embedding", [])
+            total_size_mb = type_sizes.get("embedding", 0)
         elif intent == "completion":
             # Attention en lm_head prioriteit
-            layers_needed = [l for l in layers 
-                           if l.layer_type in ["attention", "lm_head", "embedding"]]
+            layers_needed = [layer for layer in layers if layer.layer_type in _COMPLETION_TYPES]
+            total_size_mb = sum(size for t, size in type_sizes.items() if t in _COMPLETION_TYPES)
         else:
             # Full inference - all layers
             layers_needed = layers
+            total_size_mb = sum(type_sizes.values())
         
         # Load strategy
         result = {
             "model": model_name,
             "intent": intent,
             "layers_needed": len(layers_needed),
-            "total_size_mb": sum(l.size_mb for l in layers_needed),
+            "total_size_mb": total_size_mb,
             "already_loaded": 0,
             "to_load": 0,
             "estimated_load_time_ms": 0
@@ -169,112 +308,323 @@ class LazyGPULoader:
             else:
                 result["to_load"] += 1
                 self.stats["cache_misses"] += 1
-                # Estimate: ~2GB/s PCIe transfer
-                result["estimated_load_time_ms"] += (layer.size_mb / 2000) * 1000
+                result["estimated_load_time_ms"] += (layer.size_mb / self.PCIE_MB_PER_S) * 1000
         
+        result["load_plan"] = self._plan_loads(model_name, intent, layers_needed)
         return result
     
-    def load_layer(self, model_name: str, layer_name: str) -> bool:
-        """Load specifieke layer naar VRAM."""
-        if model_name not in self.models:
-            return False
+    def _plan_loads(self,
+                    model_name: str,
+                    intent: str,
+                    layers_needed: List[ModelLayer]) -> List[str]:
+        pending = [layer for layer in layers_needed if not layer.is_in_vram()]
+        if intent == "inference":
+            seen = {id(layer) for layer in pending}
+            pending += [layer for layer in self._next_hint.get(model_name, ())
+                        if not layer.is_in_vram() and id(layer) not in seen]
+        pending.sort(key=lambda layer: layer.size_mb / layer.priority, reverse=True)
         
-        layer = next((l for l in self.models[model_name] if l.name == layer_name), None)
-        if not layer:
-            return False
+        # Everything else resident is evictable
+        headroom = self.gpu_vram_mb - sum(
+            layer.size_mb for layer in layers_needed if layer.is_in_vram())
+        plan = []
+        for layer in pending:
+            headroom -= layer.size_mb
+            if headroom < 0:
+                break
+            plan.append(layer.name)
+        return plan
+    
+    def _find_layer(self, model_name: str, layer_name: str) -> Optional[ModelLayer]:
+        index = self._layer_index.get(model_name)
+        return index.get(layer_name) if index is not None else None
+    
+    def _touch(self, key: Tuple[str, str], layer: ModelLayer):
+        self._resident.move_to_end(key)
+        self._touch_counter += 1
+        layer.touch_seq = self._touch_counter
+        layer.last_used_ns = time.time_ns()
+    
+    def _begin_load(self, layer: ModelLayer) -> Tuple[Optional[int], Any]:
+        """
+        Reserve VRAM en een transferpad.
         
-        if layer.is_in_vram():
-            layer.last_used = datetime.now()
-            return True  # Already loaded
+        Returns (channel, pin_handle): the source buffer pinned in place
+        (channel None), else a RAM staging channel (None if all are full).
+        """
+        self._status_cache.clear()
         
         # Check VRAM space
         if self.vram_used + layer.size_mb > self.gpu_vram_mb:
             # Need to evict
             self._evict_lru(layer.size_mb)
         
-        # Simulate loading via RAM buffer
-        channel = self.ram_buffer.get_free_channel()
-        if channel is not None:
-            self.ram_buffer.used_per_channel[channel] += layer.size_mb
-        
-        # Transfer to GPU
-        layer.state = LayerState.GPU_LOADING
-        # Simulate transfer time
-        time.sleep(layer.size_mb / 5000)  # ~5GB/s simulated
+        channel = None
+        handle = self.ram_buffer.register_inplace(layer.source)
+        if handle is not None:
+            layer.state = LayerState.RAM_REGISTERED
+        else:
+            channel = self.ram_buffer.get_free_channel()
+            if channel is not None:
+                self.ram_buffer.used_per_channel[channel] += layer.size_mb
+            layer.state = LayerState.GPU_LOADING
         
-        layer.state = LayerState.GPU_READY
-        layer.last_used = datetime.now()
+        # Reserved up front so concurrent loads don't oversubscribe VRAM
         self.vram_used += layer.size_mb
-        self.stats["layers_loaded"] += 1
+        return channel, handle
+    
+    def _end_load(self, key: Tuple[str, str], layer: ModelLayer,
+                  channel: Optional[int], handle: Any, ok: bool):
+        """Commit (ok) or roll back a load started by _begin_load."""
+        self._status_cache.clear()
+        if ok:
+            layer.state = LayerState.GPU_READY
+            now_ns = layer.last_used_ns = time.time_ns()
+            layer.loaded_at = now_ns / 1e9
+            self._resident[key] = layer
+            self._touch_counter += 1
+            layer.touch_seq = self._touch_counter
+            self.stats["layers_loaded"] += 1
+        else:
+            layer.state = LayerState.DISK
+            self.vram_used -= layer.size_mb
         
-        # Clean RAM buffer
+        # Clean RAM buffer / unpin source
         if channel is not None:
             self.ram_buffer.used_per_channel[channel] -= layer.size_mb
+        self.ram_buffer.unregister(handle)
+    
+    def load_layer(self, model_name: str, layer_name: str) -> bool:
+        """
+        Load specifieke layer naar VRAM (blocks for the transfer).
+        
+        If load_layer_async is already loading the layer, waits for that
+        transfer instead of reserving VRAM a second time. That wait needs
+        the event loop running the transfer, so from the loop's own thread
+        this raises RuntimeError (await load_layer_async there).
+        """
+        layer = self._find_layer(model_name, layer_name)
+        if not layer:
+            return False
         
+        key = (model_name, layer_name)
+        if layer.is_in_vram():
+            self._touch(key, layer)
+            return True  # Already loaded
+        
+        pending = self._loading.get(key)
+        if pending is not None:
+            return self._wait_for_async_load(pending)
+        
+        channel, handle = self._begin_load(layer)
+        ok = False
+        try:
+            self.transfer_fn(layer, channel)
+            ok = True
+        finally:
+            self._end_load(key, layer, channel, handle, ok)
+        return True
+    
+    @staticmethod
+    def _wait_for_async_load(pending: "asyncio.Future") -> bool:
+        loop = pending.get_loop()
+        try:
+            on_loop = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            raise RuntimeError("Layer is being loaded by load_layer_async; await that instead")
+        
+        async def wait():
+            return await asyncio.shield(pending)
+        return asyncio.run_coroutine_threadsafe(wait(), loop).result()
+    
+    async def load_layer_async(self, model_name: str, layer_name: str) -> bool:
+        """
+        Load specifieke layer naar VRAM zonder de event loop te blokkeren.
+        
+        The transfer runs in a worker thread; callers asking for a layer that
+        is already in flight await the same transfer.
+        """
+        layer = self._find_layer(model_name, layer_name)
+        if not layer:
+            return False
+        
+        key = (model_name, layer_name)
+        if layer.is_in_vram():
+            self._touch(key, layer)
+            return True  # Already loaded
+        
+        pending = self._loading.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        
+        # Registered only once _begin_load succeeded: if it raises, no waiter
+        # is left on a future nobody resolves (no await in between)
+        channel, handle = self._begin_load(layer)
+        pending = self._loading[key] = asyncio.get_running_loop().create_future()
+        ok = False
+        try:
+            await asyncio.to_thread(self.transfer_fn, layer, channel)
+            ok = True
+        finally:
+            self._end_load(key, layer, channel, handle, ok)
+            del self._loading[key]
+            pending.set_result(ok)
         return True
     
     def _evict_lru(self, need_mb: float):
         """Evict least-recently-used layers tot er genoeg ruimte is."""
+        resident = self._resident
         with self.eviction_lock:
-            # Collect all loaded layers across all models
-            all_loaded = []
-            for model_name, layers in self.models.items():
-                for layer in layers:
-                    if layer.is_in_vram():
-                        all_loaded.append((model_name, layer))
-            
-            # Sort by last_used (oldest first)
-            all_loaded.sort(key=lambda x: x[1].last_used or datetime.min)
-            
-            freed = 0
-            for model_name, layer in all_loaded:
-                if freed >= need_mb:
-                    break
-                
+            while resident and self.vram_used + need_mb > self.gpu_vram_mb:
+                _, layer = resident.popitem(last=False)
                 layer.state = LayerState.EVICTING
                 self.vram_used -= layer.size_mb
-                freed += layer.size_mb
                 layer.state = LayerState.DISK
                 self.stats["layers_evicted"] += 1
     
-    def prefetch(self, model_name: str, current_layer_idx: int):
-        """Prefetch volgende N layers in achtergrond."""
+    def start_prefetcher(self):
+        """Start de achtergrond prefetcher (call from the event loop thread)."""
+        if self._prefetch_task is None:
+            self._prefetch_q = asyncio.Queue(maxsize=self.prefetch_n * 2)
+            self._prefetch_task = asyncio.get_running_loop().create_task(self._prefetch_worker())
+    
+    async def stop_prefetcher(self):
+        """Stop de prefetcher; queued layers are dropped."""
+        task, self._prefetch_task, self._prefetch_q = self._prefetch_task, None, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._prefetch_inflight_mb = 0
+        self._prefetch_keys.clear()
+    
+    async def _prefetch_worker(self):
+        queue = self._prefetch_q
+        while True:
+            model_name, layer = await queue.get()
+            try:
+                await self.load_layer_async(model_name, layer.name)
+            except Exception:
+                pass  # Prefetch is best effort; the real load will retry
+            finally:
+                self._prefetch_inflight_mb -= layer.size_mb
+                self._prefetch_keys.discard((model_name, layer.name))
+                queue.task_done()
+    
+    def prefetch(self, model_name: str, current_layer_idx: int,
+                 compute_ms: Optional[float] = None):
+        """
+        Prefetch volgende N layers in achtergrond.
+        
+        With a running prefetcher the layers go on its bounded queue (call
+        from the event loop thread). compute_ms, the expected compute time of
+        the current layer, caps in-flight prefetch at what PCIe can move in
+        that time so prefetch never competes with the next real load.
+        Without a prefetcher they are appended to load_queue.
+        """
         if model_name not in self.models:
             return
         
+        queue = self._prefetch_q
+        budget_mb = None
+        if compute_ms is not None:
+            budget_mb = compute_ms / 1000 * self.PCIE_MB_PER_S
+        
         layers = self.models[model_name]
         for i in range(self.prefetch_n):
             next_idx = current_layer_idx + i + 1
-            if next_idx < len(layers):
-                layer = layers[next_idx]
-                if not layer.is_in_vram():
-                    # Queue for background load
-                    self.load_queue.append(layer)
-    
-    def get_vram_status(self) -> Dict:
-        """Return current VRAM status."""
-        layers_in_vram = []
-        for model_name, layers in self.models.items():
-            for layer in layers:
-                if layer.is_in_vram():
-                    layers_in_vram.append({
-                        "model": model_name,
-                        "layer": layer.name,
-                        "size_mb": layer.size_mb,
-                        "state": layer.state.value,
-                        "last_used": layer.last_used.isoformat() if layer.last_used else None
-                    })
-        
-        return {
+            if next_idx >= len(layers):
+                break
+            layer = layers[next_idx]
+            if layer.is_in_vram():
+                continue
+            
+            if queue is None:
+                # Queue for background load
+                self.load_queue.append(layer)
+                continue
+            
+            key = (model_name, layer.name)
+            if key in self._prefetch_keys or key in self._loading:
+                continue
+            if budget_mb is not None and self._prefetch_inflight_mb + layer.size_mb > budget_mb:
+                break
+            try:
+                queue.put_nowait((model_name, layer))
+            except asyncio.QueueFull:
+                break
+            self._prefetch_inflight_mb += layer.size_mb
+            self._prefetch_keys.add(key)
+    
+    def get_vram_status(self, include_layers: bool = True, iso_times: bool = False) -> Dict:
+        """
+        Return current VRAM status.
+        
+        include_layers=False skips the per-layer list (counts only);
+        iso_times=True formats loaded_at as ISO string instead of epoch
+        seconds. Results are memoized for STATUS_TTL_S or until the next
+        load/eviction, so last_used/touch_seq may lag by up to that TTL. Treat the
+        result as read-only.
+        """
+        key = (include_layers, iso_times)
+        now = time.monotonic()
+        cached = self._status_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        
+        status = {
             "total_vram_mb": self.gpu_vram_mb,
             "used_vram_mb": round(self.vram_used, 1),
             "free_vram_mb": round(self.gpu_vram_mb - self.vram_used, 1),
             "usage_pct": round((self.vram_used / self.gpu_vram_mb) * 100, 1),
-            "layers_in_vram": len(layers_in_vram),
-            "layers": layers_in_vram,
+            "layers_in_vram": len(self._resident),
             "ram_buffer_used_mb": round(self.ram_buffer.total_used(), 1),
             "stats": self.stats
         }
+        if include_layers:
+            status["layers"] = [
+                {
+                    "model": model_name,
+                    "layer": layer.name,
+                    "size_mb": layer.size_mb,
+                    "state": layer.state.value,
+                    "last_used": layer.last_used.isoformat() if layer.last_used else None,
+                    "touch_seq": layer.touch_seq,
+                    "loaded_at": (datetime.fromtimestamp(layer.loaded_at).isoformat()
+                                  if iso_times else layer.loaded_at)
+                }
+                for (model_name, _), layer in self._resident.items()
+            ]
+        
+        self._status_cache[key] = (now + self.STATUS_TTL_S, status)
+        return status
+    
+    def to_json(self, include_layers: bool = True) -> str:
+        """Serialize get_vram_status() (orjson when installed, else stdlib json)."""
+        status = self.get_vram_status(include_layers=include_layers)
+        if orjson is not None:
+            return orjson.dumps(status, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(status, indent=2)
+    
+    def get_prometheus_text(self) -> str:
+        """VRAM gauges en loader counters in Prometheus text format (no status dict)."""
+        stats = self.stats
+        return (
+            f"betti_vram_total_mb {self.gpu_vram_mb}\n"
+            f"betti_vram_used_mb {self.vram_used}\n"
+            f"betti_vram_free_mb {self.gpu_vram_mb - self.vram_used}\n"
+            f"betti_layers_in_vram {len(self._resident)}\n"
+            f"betti_ram_buffer_used_mb {self.ram_buffer.total_used()}\n"
+            f"betti_layers_loaded_total {stats['layers_loaded']}\n"
+            f"betti_layers_evicted_total {stats['layers_evicted']}\n"
+            f"betti_cache_hits_total {stats['cache_hits']}\n"
+            f"betti_cache_misses_total {stats['cache_misses']}\n"
+            f"betti_prefetch_hits_total {stats['prefetch_hits']}\n"
+        )
 
 
 # Demo
@@ -327,7 +677,6 @@ if __name__ == "__main__":
     
     # VRAM status
     print("\n=== VRAM Status ===")
-    import json
     status = loader.get_vram_status()
     print(f"Used: {status['used_vram_mb']}MB / {status['total_vram_mb']}MB ({status['usage_pct']}%)")
     print(f"Cache hits: {status['stats']['cache_hits']}, misses: {status['stats']['cache_misses']}")
@@ -7,12 +7,20 @@ SNAFT = Semantic Network for Autonomous Firewall & Telemetry
 Kwalificeert GPU requests op basis van intent, niet alleen resources.
 """
 
+from array import array
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Callable
+from typing import Deque, List, Dict, Optional, Callable
 from enum import Enum
 from datetime import datetime, timedelta
+import bisect
 import hashlib
 import re
+import sys
+import time
+
+# __slots__ instead of a per-instance __dict__ where dataclass supports it (3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class ThreatLevel(Enum):
@@ -33,7 +41,7 @@ class GPUIntent(Enum):
     UNKNOWN = "unknown"              # Ongekwalificeerd
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class GPURequest:
     """Inkomende GPU request voor SNAFT analyse."""
     intent: GPUIntent
@@ -46,7 +54,7 @@ class GPURequest:
     timestamp: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SNAFTVerdict:
     """SNAFT beslissing over GPU request."""
     allowed: bool
@@ -80,6 +88,12 @@ class SNAFTGPUFirewall:
         r".*benchmark.*loop.*"
     ]
     
+    # Fused, one group per pattern. Matching at position 0 tries the
+    # alternatives in list order, so m.lastindex names the same pattern the
+    # per-pattern loop would have reported first.
+    _CRYPTO_RE = re.compile("|".join(f".*?({p})" for p in CRYPTO_PATTERNS), re.DOTALL)
+    _SUSPICIOUS_RE = re.compile("|".join(f"({p})" for p in SUSPICIOUS_MODELS))
+    
     # Toegestane intents met VRAM limieten (MB)
     INTENT_LIMITS = {
         GPUIntent.INFERENCE: 8000,      # 8GB max per inference
@@ -99,86 +113,168 @@ class SNAFTGPUFirewall:
         self.max_duration = max_duration
         self.rate_limit = rate_limit_per_minute
         self.request_history: List[GPURequest] = []
+        # Monotonic approval times of the last hour, ascending (for get_stats)
+        self._approved_ts = array("d")
+        # Per actor: monotonic approval times within the rate window (≤ rate_limit)
+        self._actor_times: Dict[str, Deque[float]] = defaultdict(
+            lambda: deque(maxlen=self.rate_limit))
         self.blocked_actors: Dict[str, datetime] = {}
         self.trust_scores: Dict[str, float] = {}
+        
+        # Checks in evaluation order; each returns None (pass) or a verdict
+        self._checks: List[Callable[[GPURequest, datetime, float], Optional[SNAFTVerdict]]] = [
+            self._check_blocked,
+            self._check_crypto_intent,
+            self._check_model_name,
+            self._check_vram,
+            self._check_duration,
+            self._check_rate,
+            self._check_trust,
+        ]
     
     def analyze(self, request: GPURequest) -> SNAFTVerdict:
         """
         Analyseer GPU request en geef verdict.
         
+        Runs the checks in self._checks in order; the first one returning a
+        verdict decides. A request passing all of them is approved. The
+        clock is read once per call (wall + monotonic) and shared by all checks.
+        
         Returns:
             SNAFTVerdict met allowed/blocked en reden
         """
-        # Check 1: Actor blocked?
-        if request.actor in self.blocked_actors:
-            if datetime.now() < self.blocked_actors[request.actor]:
-                return SNAFTVerdict(
-                    allowed=False,
-                    threat_level=ThreatLevel.BLOCKED,
-                    reason=f"Actor '{request.actor}' is geblokkeerd tot {self.blocked_actors[request.actor]}"
-                )
-            else:
-                del self.blocked_actors[request.actor]
+        now = datetime.now()
+        now_m = time.monotonic()
+        for check in self._checks:
+            verdict = check(request, now, now_m)
+            if verdict is not None:
+                return verdict
         
-        # Check 2: Crypto intent = instant block
-        if request.intent == GPUIntent.CRYPTO:
-            self._block_actor(request.actor, hours=24)
+        # All checks passed!
+        self.request_history.append(request)
+        self._actor_times[request.actor].append(now_m)
+        self._approved_ts.append(now_m)
+        return SNAFTVerdict(
+            allowed=True,
+            threat_level=ThreatLevel.SAFE,
+            reason="Request goedgekeurd",
+            expires_at=now + timedelta(seconds=request.estimated_duration)
+        )
+    
+    def _check_blocked(
+        self, request: GPURequest, now: datetime, now_m: float
+    ) -> Optional[SNAFTVerdict]:
+        """Check 1: Actor blocked?"""
+        # Common case: one hash lookup, no clock read
+        blocked_until = self.blocked_actors.get(request.actor)
+        if blocked_until is None:
+            return None
+        if now < blocked_until:
+            return SNAFTVerdict(
+                allowed=False,
+                threat_level=ThreatLevel.BLOCKED,
+                reason=f"Actor '{request.actor}' is geblokkeerd tot {blocked_until}"
+            )
+        del self.blocked_actors[request.actor]
+        return None
+    
+    def _check_crypto_intent(
+        self, request: GPURequest, now: datetime, now_m: float
+    ) -> Optional[SNAFTVerdict]:
+        """Check 2: Crypto intent = instant block"""
+        if request.intent is GPUIntent.CRYPTO:
+            self._block_actor(request.actor, hours=24, now=now)
             return SNAFTVerdict(
                 allowed=False,
                 threat_level=ThreatLevel.BLOCKED,
                 reason="Cryptomining intent gedetecteerd - BLOCKED"
             )
+        return None
+    
+    def _check_model_name(
+        self, request: GPURequest, now: datetime, now_m: float
+    ) -> Optional[SNAFTVerdict]:
+        """Check 3+4: Crypto patterns en verdachte model namen"""
+        model_name = request.model_name.lower()
         
-        # Check 3: Model naam crypto patterns
-        for pattern in self.CRYPTO_PATTERNS:
-            if re.search(pattern, request.model_name.lower()):
-                self._block_actor(request.actor, hours=24)
-                return SNAFTVerdict(
-                    allowed=False,
-                    threat_level=ThreatLevel.BLOCKED,
-                    reason=f"Crypto pattern '{pattern}' in model naam - BLOCKED"
+        m = self._CRYPTO_RE.match(model_name)
+        if m:
+            self._block_actor(request.actor, hours=24, now=now)
+            return SNAFTVerdict(
+                allowed=False,
+                threat_level=ThreatLevel.BLOCKED,
+                reason=(
+                    f"Crypto pattern '{self.CRYPTO_PATTERNS[m.lastindex - 1]}' "
+                    "in model naam - BLOCKED"
                 )
+            )
         
-        # Check 4: Verdachte model namen
-        for pattern in self.SUSPICIOUS_MODELS:
-            if re.match(pattern, request.model_name.lower()):
-                return SNAFTVerdict(
-                    allowed=False,
-                    threat_level=ThreatLevel.SUSPICIOUS,
-                    reason=f"Verdacht model pattern '{pattern}' - DENIED"
+        m = self._SUSPICIOUS_RE.match(model_name)
+        if m:
+            return SNAFTVerdict(
+                allowed=False,
+                threat_level=ThreatLevel.SUSPICIOUS,
+                reason=(
+                    f"Verdacht model pattern '{self.SUSPICIOUS_MODELS[m.lastindex - 1]}' - DENIED"
                 )
-        
-        # Check 5: VRAM limiet per intent
+            )
+        return None
+    
+    def _check_vram(
+        self, request: GPURequest, now: datetime, now_m: float
+    ) -> Optional[SNAFTVerdict]:
+        """Check 5: VRAM limiet per intent"""
         vram_limit = self.INTENT_LIMITS.get(request.intent, 1000)
         if request.vram_requested > vram_limit:
             return SNAFTVerdict(
                 allowed=False,
                 threat_level=ThreatLevel.SUSPICIOUS,
-                reason=f"VRAM request ({request.vram_requested}MB) overschrijdt limiet ({vram_limit}MB) voor {request.intent.value}"
+                reason=(
+                    f"VRAM request ({request.vram_requested}MB) overschrijdt limiet "
+                    f"({vram_limit}MB) voor {request.intent.value}"
+                )
             )
-        
-        # Check 6: Duration limiet
+        return None
+    
+    def _check_duration(
+        self, request: GPURequest, now: datetime, now_m: float
+    ) -> Optional[SNAFTVerdict]:
+        """Check 6: Duration limiet"""
         if request.estimated_duration > self.max_duration:
             return SNAFTVerdict(
                 allowed=True,  # Toegestaan maar met restrictie
                 threat_level=ThreatLevel.SUSPICIOUS,
                 reason=f"Duration beperkt tot {self.max_duration}s",
                 restrictions={"max_duration": self.max_duration},
-                expires_at=datetime.now() + timedelta(seconds=self.max_duration)
+                expires_at=now + timedelta(seconds=self.max_duration)
             )
-        
-        # Check 7: Rate limiting
-        recent_requests = [r for r in self.request_history 
-                         if r.actor == request.actor 
-                         and (datetime.now() - r.timestamp).seconds < 60]
-        if len(recent_requests) >= self.rate_limit:
+        return None
+    
+    def _check_rate(
+        self, request: GPURequest, now: datetime, now_m: float
+    ) -> Optional[SNAFTVerdict]:
+        """Check 7: Rate limiting"""
+        recent = self._actor_times.get(request.actor)
+        if recent is None:
+            return None
+        while recent and now_m - recent[0] >= 60:
+            recent.popleft()
+        if not recent:
+            # Nothing left in the window: drop the actor, analyze() re-adds it
+            del self._actor_times[request.actor]
+            return None
+        if len(recent) >= self.rate_limit:
             return SNAFTVerdict(
                 allowed=False,
                 threat_level=ThreatLevel.SUSPICIOUS,
                 reason=f"Rate limit bereikt ({self.rate_limit}/min) voor actor '{request.actor}'"
             )
-        
-        # Check 8: Trust score (TIBET integration)
+        return None
+    
+    def _check_trust(
+        self, request: GPURequest, now: datetime, now_m: float
+    ) -> Optional[SNAFTVerdict]:
+        """Check 8: Trust score (TIBET integration)"""
         trust = self.trust_scores.get(request.actor, 0.5)
         if trust < self.trust_threshold:
             return SNAFTVerdict(
@@ -190,19 +286,11 @@ class SNAFTGPUFirewall:
                     "duration_limit": min(request.estimated_duration, 300)
                 }
             )
-        
-        # All checks passed!
-        self.request_history.append(request)
-        return SNAFTVerdict(
-            allowed=True,
-            threat_level=ThreatLevel.SAFE,
-            reason="Request goedgekeurd",
-            expires_at=datetime.now() + timedelta(seconds=request.estimated_duration)
-        )
+        return None
     
-    def _block_actor(self, actor: str, hours: int = 24):
+    def _block_actor(self, actor: str, hours: int = 24, now: Optional[datetime] = None):
         """Blokkeer actor voor X uur."""
-        self.blocked_actors[actor] = datetime.now() + timedelta(hours=hours)
+        self.blocked_actors[actor] = (now or datetime.now()) + timedelta(hours=hours)
     
     def set_trust(self, actor: str, score: float):
         """Set trust score voor actor (0.0 - 1.0)."""
@@ -210,12 +298,17 @@ class SNAFTGPUFirewall:
     
     def get_stats(self) -> Dict:
         """Return firewall statistieken."""
+        # Timestamps are appended in order: drop everything older than an hour
+        approved = self._approved_ts
+        cutoff = bisect.bisect_right(approved, time.monotonic() - 3600)
+        if cutoff:
+            del approved[:cutoff]
+        
         return {
             "total_requests": len(self.request_history),
             "blocked_actors": len(self.blocked_actors),
             "trust_scores": dict(self.trust_scores),
-            "recent_requests": len([r for r in self.request_history 
-                                    if (datetime.now() - r.timestamp).seconds < 3600])
+            "recent_requests": len(approved)
         }
 
 
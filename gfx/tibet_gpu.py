@@ -3,12 +3,36 @@ TIBET GPU Token - Provenance voor elke GPU call
 """
 import hashlib
 import hmac
+import sys
 import time
+from collections import OrderedDict, deque
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import Deque, Optional, Dict, Any
 import json
 
-@dataclass
+# __slots__ instead of a per-instance __dict__ where dataclass supports it (3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Keyed HMAC state per secret (inner/outer key pads already absorbed);
+# _sign copies it instead of re-keying for every token. A small LRU keyed by
+# a digest of the secret, so rotated keys are released and the raw secret is
+# never a dict key.
+_HMAC_CACHE_SIZE = 8
+_HMAC_TEMPLATES: "OrderedDict[bytes, hmac.HMAC]" = OrderedDict()
+
+
+def _get_hmac(secret_key: bytes) -> "hmac.HMAC":
+    key_id = hashlib.sha256(secret_key).digest()
+    template = _HMAC_TEMPLATES.get(key_id)
+    if template is None:
+        template = _HMAC_TEMPLATES[key_id] = hmac.new(secret_key, digestmod=hashlib.sha256)
+        if len(_HMAC_TEMPLATES) > _HMAC_CACHE_SIZE:
+            _HMAC_TEMPLATES.popitem(last=False)
+    else:
+        _HMAC_TEMPLATES.move_to_end(key_id)
+    return template
+
+@dataclass(**_SLOTS)
 class TIBETGPUToken:
     """
     TIBET Token voor GPU operaties
@@ -50,9 +74,11 @@ class TIBETGPUToken:
                parent_token: str = None, secret_key: bytes = b"humotica_gpu"):
         """Create new TIBET GPU token"""
         
-        token_id = hashlib.sha256(
-            f"{time.time()}{kernel_name}{intent}".encode()
-        ).hexdigest()[:16]
+        # 64-bit id, not a security primitive: blake2b sized to 8 bytes
+        # instead of truncating a full SHA-256 (the HMAC stays SHA-256)
+        token_id = hashlib.blake2b(
+            f"{time.time_ns()}{kernel_name}{intent}".encode(), digest_size=8
+        ).hexdigest()
         
         gpu_state = gpu_state or {}
         
@@ -77,10 +103,14 @@ class TIBETGPUToken:
         
         return token
     
+    def _payload(self) -> bytes:
+        return f"{self.token_id}:{self.parent_token}:{self.intent}:{self.data_size_mb}".encode()
+    
     def _sign(self, secret_key: bytes) -> str:
         """HMAC signature for chain integrity"""
-        payload = f"{self.token_id}:{self.parent_token}:{self.intent}:{self.data_size_mb}"
-        return hmac.new(secret_key, payload.encode(), hashlib.sha256).hexdigest()[:32]
+        mac = _get_hmac(secret_key).copy()
+        mac.update(self._payload())
+        return mac.hexdigest()[:32]
     
     def verify(self, secret_key: bytes = b"humotica_gpu") -> bool:
         """Verify token signature"""
@@ -125,7 +155,8 @@ class TIBETGPUChain:
     """Rolling chain of GPU tokens"""
     
     def __init__(self, max_size: int = 1000):
-        self.tokens: list = []
+        # Oldest tokens fall off the left once max_size is reached
+        self.tokens: Deque[TIBETGPUToken] = deque(maxlen=max_size)
         self.max_size = max_size
         self.last_token_id: Optional[str] = None
     
@@ -133,21 +164,23 @@ class TIBETGPUChain:
         """Add token to chain"""
         self.tokens.append(token)
         self.last_token_id = token.token_id
-        
-        # Trim if too large
-        if len(self.tokens) > self.max_size:
-            self.tokens = self.tokens[-self.max_size:]
     
     def get_last(self) -> Optional[TIBETGPUToken]:
         return self.tokens[-1] if self.tokens else None
     
-    def verify_chain(self) -> bool:
+    def verify_chain(self, secret_key: bytes = b"humotica_gpu") -> bool:
         """Verify entire chain integrity"""
-        for i, token in enumerate(self.tokens):
-            if not token.verify():
+        template = _get_hmac(secret_key)
+        prev_id = None
+        for token in self.tokens:
+            # Cheap link check first: a broken chain fails before any hashing
+            if prev_id is not None and token.parent_token != prev_id:
                 return False
-            if i > 0 and token.parent_token != self.tokens[i-1].token_id:
+            mac = template.copy()
+            mac.update(token._payload())
+            if not hmac.compare_digest(token.signature or "", mac.hexdigest()[:32]):
                 return False
+            prev_id = token.token_id
         return True
     
     def stats(self) -> Dict:
@@ -27,8 +27,8 @@ Usage:
 from .client import TibetBettiClient
 from .tibet import Tibet, TimeWindow, Constraints
 from .context import Context, SenseRule
-from .trust_token import TrustToken, FIRARelationship
-from .websocket import TibetWebSocket
+from .trust_token import TrustToken, TrustLevel, FIRARelationship, StringTable
+from .async_client import AsyncTibetBettiClient
 
 __version__ = "1.0.0"
 __all__ = [
@@ -39,6 +39,26 @@ __all__ = [
     "Context",
     "SenseRule",
     "TrustToken",
+    "TrustLevel",
+    "StringTable",
     "FIRARelationship",
-    "TibetWebSocket"
+    "TibetWebSocket",
+    "AsyncTibetWebSocket",
+    "AsyncTibetBettiClient"
 ]
+
+# WebSocket clients are loaded on first access (PEP 562), so a plain
+# "import" does not pay for the WebSocket modules
+_LAZY = {
+    "TibetWebSocket": ".websocket",
+    "AsyncTibetWebSocket": ".async_websocket",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        from importlib import import_module
+        value = getattr(import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,39 @@
+"""
+Helpers shared by the SDK modules: optional orjson, slotted dataclasses, interning
+"""
+
+import sys
+from datetime import datetime
+from typing import Any
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    import json
+    HAS_ORJSON = False
+
+# __slots__ instead of a per-instance __dict__ where dataclass supports it (3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+if HAS_ORJSON:
+    # UTF-8 bytes; formats datetimes in C, like isoformat() (naive stays naive).
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+
+    def _dumps_sorted(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+else:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=datetime.isoformat).encode()
+    _loads = json.loads
+
+    def _dumps_sorted(obj: Any) -> bytes:
+        return json.dumps(obj, sort_keys=True, default=datetime.isoformat).encode()
+
+
+def _intern(value: Any) -> Any:
+    # Strings that repeat (dict keys, identifiers) share one object, and
+    # lookups with interned keys hit the identity fast path
+    return sys.intern(value) if type(value) is str else value
@@ -0,0 +1,279 @@
+"""
+asyncio WebSocket client for many concurrent TIBET/context streams
+
+TibetWebSocket runs one thread per connection. AsyncTibetWebSocket runs every
+connection as a task on one shared event loop thread, so N users cost N
+sockets but no extra threads.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import random
+import threading
+from collections import deque
+from typing import Optional, Callable, Dict, Any, Union
+
+from .websocket import _JSON_START, _dumps, _loads
+
+# websockets is imported when a connection starts, not with the SDK
+HAS_WEBSOCKETS = importlib.util.find_spec("websockets") is not None
+
+logger = logging.getLogger(__name__)
+
+# One event loop (in one daemon thread) shared by all AsyncTibetWebSockets
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _require_websockets():
+    """
+    Import the websockets client on the caller's thread
+
+    Raises ImportError if it is missing or older than 14 (send(text=True)),
+    where a failure inside the loop task would only end the connection.
+    """
+    from websockets.asyncio.client import connect  # noqa: F401 (websockets >= 13)
+    from websockets.version import version
+
+    if int(version.split(".")[0]) < 14:
+        raise ImportError(
+            f"websockets>=14 required, found {version}. "
+            "Upgrade with: pip install -U websockets"
+        )
+
+
+def _shared_loop() -> asyncio.AbstractEventLoop:
+    """Start the shared WebSocket event loop thread on first use"""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="betti-ws-loop", daemon=True).start()
+            _loop = loop
+        return _loop
+
+
+class AsyncTibetWebSocket:
+    """
+    Multiplexed WebSocket client for real-time TIBET intent and context updates
+
+    Same callbacks and behaviour as TibetWebSocket, but all instances share
+    one asyncio loop thread (websockets library). Use it when one process
+    holds many connections, e.g. one per user_id. Callbacks run on the
+    shared loop thread, so keep them short.
+
+    Example:
+        >>> sockets = [
+        ...     AsyncTibetWebSocket(f"ws://localhost:8000/ws/{user}", on_message=print)
+        ...     for user in users
+        ... ]
+        >>> for ws in sockets:
+        ...     ws.start()  # no thread per connection
+    """
+
+    def __init__(
+        self,
+        url: str,
+        on_message: Callable[[Dict[str, Any]], None],
+        on_tibet: Optional[Callable[[Dict[str, Any]], None]] = None,
+        on_context_update: Optional[Callable[[Dict[str, Any]], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        on_close: Optional[Callable[[], None]] = None,
+        ping_interval: float = 10,
+        ping_timeout: float = 8,
+        reconnect: bool = True,
+        max_backoff: float = 30,
+        send_queue_size: int = 1024
+    ):
+        """
+        Initialize WebSocket client
+
+        Args:
+            url: WebSocket URL (ws://...)
+            on_message: Callback for any message
+            on_tibet: Optional callback for TIBET intents specifically
+            on_context_update: Optional callback for context updates
+            on_error: Optional error callback
+            on_close: Optional close callback
+            ping_interval: Seconds between keep-alive pings (0 disables)
+            ping_timeout: Seconds to wait for a pong
+            reconnect: Reconnect with exponential backoff when the connection drops
+            max_backoff: Upper bound for the reconnect delay in seconds
+            send_queue_size: Messages waiting to be sent (oldest dropped)
+        """
+        if not HAS_WEBSOCKETS:
+            raise ImportError(
+                "websockets not installed. "
+                "Install with: pip install websockets"
+            )
+        self.url = url
+        self.on_message = on_message
+        self.on_tibet = on_tibet
+        self.on_context_update = on_context_update
+        self.on_error = on_error
+        self.on_close = on_close
+
+        # Type-specific callbacks, looked up once per message
+        self._dispatch_table: Dict[str, Callable[[Dict[str, Any]], None]] = {}
+        if on_tibet:
+            self._dispatch_table["tibet"] = on_tibet
+        if on_context_update:
+            self._dispatch_table["context_update"] = on_context_update
+        self.ping_interval = ping_interval or None
+        self.ping_timeout = ping_timeout if ping_interval else None
+        self.reconnect = reconnect
+        self.max_backoff = max_backoff
+
+        self.running = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task = None  # concurrent.futures.Future of _run()
+        self._ws = None
+        self._closing = False
+
+        # Outgoing messages; a message leaves the queue only once it was sent
+        self._outbox: deque = deque(maxlen=send_queue_size)
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def _handle_message(self, message):
+        """Internal message handler"""
+        try:
+            data = _loads(message)
+        except ValueError:
+            # Heartbeats and plain text are expected; a broken object/array is not
+            if message[:1] in _JSON_START:
+                logger.error(f"Invalid JSON: {message}")
+            else:
+                logger.debug(f"Ignoring non-JSON frame: {message[:32]!r}")
+            return
+
+        try:
+            # Call general message handler (any JSON value, scalars included)
+            self.on_message(data)
+
+            # Call specific handler (dict.get: an itemgetter("type") is no faster,
+            # and far slower via KeyError for messages without a type)
+            if data.__class__ is dict:
+                callback = self._dispatch_table.get(data.get("type"))
+                if callback:
+                    callback(data)
+
+        except Exception as e:
+            logger.error(f"Error handling message: {e}")
+            if self.on_error:
+                self.on_error(e)
+
+    def start(self):
+        """Start the connection as a task on the shared loop (returns immediately)"""
+        _require_websockets()
+        self._loop = _shared_loop()
+        self._closing = False
+        self._task = asyncio.run_coroutine_threadsafe(self._run(), self._loop)
+        logger.info("WebSocket started on shared loop")
+
+    async def _run(self):
+        """Connect, and reconnect with jittered exponential backoff until closed"""
+        from websockets.asyncio.client import connect  # Checked by start()
+
+        self._wakeup = asyncio.Event()
+        backoff = 1.0
+
+        while True:
+            try:
+                async with connect(
+                    self.url,
+                    ping_interval=self.ping_interval,
+                    ping_timeout=self.ping_timeout
+                ) as ws:
+                    logger.info(f"WebSocket connected to {self.url}")
+                    self._ws = ws
+                    self.running = True
+                    backoff = 1.0
+                    writer = asyncio.ensure_future(self._write(ws))
+                    try:
+                        async for message in ws:
+                            self._handle_message(message)
+                    finally:
+                        writer.cancel()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"WebSocket error: {e}")
+                if self.on_error:
+                    self.on_error(e)
+            finally:
+                self._ws = None
+                if self.running:
+                    self.running = False
+                    logger.info("WebSocket closed")
+                    if self.on_close:
+                        self.on_close()
+
+            if self._closing or not self.reconnect:
+                break
+
+            delay = backoff * random.uniform(0.5, 1.0)
+            backoff = min(backoff * 2, self.max_backoff)
+            logger.info(f"WebSocket reconnecting in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    async def _write(self, ws):
+        """Drain the outbox in order; a failed send stays queued for the next connection"""
+        try:
+            while True:
+                while self._outbox:
+                    # orjson gives bytes: text=True still sends a TEXT frame
+                    await ws.send(self._outbox[0], text=True)
+                    self._outbox.popleft()
+                self._wakeup.clear()
+                if not self._outbox:
+                    await self._wakeup.wait()
+        except Exception as e:
+            # Connection lost: the reader loop ends too and _run reconnects
+            logger.warning(f"Send failed, keeping {len(self._outbox)} queued: {e}")
+
+    def send(self, data: Union[Dict[str, Any], bytes]):
+        """
+        Send message through WebSocket (thread-safe)
+
+        While disconnected (and reconnect is enabled) the message is queued
+        and sent once the connection is back.
+
+        Args:
+            data: Data to send (will be JSON-encoded), or already encoded
+                bytes such as Tibet.to_json_bytes()
+        """
+        if not self.running and not self.reconnect:
+            raise RuntimeError("WebSocket not connected")
+
+        self._outbox.append(data if isinstance(data, bytes) else _dumps(data))
+        if self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def _shutdown(self, task):
+        """Close handshake first (code 1000), then stop a pending connect/backoff"""
+        if self._ws is not None:
+            await self._ws.close()
+        task.cancel()
+
+    def close(self):
+        """Close WebSocket connection (stops reconnecting)"""
+        if self._task is not None:
+            self._closing = True
+            # Scheduled, not awaited: close() may be called from a callback on the loop
+            asyncio.run_coroutine_threadsafe(self._shutdown(self._task), self._loop)
+            self._task = None
+        logger.info("WebSocket closed")
+
+    def is_connected(self) -> bool:
+        """Check if WebSocket is connected"""
+        return self.running
+
+    def __enter__(self):
+        """Context manager entry"""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.close()
@@ -2,7 +2,7 @@
 Setup script for TIBET-BETTI Python SDK
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
@@ -16,7 +16,10 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/yourorg/jtel-identity-standard",
-    packages=find_packages(),
+    # Listed, not find_packages(): no tree walk per build. This file lives in
+    # the package directory itself, hence the "." mapping.
+    packages=["tibet_betti_client"],
+    package_dir={"tibet_betti_client": "."},
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -43,6 +46,26 @@ setup(
             "flake8>=6.0.0",
             "mypy>=1.0.0",
         ],
+        "async": [
+            "aiohttp>=3.8.0",
+            "websockets>=14.0",
+        ],
+        "fast": [
+            "orjson>=3.9.0",
+        ],
+        "stream": [
+            "ijson>=3.1.0",
+        ],
+        "http2": [
+            "httpx[http2]>=0.24.0",
+        ],
+        "vector": [
+            "numpy>=1.21.0",
+        ],
+        "jit": [
+            "numpy>=1.21.0",
+            "numba>=0.57.0",
+        ],
     },
     entry_points={
         "console_scripts": [
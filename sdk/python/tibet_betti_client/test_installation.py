@@ -14,6 +14,36 @@ parent_dir = os.path.dirname(sdk_dir)
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
+_RULE = "=" * 70
+
+_NEXT_STEPS = """
+Next steps:
+1. Make sure BETTI router is running on http://localhost:18081
+2. Make sure your KIT API is running on http://localhost:8000
+3. Run: python examples/complete_example.py
+
+Or start using in your app:
+
+from tibet_betti_client import TibetBettiClient
+
+client = TibetBettiClient(
+    betti_url="http://localhost:18081",
+    kit_url="http://localhost:8000",
+    secret="denDolder_2024!"
+)
+
+# Establish trust
+rel = client.establish_trust("my_app", "user_device")
+
+# Send TIBET
+client.send_tibet(
+    relationship_id=rel.id,
+    intent="test_intent",
+    context={"user_id": "user_123"}
+)
+"""
+
+
 def test_imports():
     """Test all imports work"""
     print("Testing imports...")
@@ -113,9 +143,9 @@ def test_dependencies():
 
 
 def main():
-    print("="*70)
+    print(_RULE)
     print("  TIBET-BETTI SDK Installation Test")
-    print("="*70)
+    print(_RULE)
 
     results = []
 
@@ -129,9 +159,9 @@ def main():
     results.append(("Classes", test_classes()))
 
     # Summary
-    print("\n" + "="*70)
+    print("\n" + _RULE)
     print("  Summary")
-    print("="*70)
+    print(_RULE)
 
     all_passed = True
     for name, passed in results:
@@ -140,37 +170,14 @@ def main():
         if not passed:
             all_passed = False
 
-    print("\n" + "="*70)
+    print("\n" + _RULE)
     if all_passed:
         print("  🎉 SDK is ready to use!")
-        print("="*70)
-        print("\nNext steps:")
-        print("1. Make sure BETTI router is running on http://localhost:18081")
-        print("2. Make sure your KIT API is running on http://localhost:8000")
-        print("3. Run: python examples/complete_example.py")
-        print("\nOr start using in your app:")
-        print("""
-from tibet_betti_client import TibetBettiClient
-
-client = TibetBettiClient(
-    betti_url="http://localhost:18081",
-    kit_url="http://localhost:8000",
-    secret="denDolder_2024!"
-)
-
-# Establish trust
-rel = client.establish_trust("my_app", "user_device")
-
-# Send TIBET
-client.send_tibet(
-    relationship_id=rel.id,
-    intent="test_intent",
-    context={"user_id": "user_123"}
-)
-        """)
+        print(_RULE)
+        print(_NEXT_STEPS)
     else:
         print("  ⚠ Some tests failed - check output above")
-        print("="*70)
+        print(_RULE)
         print("\nTry:")
         print("  pip install -r requirements.txt")
 
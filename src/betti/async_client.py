@@ -0,0 +1,596 @@
+"""
+TIBET-BETTI Async Client
+
+asyncio counterpart of TibetBettiClient, built on aiohttp. One ClientSession
+(and its connection pool) is reused for every call, and the calling thread
+is free while requests are in flight.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+try:
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+from .tibet import Tibet, TimeWindow, Constraints
+from .context import Context, SenseRule
+from .trust_token import FIRARelationship
+from .client import (
+    _base_url, _dumps, _loads, _generate_keys,
+    _trust_payload, _intent_payload, _log_execution_status
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncTibetBettiClient:
+    """
+    Async TIBET-BETTI Client
+
+    Same API as TibetBettiClient, with every HTTP method as a coroutine.
+
+    Example:
+        >>> async with AsyncTibetBettiClient(
+        ...     betti_url="http://localhost:18081",
+        ...     kit_url="http://localhost:8000",
+        ...     secret="your-secret"
+        ... ) as client:
+        ...     rel = await client.establish_trust("my_app", "user_ai")
+        ...     await client.send_tibet(rel.id, "schedule_meeting")
+    """
+
+    def __init__(
+        self,
+        betti_url: str,
+        kit_url: Optional[str] = None,
+        secret: Optional[str] = None,
+        jwt_token: Optional[str] = None,
+        timeout: int = 30,
+        max_connections: int = 64
+    ):
+        """
+        Initialize async TIBET-BETTI Client
+
+        Args:
+            betti_url: URL of BETTI router (JIS)
+            kit_url: URL of KIT API (your context/sense system)
+            secret: Shared secret for authentication
+            jwt_token: JWT token (alternative to secret)
+            timeout: Request timeout in seconds
+            max_connections: Connection pool size across both hosts
+        """
+        if not HAS_AIOHTTP:
+            raise ImportError(
+                "aiohttp not installed. "
+                "Install with: pip install aiohttp"
+            )
+
+        self.betti_url = _base_url(betti_url)
+        self.kit_url = _base_url(kit_url) if kit_url else None
+        self.secret = secret
+        self.jwt_token = jwt_token
+        self.timeout = timeout
+        self.max_connections = max_connections
+
+        # HTTP session (created on first use / __aenter__)
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+        # Track continuity hashes for FIR/As; sends on one FIR/A are chained
+        # (each needs the previous hash), so they hold that FIR/A's lock.
+        # Both are kept until forget_relationship(), as in TibetBettiClient.
+        self._continuity_hashes: Dict[str, str] = {}
+        self._chain_locks: Dict[str, asyncio.Lock] = {}
+
+    async def __aenter__(self) -> "AsyncTibetBettiClient":
+        self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """Close the HTTP session and its connection pool"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def forget_relationship(self, relationship_id: str):
+        """Drop a FIR/A's continuity hash and chain lock once it is no longer used"""
+        self._continuity_hashes.pop(relationship_id, None)
+        self._chain_locks.pop(relationship_id, None)
+
+    def clear_continuity_hashes(self):
+        """Forget all tracked continuity hashes (next TIBET per FIR/A sends no prev hash)"""
+        self._continuity_hashes.clear()
+        self._chain_locks.clear()
+
+    def _headers(self) -> Dict[str, str]:
+        """Build request headers"""
+        headers = {"Content-Type": "application/json"}
+
+        if self.jwt_token:
+            headers["Authorization"] = f"Bearer {self.jwt_token}"
+        elif self.secret:
+            headers["X-JIS-SECRET"] = self.secret
+
+        return headers
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self._headers(),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=self.max_connections, ttl_dns_cache=300)
+            )
+        return self._session
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        json_data: Optional[Dict] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Make HTTP request (orjson encode/decode when installed)"""
+        body = _dumps(json_data) if json_data is not None else None
+        async with self._get_session().request(method, url, params=params, data=body) as response:
+            if response.status >= 400:
+                logger.error(f"Request failed: {method} {url} - {response.status}")
+                logger.error(f"Response: {await response.text()}")
+                response.raise_for_status()
+            raw = await response.read()
+            # Empty body -> None, as aiohttp's response.json() did
+            return _loads(raw) if raw.strip() else None
+
+    # ========================================================================
+    # TRUST TOKEN MANAGEMENT (FIR/A)
+    # ========================================================================
+
+    async def establish_trust(
+        self,
+        initiator: str,
+        responder: str,
+        roles: Optional[List[str]] = None,
+        context: Optional[Dict[str, Any]] = None,
+        trust_level: int = 1,
+        generate_keys: bool = False
+    ) -> FIRARelationship:
+        """Establish trust relationship (FIR/A), see TibetBettiClient.establish_trust"""
+        did, hid = _generate_keys() if generate_keys else (None, None)
+
+        payload = _trust_payload(initiator, responder, roles, context, trust_level, did, hid)
+
+        logger.info(f"Establishing trust: {initiator} ←→ {responder}")
+
+        response = await self._request(
+            "POST",
+            f"{self.betti_url}/fira/init",
+            payload
+        )
+
+        fir_a_id = response["fir_a_id"]
+        continuity_hash = response["continuity_hash"]
+
+        # Track hash
+        self._continuity_hashes[fir_a_id] = continuity_hash
+
+        logger.info(f"Trust established: {fir_a_id}")
+
+        return FIRARelationship(
+            id=fir_a_id,
+            token=fir_a_id,  # Token is the FIR/A ID
+            initiator=initiator,
+            responder=responder,
+            trust_level=trust_level,
+            continuity_hash=continuity_hash,
+            did_key=did,
+            hid_key=hid
+        )
+
+    async def get_relationship(self, fir_a_id: str) -> FIRARelationship:
+        """Get existing relationship details"""
+        response = await self._request(
+            "GET",
+            f"{self.betti_url}/relation/{fir_a_id}"
+        )
+
+        return FIRARelationship(
+            id=response["fir_a_id"],
+            token=response["fir_a_id"],
+            continuity_hash=response["continuity_hash"],
+            initiator=response.get("initiator"),
+            responder=response.get("responder")
+        )
+
+    # ========================================================================
+    # TIBET INTENT SENDING
+    # ========================================================================
+
+    async def send_tibet(
+        self,
+        relationship_id: str,
+        intent: str,
+        context: Optional[Dict[str, Any]] = None,
+        time_window: Optional[TimeWindow] = None,
+        constraints: Optional[Constraints] = None,
+        humotica: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Send TIBET intent, see TibetBettiClient.send_tibet"""
+        tibet = Tibet(
+            intent=intent,
+            context=context or {},
+            time_window=time_window or TimeWindow.immediate(),
+            constraints=constraints or Constraints(),
+            humotica=humotica
+        )
+
+        lock = self._chain_locks.get(relationship_id)
+        if lock is None:
+            lock = self._chain_locks[relationship_id] = asyncio.Lock()
+
+        async with lock:
+            payload = {
+                "fir_a_id": relationship_id,
+                "intent": tibet.intent,
+                "context": tibet.context,
+                "timebox_seconds": tibet.time_window.duration_seconds(),
+                "continuity_hash_prev": self._continuity_hashes.get(relationship_id)
+            }
+
+            logger.info(f"Sending TIBET: {intent} via FIR/A {relationship_id}")
+
+            response = await self._request(
+                "POST",
+                f"{self.betti_url}/ift",
+                payload
+            )
+
+            # Update hash
+            new_hash = response["continuity_hash"]
+            self._continuity_hashes[relationship_id] = new_hash
+
+        logger.info(f"TIBET accepted. New hash: {new_hash[:8]}...")
+
+        return {
+            "status": "accepted",
+            "fir_a_id": response["fir_a_id"],
+            "continuity_hash": new_hash,
+            "events": response["events"]
+        }
+
+    # ========================================================================
+    # KIT API INTEGRATION (Context & Sense)
+    # ========================================================================
+
+    def _require_kit(self, message: str = "KIT URL not configured"):
+        if not self.kit_url:
+            raise ValueError(message)
+
+    async def update_context(
+        self,
+        user_id: str,
+        context_data: Dict[str, Any],
+        evaluate_sense: bool = True
+    ) -> Dict[str, Any]:
+        """Update user context in KIT"""
+        self._require_kit()
+
+        payload = {
+            "user_id": user_id,
+            "context": context_data,
+            "evaluate_sense": evaluate_sense
+        }
+
+        logger.info(f"Updating context for user {user_id}")
+
+        return await self._request(
+            "POST",
+            f"{self.kit_url}/context/update",
+            payload
+        )
+
+    async def get_context(self, user_id: str) -> Context:
+        """Get user context from KIT"""
+        self._require_kit()
+
+        response = await self._request(
+            "GET",
+            f"{self.kit_url}/context/{user_id}"
+        )
+
+        return Context.from_dict(response)
+
+    async def create_sense_rule(
+        self,
+        name: str,
+        conditions: Dict[str, Any],
+        intent: str,
+        priority: int = 5
+    ) -> SenseRule:
+        """Create sense rule in KIT"""
+        self._require_kit()
+
+        payload = {
+            "name": name,
+            "conditions": conditions,
+            "intent": intent,
+            "priority": priority
+        }
+
+        logger.info(f"Creating sense rule: {name} → {intent}")
+
+        response = await self._request(
+            "POST",
+            f"{self.kit_url}/sense/rules",
+            payload
+        )
+
+        return SenseRule.from_dict(response)
+
+    async def evaluate_sense(
+        self,
+        user_id: str,
+        context_data: Optional[Dict[str, Any]] = None
+    ) -> List[str]:
+        """Evaluate sense rules for user, returns triggered intents"""
+        self._require_kit()
+
+        payload = {
+            "user_id": user_id,
+            "context": context_data
+        }
+
+        response = await self._request(
+            "POST",
+            f"{self.kit_url}/sense/evaluate",
+            payload
+        )
+
+        return response.get("triggered_intents", [])
+
+    # ========================================================================
+    # COMBINED: Context → Sense → TIBET
+    # ========================================================================
+
+    async def context_to_tibet(
+        self,
+        relationship_id: str,
+        user_id: str,
+        context_update: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Complete flow: Update context → Evaluate sense → Send TIBETs
+
+        The TIBET sends are issued together with asyncio.gather; sends on
+        the same FIR/A still chain their continuity hashes in intent order.
+        """
+        self._require_kit("KIT URL required for context_to_tibet")
+
+        # 1. Update context
+        logger.info(f"Updating context for {user_id}")
+        await self.update_context(user_id, context_update, evaluate_sense=False)
+
+        # 2. Evaluate sense rules
+        logger.info(f"Evaluating sense rules")
+        triggered_intents = await self.evaluate_sense(user_id)
+
+        # 3. Send TIBET for each triggered intent
+        context = {"user_id": user_id, "triggered_by": "sense_rule"}
+        context.update(context_update)
+        humotica = f"Auto-triggered by sense rule based on context update: {context_update}"
+
+        results = await asyncio.gather(*[
+            self.send_tibet(
+                relationship_id=relationship_id,
+                intent=intent,
+                context=context,
+                humotica=humotica
+            )
+            for intent in triggered_intents
+        ])
+
+        logger.info(f"Sent {len(results)} TIBETs from sense evaluation")
+
+        return list(results)
+
+    # ========================================================================
+    # UTILITIES
+    # ========================================================================
+
+    async def health_check(self) -> Dict[str, Any]:
+        """Check BETTI router health"""
+        return await self._request("GET", f"{self.betti_url}/health")
+
+    async def kit_health_check(self) -> Dict[str, Any]:
+        """Check KIT API health"""
+        self._require_kit()
+        return await self._request("GET", f"{self.kit_url}/health")
+
+    # ========================================================================
+    # BETTI INTENT EXECUTION (with BALANS Security Pipeline)
+    # ========================================================================
+
+    async def execute_intent(
+        self,
+        intent: str,
+        context: Dict[str, Any],
+        user_id: str,
+        fira_id: Optional[str] = None,
+        urgency: int = 5,
+        deadline: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Execute intent through BETTI security pipeline, see TibetBettiClient.execute_intent"""
+        self._require_kit("KIT URL required for intent execution")
+
+        payload = _intent_payload(intent, context, user_id, fira_id, urgency, deadline)
+
+        logger.info(f"Executing intent: {intent} (urgency={urgency})")
+
+        response = await self._request(
+            "POST",
+            f"{self.kit_url}/betti/intent/execute",
+            payload
+        )
+
+        # Log BALANS decision
+        _log_execution_status(response)
+
+        return response
+
+    async def clarify_intent(
+        self,
+        intent: str,
+        clarification: str,
+        context: Dict[str, Any],
+        user_id: str
+    ) -> Dict[str, Any]:
+        """Provide clarification for ambiguous intent"""
+        updated_context = context.copy()
+        updated_context["clarification"] = clarification
+        updated_context["clarified"] = True
+
+        return await self.execute_intent(
+            intent=intent,
+            context=updated_context,
+            user_id=user_id
+        )
+
+    async def approve_resource_request(
+        self,
+        intent: str,
+        context: Dict[str, Any],
+        user_id: str,
+        approved: bool
+    ) -> Dict[str, Any]:
+        """Approve or deny robot's resource request (Internal TIBET)"""
+        if not approved:
+            # User denied - return cancellation
+            return {
+                "status": "cancelled",
+                "result": {
+                    "message": "User denied resource request",
+                    "warmth": "neutral",
+                    "color": "blue"
+                }
+            }
+
+        # Re-execute after approval
+        updated_context = context.copy()
+        updated_context["resource_request_approved"] = True
+        updated_context["retry_after_resources"] = True
+        return await self.execute_intent(
+            intent=intent,
+            context=updated_context,
+            user_id=user_id
+        )
+
+    # ========================================================================
+    # BALANS ANALYTICS & MONITORING
+    # ========================================================================
+
+    async def get_balans_decisions(
+        self,
+        did: str,
+        limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """Get BALANS decision history for device"""
+        self._require_kit("KIT URL required")
+
+        response = await self._request(
+            "GET",
+            f"{self.kit_url}/betti/balans/decisions/{did}",
+            params={"limit": limit}
+        )
+
+        return response.get("decisions", [])
+
+    async def get_balans_dashboard(self, days: int = 30) -> Dict[str, Any]:
+        """Get BALANS analytics dashboard"""
+        self._require_kit("KIT URL required")
+
+        return await self._request(
+            "GET",
+            f"{self.kit_url}/betti/balans/dashboard",
+            params={"days": days}
+        )
+
+    # ========================================================================
+    # SNAFT - Factory Firewall
+    # ========================================================================
+
+    async def get_snaft_rules(
+        self,
+        device_type: Optional[str] = None,
+        manufacturer: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Get SNAFT factory firewall rules"""
+        self._require_kit("KIT URL required")
+
+        params = {}
+        if device_type:
+            params["device_type"] = device_type
+        if manufacturer:
+            params["manufacturer"] = manufacturer
+
+        response = await self._request(
+            "GET",
+            f"{self.kit_url}/betti/snaft/rules",
+            params=params
+        )
+
+        return response.get("rules", [])
+
+    async def get_snaft_violations(
+        self,
+        did: str,
+        limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """Get SNAFT violation history for device"""
+        self._require_kit("KIT URL required")
+
+        response = await self._request(
+            "GET",
+            f"{self.kit_url}/betti/snaft/violations/{did}",
+            params={"limit": limit}
+        )
+
+        return response.get("violations", [])
+
+    async def get_snaft_dashboard(self, days: int = 30) -> Dict[str, Any]:
+        """Get SNAFT violation analytics"""
+        self._require_kit("KIT URL required")
+
+        return await self._request(
+            "GET",
+            f"{self.kit_url}/betti/snaft/dashboard",
+            params={"days": days}
+        )
+
+    # ========================================================================
+    # BETTI COMPLEXITY ANALYSIS
+    # ========================================================================
+
+    async def analyze_complexity(
+        self,
+        intent: str,
+        context: Dict[str, Any],
+        threshold_profile: str = "default"
+    ) -> Dict[str, Any]:
+        """Analyze complexity of intent WITHOUT executing"""
+        self._require_kit("KIT URL required")
+
+        payload = {
+            "intent": intent,
+            "context": context,
+            "threshold_profile": threshold_profile
+        }
+
+        return await self._request(
+            "POST",
+            f"{self.kit_url}/betti/complexity/analyze",
+            payload
+        )
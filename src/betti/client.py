@@ -6,38 +6,209 @@ Integrates with:
 2. KIT API - For context/sense and AI control
 """
 
+import copy
+import hashlib
+import importlib.util
 import logging
-from typing import Any, Dict, List, Optional
-from datetime import datetime, timedelta
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
 
 import requests
-
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+from ._compat import _dumps, _dumps_sorted, _loads
 from .tibet import Tibet, TimeWindow, Constraints
 from .context import Context, SenseRule
-from .trust_token import TrustToken, FIRARelationship
-from .websocket import TibetWebSocket
+from .trust_token import TrustToken, TrustLevel, FIRARelationship
+
+if TYPE_CHECKING:
+    from .websocket import TibetWebSocket
 
 logger = logging.getLogger(__name__)
 
-# Optional crypto imports - only needed if generating keys
-DIDKey = None
-HIDKey = None
+# HTTP status errors raised by raise_for_status() of either transport
+_HTTP_ERRORS = (requests.HTTPError, httpx.HTTPStatusError) if HAS_HTTPX else (requests.HTTPError,)
+# Any request failure (status, connection, timeout) of either transport
+_TRANSPORT_ERRORS = (
+    (requests.RequestException, httpx.HTTPError) if HAS_HTTPX else (requests.RequestException,)
+)
+
+# Optional crypto imports - only needed if generating keys.
+# Resolved once: (DIDKey, HIDKey), or (None, None) if unavailable.
+_CRYPTO_CACHE: Optional[Tuple[Any, Any]] = None
+_CRYPTO_LOCK = threading.Lock()
+_CRYPTO_PATH = os.path.join(os.path.dirname(__file__), '..', 'jis_client', 'crypto.py')
+
+def _import_crypto() -> Tuple[Any, Any]:
+    """Lazy import crypto modules (thread-safe, attempted only once)"""
+    global _CRYPTO_CACHE
+    if _CRYPTO_CACHE is not None:
+        return _CRYPTO_CACHE
+
+    with _CRYPTO_LOCK:
+        if _CRYPTO_CACHE is None:
+            try:
+                if os.path.isfile(_CRYPTO_PATH):
+                    # Load jis_client/crypto.py by path, without touching sys.path
+                    spec = importlib.util.spec_from_file_location("jis_client_crypto", _CRYPTO_PATH)
+                    crypto = importlib.util.module_from_spec(spec)
+                    spec.loader.exec_module(crypto)
+                else:
+                    import crypto
+                _CRYPTO_CACHE = (crypto.DIDKey, crypto.HIDKey)
+            except (ImportError, AttributeError) as e:
+                logger.warning(f"Crypto modules not available: {e}")
+                logger.warning(
+                    "Key generation will be disabled. Install cryptography package if needed."
+                )
+                _CRYPTO_CACHE = (None, None)
+    return _CRYPTO_CACHE
+
+
+def _base_url(url: str) -> str:
+    """Normalise a service base URL; reject malformed ones at construction time"""
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.netloc or parts.query or parts.fragment:
+        raise ValueError(f"Invalid base URL (expected http(s)://host[:port][/path]): {url!r}")
+    return url.rstrip('/')
+
+
+def _generate_keys():
+    """Generate DID/HID keypair, or (None, None) when crypto is unavailable"""
+    DIDKey_cls, HIDKey_cls = _import_crypto()
+    if DIDKey_cls and HIDKey_cls:
+        return DIDKey_cls.generate(), HIDKey_cls.generate()
+    logger.warning("Cannot generate keys - crypto modules not available")
+    return None, None
+
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last formatted timestamp
+_iso_second = (None, "")
+
+def _utc_iso_now() -> str:
+    """UTC now as ISO 8601 with microseconds, same as datetime.utcnow().isoformat()"""
+    global _iso_second
+    t = time.time()
+    sec = int(t)
+    cached = _iso_second
+    if cached[0] != sec:
+        cached = _iso_second = (sec, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec)))
+    return f"{cached[1]}.{int((t - sec) * 1_000_000):06d}"
+
+
+def _trust_payload(
+    initiator: str,
+    responder: str,
+    roles: Optional[List[str]],
+    context: Optional[Dict[str, Any]],
+    trust_level: int,
+    did: Any = None,
+    hid: Any = None
+) -> Dict[str, Any]:
+    """Build the /fira/init payload (raises ValueError for a trust_level outside 0-5)"""
+    # Validated here, before the POST, so a bad level never creates a FIR/A
+    trust_level = TrustLevel(trust_level)
+
+    ctx = context.copy() if context else {}
+    ctx["trust_level"] = trust_level
+    ctx["established_at"] = _utc_iso_now()
+
+    payload = {
+        "initiator": initiator,
+        "responder": responder,
+        "roles": roles or ["client", "service"],
+        "context": ctx
+    }
+
+    # Add DID if generated
+    if did:
+        payload["initiator_did"] = {
+            "did_public": did.export_public()
+        }
+
+        if hid:
+            payload["initiator_did"]["hid_did_binding"] = hid.derive_did_binding(did)
+
+    return payload
+
+
+def _intent_payload(
+    intent: str,
+    context: Dict[str, Any],
+    user_id: str,
+    fira_id: Optional[str] = None,
+    urgency: int = 5,
+    deadline: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build the /betti/intent/execute payload"""
+    ctx = context.copy()
+    ctx["urgency"] = urgency
+    if deadline:
+        ctx["deadline"] = deadline
+
+    payload = {
+        "intent": intent,
+        "context": ctx,
+        "user_id": user_id
+    }
+
+    if fira_id:
+        payload["fira_id"] = fira_id
+
+    return payload
+
+
+# execute_intent status -> (log level, message); fields come from response["result"]
+_STATUS_LOG = {
+    "snaft_blocked": (logging.WARNING, "🚫 SNAFT blocked: {reason}"),
+    "clarification_needed": (logging.INFO, "❓ Clarification needed: {message}"),
+    "awaiting_resources": (logging.INFO, "🔋 Awaiting resources: {robot_request}"),
+    "delayed": (logging.INFO, "⏰ Delayed: {message}"),
+    "rejected": (logging.WARNING, "❌ Rejected: {message}"),
+    "split_required": (logging.INFO, "📋 Split required (complexity: {complexity_score})"),
+    "executed": (logging.INFO, "✓ Executed (warmth={warmth}, color={color})"),
+}
+
+
+class _LogFields(dict):
+    """result dict for format_map: missing fields become None or their default"""
+
+    _DEFAULTS = {"warmth": "neutral", "color": "green"}
+
+    def __missing__(self, key):
+        if key == "complexity_score":
+            return self.get("complexity", {}).get("score")
+        return self._DEFAULTS.get(key)
 
-def _import_crypto():
-    """Lazy import crypto modules"""
-    global DIDKey, HIDKey
-    if DIDKey is None:
-        try:
-            import sys
-            import os
-            sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'jis_client'))
-            from crypto import DIDKey as _DIDKey, HIDKey as _HIDKey
-            DIDKey = _DIDKey
-            HIDKey = _HIDKey
-        except ImportError as e:
-            logger.warning(f"Crypto modules not available: {e}")
-            logger.warning("Key generation will be disabled. Install cryptography package if needed.")
-    return DIDKey, HIDKey
+
+def _log_execution_status(response: Dict[str, Any]):
+    """Log BALANS decision of an execute_intent response"""
+    entry = _STATUS_LOG.get(response.get("status"))
+    if entry is None:
+        return
+
+    level, fmt = entry
+    if logger.isEnabledFor(level):
+        logger.log(level, fmt.format_map(_LogFields(response.get("result", {}))))
 
 
 class TibetBettiClient:
@@ -67,13 +238,37 @@ class TibetBettiClient:
         ... )
     """
 
+    # How long an established FIR/A is reused for identical establish_trust calls
+    TRUST_CACHE_TTL_S = 300.0
+    MAX_TRUST_ENTRIES = 1_000  # FIR/As kept for reuse (LRU)
+
+    # TTLs (seconds) of the read-mostly analytics endpoints, see _cached_get
+    SNAFT_RULES_TTL_S = 300.0
+    DASHBOARD_TTL_S = 60.0
+    COMPLEXITY_TTL_S = 30.0
+
+    # Cached reads that prefetch() may start in the background
+    _PREFETCHABLE = frozenset([
+        "get_snaft_rules",
+        "get_balans_dashboard",
+        "get_snaft_dashboard",
+        "analyze_complexity"
+    ])
+
+    # Identical send_tibet() calls (same FIR/A, intent, context and timebox)
+    # within this many seconds return the first response instead of sending
+    # again (0 disables), e.g. to absorb a flaky sensor repeating its trigger
+    TIBET_DEDUPE_S = 0.0
+    MAX_DEDUPE_ENTRIES = 10_000
+
     def __init__(
         self,
         betti_url: str,
         kit_url: Optional[str] = None,
         secret: Optional[str] = None,
         jwt_token: Optional[str] = None,
-        timeout: int = 30
+        timeout: int = 30,
+        transport: str = "requests"
     ):
         """
         Initialize TIBET-BETTI Client
@@ -84,30 +279,193 @@ class TibetBettiClient:
             secret: Shared secret for authentication
             jwt_token: JWT token (alternative to secret)
             timeout: Request timeout in seconds
+            transport: "requests" (HTTP/1.1) or "httpx" (HTTP/2, multiplexes
+                concurrent calls over one connection per host; needs httpx[http2])
         """
-        self.betti_url = betti_url.rstrip('/')
-        self.kit_url = kit_url.rstrip('/') if kit_url else None
+        if transport not in ("requests", "httpx"):
+            raise ValueError(f"Unknown transport: {transport}")
+        if transport == "httpx" and not HAS_HTTPX:
+            raise ImportError(
+                "httpx not installed. "
+                "Install with: pip install 'httpx[http2]'"
+            )
+
+        self.betti_url = _base_url(betti_url)
+        self.kit_url = _base_url(kit_url) if kit_url else None
+        self._build_urls()
         self.secret = secret
         self.jwt_token = jwt_token
         self.timeout = timeout
 
-        # HTTP session
-        self.session = requests.Session()
-
-        # Track continuity hashes for FIR/As
+        # HTTP session - one keep-alive pool shared by BETTI and KIT calls
+        self.transport = transport
+        if transport == "httpx":
+            limits = httpx.Limits(max_connections=16, max_keepalive_connections=8)
+            self.session = httpx.Client(
+                # retries= only covers failed connects, never a sent request
+                transport=httpx.HTTPTransport(http2=True, limits=limits, retries=2),
+                headers={"Content-Type": "application/json"}
+            )
+            self._body_kw = "content"
+        else:
+            self.session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=64,
+                max_retries=Retry(
+                    total=2,
+                    read=0,  # never resend a request the server may have processed
+                    backoff_factor=0.1,
+                    status_forcelist=[502, 503, 504],
+                    # POSTs (/ift, /fira/init, execute) may already be applied
+                    # behind a gateway error: only GETs are resent on a status
+                    allowed_methods=frozenset(["GET"]),
+                    # Out of retries: return the response, so raise_for_status()
+                    # still raises HTTPError (not RetryError) for the 404 probes
+                    raise_on_status=False
+                )
+            )
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+            self.session.headers.update({
+                "Content-Type": "application/json",
+                "Connection": "keep-alive"
+            })
+            self._body_kw = "data"
+        self.session.headers.update(self._headers())
+
+        # Continuity hash and chain lock per FIR/A, kept until forget_relationship().
+        # Never evicted: a TIBET sent without its previous hash breaks the chain.
         self._continuity_hashes: Dict[str, str] = {}
+        self._chain_locks: Dict[str, threading.RLock] = {}
+        self._hash_lock = threading.Lock()
+        self._hash_hits = 0
+        self._hash_misses = 0
+
+        # (initiator, responder, trust_level, roles) -> (FIRARelationship, monotonic ts),
+        # LRU bounded by MAX_TRUST_ENTRIES, guarded by _cache_lock
+        self._trust_cache: "OrderedDict[Tuple, Tuple[FIRARelationship, float]]" = OrderedDict()
+
+        # (url, params...) -> (monotonic ts, response) for _cached_get/_cached_post
+        self._ttl_cache: Dict[Tuple, Tuple[float, Any]] = {}
+        self._cache_lock = threading.Lock()
+        self._prefetch_pool: Optional[ThreadPoolExecutor] = None
+
+        # (url, canonical params) -> [Future of the GET on the wire, number of waiters]
+        self._inflight: Dict[Tuple[str, Optional[bytes]], List[Any]] = {}
+        self._inflight_lock = threading.Lock()
+
+        # digest of a sent TIBET -> (monotonic ts, response), see TIBET_DEDUPE_S
+        self._recent_tibets: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+        # Whether BETTI serves /ift/batch (None = not probed yet)
+        self._ift_batch: Optional[bool] = None
+
+        # Whether KIT serves /betti/execute/batch (None = not probed yet)
+        self._execute_batch: Optional[bool] = None
+
+        # Whether KIT serves the fused /context_to_tibet (None = not probed yet)
+        self._supports_fused: Optional[bool] = None
 
         # WebSocket connection (lazy init)
-        self._ws: Optional[TibetWebSocket] = None
+        self._ws: Optional["TibetWebSocket"] = None
 
         logger.info(f"TibetBettiClient initialized")
         logger.info(f"  BETTI Router: {self.betti_url}")
         if self.kit_url:
             logger.info(f"  KIT API: {self.kit_url}")
 
+    def _build_urls(self):
+        """
+        Precompute endpoint URLs (call again after changing betti_url/kit_url)
+
+        Per-resource endpoints are stored as prefixes (prefix + id) and query
+        strings go through params=, so no URL is formatted per request.
+        """
+        self._url_fira_init = f"{self.betti_url}/fira/init"
+        self._url_relation_prefix = f"{self.betti_url}/relation/"
+        self._url_ift = f"{self.betti_url}/ift"
+        self._url_ift_batch = f"{self.betti_url}/ift/batch"
+        self._url_betti_health = f"{self.betti_url}/health"
+        if self.kit_url:
+            self._url_kit_health = f"{self.kit_url}/health"
+            self._url_ctx_update = f"{self.kit_url}/context/update"
+            self._url_ctx_prefix = f"{self.kit_url}/context/"
+            self._url_sense_rules = f"{self.kit_url}/sense/rules"
+            self._url_sense_eval = f"{self.kit_url}/sense/evaluate"
+            self._url_ctx_to_tibet = f"{self.kit_url}/context_to_tibet"
+            self._url_intent_exec = f"{self.kit_url}/betti/intent/execute"
+            self._url_intent_exec_batch = f"{self.kit_url}/betti/execute/batch"
+            self._url_balans_decisions_prefix = f"{self.kit_url}/betti/balans/decisions/"
+            self._url_balans_dashboard = f"{self.kit_url}/betti/balans/dashboard"
+            self._url_snaft_rules = f"{self.kit_url}/betti/snaft/rules"
+            self._url_snaft_violations_prefix = f"{self.kit_url}/betti/snaft/violations/"
+            self._url_snaft_dashboard = f"{self.kit_url}/betti/snaft/dashboard"
+            self._url_complexity = f"{self.kit_url}/betti/complexity/analyze"
+
+    def __enter__(self) -> "TibetBettiClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Close WebSocket and HTTP session, releasing pooled connections"""
+        self.close_websocket()
+        if self._prefetch_pool is not None:
+            self._prefetch_pool.shutdown(wait=False)
+            self._prefetch_pool = None
+        self.session.close()
+
+    def _chain_lock(self, relationship_id: str) -> threading.RLock:
+        """
+        Lock held from reading a FIR/A's previous hash until its new hash is stored
+
+        One per FIR/A, so a send only ever waits for sends on the same chain.
+        """
+        lock = self._chain_locks.get(relationship_id)
+        if lock is None:
+            with self._hash_lock:
+                lock = self._chain_locks.setdefault(relationship_id, threading.RLock())
+        return lock
+
+    def _prev_hash(self, relationship_id: str) -> Optional[str]:
+        with self._hash_lock:
+            continuity_hash = self._continuity_hashes.get(relationship_id)
+            if continuity_hash is None:
+                self._hash_misses += 1
+            else:
+                self._hash_hits += 1
+            return continuity_hash
+
+    def _store_hash(self, relationship_id: str, continuity_hash: str):
+        with self._hash_lock:
+            self._continuity_hashes[relationship_id] = continuity_hash
+
+    def forget_relationship(self, relationship_id: str):
+        """Drop a FIR/A's continuity hash and chain lock once it is no longer used"""
+        with self._hash_lock:
+            self._continuity_hashes.pop(relationship_id, None)
+            self._chain_locks.pop(relationship_id, None)
+
+    def clear_continuity_hashes(self):
+        """Forget all tracked continuity hashes (next TIBET per FIR/A sends no prev hash)"""
+        with self._hash_lock:
+            self._continuity_hashes.clear()
+            self._chain_locks.clear()
+
+    def get_hash_cache_stats(self) -> Dict[str, int]:
+        """Continuity hash lookups that found/missed a hash, and FIR/As tracked"""
+        with self._hash_lock:
+            return {
+                "hits": self._hash_hits,
+                "misses": self._hash_misses,
+                "size": len(self._continuity_hashes)
+            }
+
     def _headers(self) -> Dict[str, str]:
-        """Build request headers"""
-        headers = {"Content-Type": "application/json"}
+        """Build auth headers (Content-Type is a session default)"""
+        headers = {}
 
         if self.jwt_token:
             headers["Authorization"] = f"Bearer {self.jwt_token}"
@@ -116,29 +474,274 @@ class TibetBettiClient:
 
         return headers
 
+    def set_jwt_token(self, jwt_token: Optional[str]):
+        """Switch auth to a (new) JWT token; takes effect on the next request"""
+        self.jwt_token = jwt_token
+        for key in ("Authorization", "X-JIS-SECRET"):
+            self.session.headers.pop(key, None)
+        self.session.headers.update(self._headers())
+
     def _request(
         self,
         method: str,
         url: str,
-        json_data: Optional[Dict] = None
-    ) -> Dict[str, Any]:
-        """Make HTTP request"""
+        json_data: Optional[Dict] = None,
+        params: Optional[Dict[str, Any]] = None,
+        parse_json: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Make HTTP request (parse_json=False: check status only, return None)
+
+        Identical GETs issued concurrently share one request: later callers
+        wait for the in-flight one and each get their own copy of the response.
+        Other methods may have side effects and always go out.
+        """
+        if method != "GET" or not parse_json:
+            return self._send(method, url, json_data, params, parse_json)
+
+        key = (url, _dumps_sorted(params) if params else None)
+        with self._inflight_lock:
+            entry = self._inflight.get(key)
+            leader = entry is None
+            if leader:
+                entry = self._inflight[key] = [Future(), 0]
+            else:
+                entry[1] += 1
+        future = entry[0]
+
+        if not leader:
+            return copy.deepcopy(future.result())
+
+        try:
+            response = self._send(method, url, json_data, params, parse_json)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(response)
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+        # With waiters, the future keeps the original for them to copy
+        return copy.deepcopy(response) if entry[1] else response
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        json_data: Optional[Dict],
+        params: Optional[Dict[str, Any]],
+        parse_json: bool
+    ) -> Optional[Dict[str, Any]]:
+        """One HTTP round-trip through the session"""
         response = self.session.request(
             method=method,
             url=url,
-            json=json_data,
-            headers=self._headers(),
-            timeout=self.timeout
+            params=params,
+            timeout=self.timeout,
+            **{self._body_kw: _dumps(json_data) if json_data is not None else None}
         )
 
         try:
             response.raise_for_status()
-        except requests.HTTPError as e:
+        except _HTTP_ERRORS as e:
             logger.error(f"Request failed: {method} {url} - {e}")
             logger.error(f"Response: {response.text}")
             raise
 
-        return response.json()
+        if not parse_json:
+            return None
+
+        return _loads(response.content)
+
+    def _iter_items(
+        self,
+        url: str,
+        key: str,
+        params: Optional[Dict[str, Any]] = None,
+        page: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Any]:
+        """
+        Yield the items of the JSON array at response[key] one by one
+
+        Streams with ijson when installed (requests transport), so the full
+        array is never held in memory; otherwise falls back to a normal _request.
+        If page is given, the response's top-level next_cursor is stored in it.
+        """
+        if not HAS_IJSON or self.transport != "requests":
+            response = self._request("GET", url, params=params)
+            if page is not None:
+                page["next_cursor"] = response.get("next_cursor")
+            yield from response.get(key, [])
+            return
+
+        with self.session.get(url, params=params, stream=True, timeout=self.timeout) as response:
+            try:
+                response.raise_for_status()
+            except _HTTP_ERRORS as e:
+                logger.error(f"Request failed: GET {url} - {e}")
+                logger.error(f"Response: {response.text}")
+                raise
+
+            response.raw.decode_content = True
+            if page is None:
+                yield from ijson.items(response.raw, f"{key}.item", use_float=True)
+                return
+
+            # Same as ijson.items, but also picks up next_cursor wherever it appears
+            item_prefix = f"{key}.item"
+            builder = None
+            for prefix, event, value in ijson.parse(response.raw, use_float=True):
+                if builder is not None:
+                    builder.event(event, value)
+                    if prefix == item_prefix and event in ("end_map", "end_array"):
+                        yield builder.value
+                        builder = None
+                elif prefix == item_prefix:
+                    if event in ("start_map", "start_array"):
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                    else:
+                        yield value
+                elif prefix == "next_cursor":
+                    page["next_cursor"] = value
+
+    def _iter_pages(
+        self,
+        url: str,
+        key: str,
+        params: Dict[str, Any],
+        page_size: int,
+        limit: Optional[int] = None
+    ) -> Iterator[Any]:
+        """
+        Follow next_cursor pages of `key` items, at most `limit` items in total
+
+        A full first page without a next_cursor means the server does not
+        paginate and may have cut the list at page_size: the rest then comes
+        from one unpaginated request, as the get_* methods send it.
+        """
+        cursor = None
+        count = 0
+
+        while True:
+            page_params = dict(params)
+            page_params["limit"] = page_size if limit is None else min(page_size, limit - count)
+            if cursor:
+                page_params["cursor"] = cursor
+
+            page: Dict[str, Any] = {}
+            page_count = 0
+            for item in self._iter_items(url, key, page_params, page):
+                yield item
+                page_count += 1
+            count += page_count
+
+            if limit is not None and count >= limit:
+                return
+
+            first_page = cursor is None
+            cursor = page.get("next_cursor")
+            if not cursor:
+                if first_page and page_count >= page_params["limit"]:
+                    full_params = dict(params)
+                    if limit is not None:
+                        full_params["limit"] = limit
+                    yield from islice(self._iter_items(url, key, full_params), count, None)
+                return
+
+    def _cached(self, key: Tuple, ttl: float, fetch: Callable[[], Any]) -> Any:
+        """
+        Return a fresh cached response for key, or fetch it
+
+        A miss stores a Future first, so concurrent callers (and prefetch())
+        wait for the one in-flight request instead of issuing their own.
+        The cached response stays private: every caller gets a deep copy.
+        """
+        future = None
+        with self._cache_lock:
+            entry = self._ttl_cache.get(key)
+            if entry is not None and time.monotonic() - entry[0] < ttl:
+                value = entry[1]
+            else:
+                future = Future()
+                self._ttl_cache[key] = (time.monotonic(), future)
+
+        if future is None:
+            return copy.deepcopy(value.result() if isinstance(value, Future) else value)
+
+        try:
+            response = fetch()
+        except BaseException as e:
+            with self._cache_lock:
+                if self._ttl_cache.get(key, (None, None))[1] is future:
+                    del self._ttl_cache[key]
+            future.set_exception(e)
+            raise
+
+        with self._cache_lock:
+            if self._ttl_cache.get(key, (None, None))[1] is future:
+                self._ttl_cache[key] = (time.monotonic(), response)
+        future.set_result(response)
+        return copy.deepcopy(response)
+
+    def _cached_get(self, url: str, params: Dict[str, Any], ttl: float) -> Dict[str, Any]:
+        """GET through the TTL cache (each call returns its own copy)"""
+        key = (url, tuple(sorted(params.items())))
+        return self._cached(key, ttl, lambda: self._request("GET", url, params=params))
+
+    def _cached_post(self, url: str, payload: Dict[str, Any], ttl: float) -> Dict[str, Any]:
+        """Side-effect-free POST through the TTL cache, keyed on the canonical payload"""
+        key = (url, _dumps_sorted(payload))
+        return self._cached(key, ttl, lambda: self._request("POST", url, payload))
+
+    def prefetch(self, method_name: str, *args, **kwargs) -> Future:
+        """
+        Start a cached read in the background
+
+        A later call with the same arguments waits for (or reuses) this
+        result instead of sending its own request.
+
+        Args:
+            method_name: One of get_snaft_rules, get_balans_dashboard,
+                get_snaft_dashboard, analyze_complexity
+            *args, **kwargs: Arguments for that method
+
+        Example:
+            >>> client.prefetch("get_balans_dashboard", days=7)
+            >>> ...  # other work
+            >>> dashboard = client.get_balans_dashboard(days=7)  # no extra RTT
+        """
+        if method_name not in self._PREFETCHABLE:
+            raise ValueError(f"Cannot prefetch {method_name}")
+
+        if self._prefetch_pool is None:
+            self._prefetch_pool = ThreadPoolExecutor(
+                max_workers=4,
+                thread_name_prefix="betti-prefetch"
+            )
+        return self._prefetch_pool.submit(getattr(self, method_name), *args, **kwargs)
+
+    def invalidate_cache(self, prefix: Optional[str] = None):
+        """
+        Drop cached analytics responses
+
+        Args:
+            prefix: Only drop entries whose URL starts with this (None = all)
+        """
+        if prefix is None:
+            with self._cache_lock:
+                self._ttl_cache.clear()
+            return
+        with self._cache_lock:
+            for key in [k for k in self._ttl_cache if k[0].startswith(prefix)]:
+                del self._ttl_cache[key]
+
+    def _invalidate_dashboards(self):
+        """Executed intents change BALANS/SNAFT statistics"""
+        if self.kit_url:
+            self.invalidate_cache(self._url_balans_dashboard)
+            self.invalidate_cache(self._url_snaft_dashboard)
 
     # ========================================================================
     # TRUST TOKEN MANAGEMENT (FIR/A)
@@ -167,51 +770,35 @@ class TibetBettiClient:
             generate_keys: Auto-generate DID/HID keys (requires cryptography package)
 
         Returns:
-            FIRARelationship with token
+            FIRARelationship with token (a new object on every call, also
+            when a recent identical FIR/A is reused)
 
         Example:
             >>> rel = client.establish_trust("my_phone", "my_car")
             >>> print(rel.token)  # Trust token ID
         """
-        # Generate keys if requested
-        did = None
-        hid = None
-
-        if generate_keys:
-            DIDKey_cls, HIDKey_cls = _import_crypto()
-            if DIDKey_cls and HIDKey_cls:
-                did = DIDKey_cls.generate()
-                hid = HIDKey_cls.generate()
-            else:
-                logger.warning("Cannot generate keys - crypto modules not available")
+        # Reuse a recent identical FIR/A; fresh keys or extra context always POST
+        cache_key = None
+        if not generate_keys and not context:
+            # Roles are sent in order, so their order is part of the key
+            cache_key = (initiator, responder, trust_level, tuple(roles or ["client", "service"]))
+            with self._cache_lock:
+                cached = self._trust_cache.get(cache_key)
+                if cached is not None and time.monotonic() - cached[1] < self.TRUST_CACHE_TTL_S:
+                    self._trust_cache.move_to_end(cache_key)
+                    return copy.copy(cached[0])
 
-        # Build payload
-        payload = {
-            "initiator": initiator,
-            "responder": responder,
-            "roles": roles or ["client", "service"],
-            "context": {
-                **(context or {}),
-                "trust_level": trust_level,
-                "established_at": datetime.utcnow().isoformat()
-            }
-        }
-
-        # Add DID if generated
-        if did:
-            payload["initiator_did"] = {
-                "did_public": did.export_public()
-            }
+        # Generate keys if requested
+        did, hid = _generate_keys() if generate_keys else (None, None)
 
-            if hid:
-                payload["initiator_did"]["hid_did_binding"] = hid.derive_did_binding(did)
+        payload = _trust_payload(initiator, responder, roles, context, trust_level, did, hid)
 
         logger.info(f"Establishing trust: {initiator} ←→ {responder}")
 
         # Create FIR/A via BETTI router
         response = self._request(
             "POST",
-            f"{self.betti_url}/fira/init",
+            self._url_fira_init,
             payload
         )
 
@@ -219,11 +806,11 @@ class TibetBettiClient:
         continuity_hash = response["continuity_hash"]
 
         # Track hash
-        self._continuity_hashes[fir_a_id] = continuity_hash
+        self._store_hash(fir_a_id, continuity_hash)
 
         logger.info(f"Trust established: {fir_a_id}")
 
-        return FIRARelationship(
+        relationship = FIRARelationship(
             id=fir_a_id,
             token=fir_a_id,  # Token is the FIR/A ID
             initiator=initiator,
@@ -234,11 +821,26 @@ class TibetBettiClient:
             hid_key=hid
         )
 
+        if cache_key is not None:
+            with self._cache_lock:
+                self._trust_cache[cache_key] = (copy.copy(relationship), time.monotonic())
+                self._trust_cache.move_to_end(cache_key)
+                if len(self._trust_cache) > self.MAX_TRUST_ENTRIES:
+                    self._trust_cache.popitem(last=False)
+
+        return relationship
+
+    def invalidate_trust(self, initiator: str, responder: str):
+        """Drop cached FIR/As between initiator and responder so the next establish_trust POSTs"""
+        with self._cache_lock:
+            for key in [k for k in self._trust_cache if k[0] == initiator and k[1] == responder]:
+                del self._trust_cache[key]
+
     def get_relationship(self, fir_a_id: str) -> FIRARelationship:
         """Get existing relationship details"""
         response = self._request(
             "GET",
-            f"{self.betti_url}/relation/{fir_a_id}"
+            self._url_relation_prefix + fir_a_id
         )
 
         return FIRARelationship(
@@ -294,30 +896,61 @@ class TibetBettiClient:
             humotica=humotica
         )
 
-        # Get continuity hash
-        continuity_hash_prev = self._continuity_hashes.get(relationship_id)
-
-        # Build payload
-        payload = {
-            "fir_a_id": relationship_id,
-            "intent": tibet.intent,
-            "context": tibet.context,
-            "timebox_seconds": tibet.time_window.duration_seconds(),
-            "continuity_hash_prev": continuity_hash_prev
-        }
+        if self.TIBET_DEDUPE_S <= 0:
+            return self._send_tibet(relationship_id, tibet)
+
+        key = hashlib.blake2b(_dumps_sorted([
+            relationship_id,
+            tibet.intent,
+            tibet.context,
+            tibet.time_window.duration_seconds()
+        ]), digest_size=16).digest()
+
+        # Under the chain lock, so a concurrent duplicate waits and reuses the response
+        with self._chain_lock(relationship_id):
+            now = time.monotonic()
+            recent = self._recent_tibets.get(key)
+            if recent is not None and now - recent[0] < self.TIBET_DEDUPE_S:
+                logger.info(f"Duplicate TIBET {intent} within {self.TIBET_DEDUPE_S}s, not resent")
+                return dict(recent[1])
+
+            result = self._send_tibet(relationship_id, tibet)
+
+            with self._cache_lock:
+                self._recent_tibets[key] = (now, result)
+                self._recent_tibets.move_to_end(key)
+                if len(self._recent_tibets) > self.MAX_DEDUPE_ENTRIES:
+                    self._recent_tibets.popitem(last=False)
+
+        return dict(result)
+
+    def _send_tibet(self, relationship_id: str, tibet: Tibet) -> Dict[str, Any]:
+        """One /ift round-trip for tibet, chained on the FIR/A's continuity hash"""
+        with self._chain_lock(relationship_id):
+            # Get continuity hash
+            continuity_hash_prev = self._prev_hash(relationship_id)
+
+            # Build payload
+            payload = {
+                "fir_a_id": relationship_id,
+                "intent": tibet.intent,
+                "context": tibet.context,
+                "timebox_seconds": tibet.time_window.duration_seconds(),
+                "continuity_hash_prev": continuity_hash_prev
+            }
 
-        logger.info(f"Sending TIBET: {intent} via FIR/A {relationship_id}")
+            logger.info(f"Sending TIBET: {tibet.intent} via FIR/A {relationship_id}")
 
-        # Send to BETTI router
-        response = self._request(
-            "POST",
-            f"{self.betti_url}/ift",
-            payload
-        )
+            # Send to BETTI router
+            response = self._request(
+                "POST",
+                self._url_ift,
+                payload
+            )
 
-        # Update hash
-        new_hash = response["continuity_hash"]
-        self._continuity_hashes[relationship_id] = new_hash
+            # Update hash
+            new_hash = response["continuity_hash"]
+            self._store_hash(relationship_id, new_hash)
 
         logger.info(f"TIBET accepted. New hash: {new_hash[:8]}...")
 
@@ -328,6 +961,77 @@ class TibetBettiClient:
             "events": response["events"]
         }
 
+    def send_tibet_batch(
+        self,
+        relationship_id: str,
+        tibets: List[Tibet]
+    ) -> List[Dict[str, Any]]:
+        """
+        Send several TIBET intents on one FIR/A in a single round-trip
+
+        BETTI chains the continuity hashes server-side. Falls back to one
+        send_tibet() per intent if the router has no /ift/batch endpoint.
+
+        Args:
+            relationship_id: FIR/A relationship ID (trust token)
+            tibets: TIBETs to send, in chain order
+
+        Returns:
+            One response per TIBET, same shape as send_tibet()
+        """
+        if not tibets:
+            return []
+
+        if self._ift_batch is not False:
+            with self._chain_lock(relationship_id):
+                payload = {
+                    "fir_a_id": relationship_id,
+                    "items": [
+                        {
+                            "intent": tibet.intent,
+                            "context": tibet.context,
+                            "timebox_seconds": tibet.time_window.duration_seconds()
+                        }
+                        for tibet in tibets
+                    ],
+                    "continuity_hash_prev": self._prev_hash(relationship_id)
+                }
+
+                logger.info(f"Sending {len(tibets)} TIBETs via FIR/A {relationship_id}")
+
+                try:
+                    response = self._request(
+                        "POST",
+                        self._url_ift_batch,
+                        payload
+                    )
+                except _HTTP_ERRORS as e:
+                    if e.response is None or e.response.status_code != 404:
+                        raise
+                    logger.info("BETTI router has no /ift/batch, sending one by one")
+                    self._ift_batch = False
+                else:
+                    self._ift_batch = True
+
+                    results = [
+                        {
+                            "status": "accepted",
+                            "fir_a_id": relationship_id,
+                            "continuity_hash": item["continuity_hash"],
+                            "events": item["events"]
+                        }
+                        for item in response
+                    ]
+                    if results:
+                        self._store_hash(relationship_id, results[-1]["continuity_hash"])
+
+                    return results
+
+        # Sequential on purpose: each send chains on the continuity hash the
+        # previous one returned, so these round-trips cannot overlap.
+        # Not deduplicated: a batch may repeat an intent deliberately.
+        return [self._send_tibet(relationship_id, tibet) for tibet in tibets]
+
     # ========================================================================
     # KIT API INTEGRATION (Context & Sense)
     # ========================================================================
@@ -336,8 +1040,9 @@ class TibetBettiClient:
         self,
         user_id: str,
         context_data: Dict[str, Any],
-        evaluate_sense: bool = True
-    ) -> Dict[str, Any]:
+        evaluate_sense: bool = True,
+        parse_json: bool = True
+    ) -> Optional[Dict[str, Any]]:
         """
         Update user context in KIT
 
@@ -345,6 +1050,7 @@ class TibetBettiClient:
             user_id: User identifier
             context_data: Context data to update
             evaluate_sense: Run sense evaluation after update
+            parse_json: Set False if the response is not needed (returns None)
 
         Returns:
             Response with sense evaluation results
@@ -372,8 +1078,9 @@ class TibetBettiClient:
 
         response = self._request(
             "POST",
-            f"{self.kit_url}/context/update",
-            payload
+            self._url_ctx_update,
+            payload,
+            parse_json=parse_json
         )
 
         return response
@@ -385,7 +1092,7 @@ class TibetBettiClient:
 
         response = self._request(
             "GET",
-            f"{self.kit_url}/context/{user_id}"
+            self._url_ctx_prefix + user_id
         )
 
         return Context.from_dict(response)
@@ -437,7 +1144,7 @@ class TibetBettiClient:
 
         response = self._request(
             "POST",
-            f"{self.kit_url}/sense/rules",
+            self._url_sense_rules,
             payload
         )
 
@@ -472,7 +1179,7 @@ class TibetBettiClient:
 
         response = self._request(
             "POST",
-            f"{self.kit_url}/sense/evaluate",
+            self._url_sense_eval,
             payload
         )
 
@@ -516,36 +1223,96 @@ class TibetBettiClient:
         if not self.kit_url:
             raise ValueError("KIT URL required for context_to_tibet")
 
-        # 1. Update context
-        logger.info(f"Updating context for {user_id}")
-        self.update_context(user_id, context_update, evaluate_sense=False)
+        # 1. Update context (skipped only if there is nothing to update)
+        if context_update:
+            logger.info(f"Updating context for {user_id}")
+            self.update_context(user_id, context_update, evaluate_sense=False, parse_json=False)
 
         # 2. Evaluate sense rules
         logger.info(f"Evaluating sense rules")
         triggered_intents = self.evaluate_sense(user_id)
+        if not triggered_intents:
+            return []
 
-        # 3. Send TIBET for each triggered intent
-        results = []
-        for intent in triggered_intents:
-            logger.info(f"Sending TIBET for triggered intent: {intent}")
+        # 3. Send TIBET for each triggered intent (one batch round-trip)
+        context = {"user_id": user_id, "triggered_by": "sense_rule"}
+        context.update(context_update)
+        humotica = f"Auto-triggered by sense rule based on context update: {context_update}"
 
-            result = self.send_tibet(
-                relationship_id=relationship_id,
-                intent=intent,
-                context={
-                    "user_id": user_id,
-                    "triggered_by": "sense_rule",
-                    **context_update
-                },
-                humotica=f"Auto-triggered by sense rule based on context update: {context_update}"
-            )
-
-            results.append(result)
+        results = self.send_tibet_batch(relationship_id, [
+            Tibet(intent=intent, context=context, humotica=humotica)
+            for intent in triggered_intents
+        ])
 
         logger.info(f"Sent {len(results)} TIBETs from sense evaluation")
 
         return results
 
+    def context_to_tibet_fused(
+        self,
+        relationship_id: str,
+        user_id: str,
+        context_update: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        context_to_tibet() in one round-trip
+
+        KIT updates the context, evaluates sense rules and forwards the
+        triggered TIBETs to BETTI server-side. Falls back to
+        context_to_tibet() if KIT has no /context_to_tibet endpoint.
+
+        Args:
+            relationship_id: Trust token (FIR/A ID)
+            user_id: User ID in KIT
+            context_update: New context data
+
+        Returns:
+            List of sent TIBET responses, same shape as context_to_tibet()
+        """
+        if not self.kit_url:
+            raise ValueError("KIT URL required for context_to_tibet")
+
+        if self._supports_fused is not False:
+            with self._chain_lock(relationship_id):
+                payload = {
+                    "user_id": user_id,
+                    "context": context_update,
+                    "fir_a_id": relationship_id,
+                    "continuity_hash_prev": self._prev_hash(relationship_id)
+                }
+
+                try:
+                    response = self._request(
+                        "POST",
+                        self._url_ctx_to_tibet,
+                        payload
+                    )
+                except _HTTP_ERRORS as e:
+                    if e.response is None or e.response.status_code != 404:
+                        raise
+                    logger.info("KIT has no /context_to_tibet, using separate calls")
+                    self._supports_fused = False
+                else:
+                    self._supports_fused = True
+
+                    results = [
+                        {
+                            "status": "accepted",
+                            "fir_a_id": relationship_id,
+                            "continuity_hash": item["continuity_hash"],
+                            "events": item["events"]
+                        }
+                        for item in response.get("tibet_results", [])
+                    ]
+                    if results:
+                        self._store_hash(relationship_id, results[-1]["continuity_hash"])
+
+                    logger.info(f"Sent {len(results)} TIBETs from sense evaluation")
+
+                    return results
+
+        return self.context_to_tibet(relationship_id, user_id, context_update)
+
     # ========================================================================
     # WEBSOCKET (Real-Time)
     # ========================================================================
@@ -554,8 +1321,11 @@ class TibetBettiClient:
         self,
         user_id: str,
         on_message: callable,
-        on_tibet: Optional[callable] = None
-    ) -> TibetWebSocket:
+        on_tibet: Optional[callable] = None,
+        tcp_nodelay: bool = True,
+        ping_interval: float = 10,
+        reconnect: bool = True
+    ) -> "TibetWebSocket":
         """
         Connect to WebSocket for real-time updates
 
@@ -563,6 +1333,9 @@ class TibetBettiClient:
             user_id: User ID
             on_message: Callback for any message
             on_tibet: Optional callback specifically for TIBET intents
+            tcp_nodelay: Disable Nagle on the socket for low-latency frames
+            ping_interval: Seconds between keep-alive pings (0 disables)
+            reconnect: Auto-reconnect (keeping callbacks) and queue sends while down
 
         Returns:
             TibetWebSocket connection
@@ -581,12 +1354,17 @@ class TibetBettiClient:
         if not self.kit_url:
             raise ValueError("KIT URL required for WebSocket")
 
+        from .websocket import TibetWebSocket
+
         ws_url = self.kit_url.replace('http://', 'ws://').replace('https://', 'wss://')
 
         self._ws = TibetWebSocket(
             url=f"{ws_url}/ws/{user_id}",
             on_message=on_message,
-            on_tibet=on_tibet
+            on_tibet=on_tibet,
+            tcp_nodelay=tcp_nodelay,
+            ping_interval=ping_interval,
+            reconnect=reconnect
         )
 
         return self._ws
@@ -603,13 +1381,13 @@ class TibetBettiClient:
 
     def health_check(self) -> Dict[str, Any]:
         """Check BETTI router health"""
-        return self._request("GET", f"{self.betti_url}/health")
+        return self._request("GET", self._url_betti_health)
 
     def kit_health_check(self) -> Dict[str, Any]:
         """Check KIT API health"""
         if not self.kit_url:
             raise ValueError("KIT URL not configured")
-        return self._request("GET", f"{self.kit_url}/health")
+        return self._request("GET", self._url_kit_health)
 
     # ========================================================================
     # BETTI INTENT EXECUTION (with BALANS Security Pipeline)
@@ -675,52 +1453,84 @@ class TibetBettiClient:
             raise ValueError("KIT URL required for intent execution")
 
         # Build payload
-        payload = {
-            "intent": intent,
-            "context": {
-                **context,
-                "urgency": urgency
-            },
-            "user_id": user_id
-        }
-
-        if fira_id:
-            payload["fira_id"] = fira_id
-
-        if deadline:
-            payload["context"]["deadline"] = deadline
+        payload = _intent_payload(intent, context, user_id, fira_id, urgency, deadline)
 
         logger.info(f"Executing intent: {intent} (urgency={urgency})")
 
         response = self._request(
             "POST",
-            f"{self.kit_url}/betti/intent/execute",
+            self._url_intent_exec,
             payload
         )
 
         # Log BALANS decision
-        status = response.get("status")
-        result = response.get("result", {})
-
-        if status == "snaft_blocked":
-            logger.warning(f"🚫 SNAFT blocked: {result.get('reason')}")
-        elif status == "clarification_needed":
-            logger.info(f"❓ Clarification needed: {result.get('message')}")
-        elif status == "awaiting_resources":
-            logger.info(f"🔋 Awaiting resources: {result.get('robot_request')}")
-        elif status == "delayed":
-            logger.info(f"⏰ Delayed: {result.get('message')}")
-        elif status == "rejected":
-            logger.warning(f"❌ Rejected: {result.get('message')}")
-        elif status == "split_required":
-            logger.info(f"📋 Split required (complexity: {result.get('complexity', {}).get('score')})")
-        elif status == "executed":
-            warmth = result.get('warmth', 'neutral')
-            color = result.get('color', 'green')
-            logger.info(f"✓ Executed (warmth={warmth}, color={color})")
+        _log_execution_status(response)
+        self._invalidate_dashboards()
 
         return response
 
+    def execute_intents_batch(
+        self,
+        batch: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute several intents through the BETTI pipeline in one round-trip
+
+        Args:
+            batch: execute_intent() keyword dicts
+                ({intent, context, user_id, fira_id?, urgency?, deadline?})
+
+        Returns:
+            One result per request, same order. A failed item has
+            status "error" and an "error" message instead of aborting the batch.
+
+        Example:
+            >>> results = client.execute_intents_batch([
+            ...     {"intent": "turn_on_lights", "context": {"location": "huiskamer"},
+            ...      "user_id": "user_123"},
+            ...     {"intent": "start_music", "context": {}, "user_id": "user_123", "urgency": 3}
+            ... ])
+            >>> [r['status'] for r in results]
+        """
+        if not self.kit_url:
+            raise ValueError("KIT URL required for intent execution")
+
+        if not batch:
+            return []
+
+        if self._execute_batch is not False:
+            payload = {"requests": [_intent_payload(**item) for item in batch]}
+
+            logger.info(f"Executing {len(batch)} intents in one batch")
+
+            try:
+                response = self._request(
+                    "POST",
+                    self._url_intent_exec_batch,
+                    payload
+                )
+            except _HTTP_ERRORS as e:
+                if e.response is None or e.response.status_code != 404:
+                    raise
+                logger.info("KIT has no /betti/execute/batch, executing one by one")
+                self._execute_batch = False
+            else:
+                self._execute_batch = True
+
+                results = response["results"]
+                for result in results:
+                    _log_execution_status(result)
+                self._invalidate_dashboards()
+                return results
+
+        results = []
+        for item in batch:
+            try:
+                results.append(self.execute_intent(**item))
+            except _TRANSPORT_ERRORS as e:
+                results.append({"status": "error", "error": str(e)})
+        return results
+
     def clarify_intent(
         self,
         intent: str,
@@ -754,11 +1564,9 @@ class TibetBettiClient:
             ...         user_id="user_123"
             ...     )
         """
-        updated_context = {
-            **context,
-            "clarification": clarification,
-            "clarified": True
-        }
+        updated_context = context.copy()
+        updated_context["clarification"] = clarification
+        updated_context["clarified"] = True
 
         return self.execute_intent(
             intent=intent,
@@ -802,11 +1610,9 @@ class TibetBettiClient:
         """
         if approved:
             # Re-execute after approval
-            updated_context = {
-                **context,
-                "resource_request_approved": True,
-                "retry_after_resources": True
-            }
+            updated_context = context.copy()
+            updated_context["resource_request_approved"] = True
+            updated_context["retry_after_resources"] = True
             return self.execute_intent(
                 intent=intent,
                 context=updated_context,
@@ -852,11 +1658,36 @@ class TibetBettiClient:
 
         response = self._request(
             "GET",
-            f"{self.kit_url}/betti/balans/decisions/{did}?limit={limit}"
+            self._url_balans_decisions_prefix + did,
+            params={"limit": limit}
         )
 
         return response.get("decisions", [])
 
+    def iter_balans_decisions(
+        self,
+        did: str,
+        limit: int = 50
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate BALANS decision history for device without buffering it
+
+        Same data as get_balans_decisions(), parsed incrementally (needs
+        the optional ijson package, otherwise fetched in one go).
+
+        Example:
+            >>> for d in client.iter_balans_decisions("phone_001", limit=5000):
+            ...     print(d['decision'])
+        """
+        if not self.kit_url:
+            raise ValueError("KIT URL required")
+
+        return self._iter_items(
+            self._url_balans_decisions_prefix + did,
+            "decisions",
+            params={"limit": limit}
+        )
+
     def get_balans_dashboard(self, days: int = 30) -> Dict[str, Any]:
         """
         Get BALANS analytics dashboard
@@ -879,12 +1710,27 @@ class TibetBettiClient:
         if not self.kit_url:
             raise ValueError("KIT URL required")
 
-        response = self._request(
-            "GET",
-            f"{self.kit_url}/betti/balans/dashboard?days={days}"
-        )
+        return self._cached_get(self._url_balans_dashboard, {"days": days}, self.DASHBOARD_TTL_S)
 
-        return response
+    def iter_balans_dashboard(self, section: str, days: int = 30) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate one list section of the BALANS dashboard, parsed incrementally
+
+        Stop early (e.g. with itertools.islice) and the rest of the response
+        is never decoded. Needs the optional ijson package; otherwise the
+        (cached) get_balans_dashboard() result is iterated.
+
+        Example:
+            >>> sections = client.iter_balans_dashboard("warmth_color_distribution", days=7)
+            >>> for wc in islice(sections, 5):
+            ...     print(wc['response_warmth'], wc['response_color'])
+        """
+        if not self.kit_url:
+            raise ValueError("KIT URL required")
+
+        if not HAS_IJSON or self.transport != "requests":
+            return iter(self.get_balans_dashboard(days).get(section, []))
+        return self._iter_items(self._url_balans_dashboard, section, params={"days": days})
 
     # ========================================================================
     # SNAFT - Factory Firewall
@@ -920,21 +1766,45 @@ class TibetBettiClient:
         if not self.kit_url:
             raise ValueError("KIT URL required")
 
-        params = []
+        params = {}
         if device_type:
-            params.append(f"device_type={device_type}")
+            params["device_type"] = device_type
         if manufacturer:
-            params.append(f"manufacturer={manufacturer}")
-
-        query = f"?{'&'.join(params)}" if params else ""
+            params["manufacturer"] = manufacturer
 
-        response = self._request(
-            "GET",
-            f"{self.kit_url}/betti/snaft/rules{query}"
-        )
+        response = self._cached_get(self._url_snaft_rules, params, self.SNAFT_RULES_TTL_S)
 
         return response.get("rules", [])
 
+    def iter_snaft_rules(
+        self,
+        device_type: Optional[str] = None,
+        manufacturer: Optional[str] = None,
+        page_size: int = 200
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate SNAFT factory firewall rules page by page
+
+        Same filters and results as get_snaft_rules(). Follows the server's
+        next_cursor and streams each page with ijson (if installed), so only
+        one page is in memory and a `break` stops further requests. A server
+        that sends no next_cursor gets one unpaginated request for the rest.
+
+        Example:
+            >>> for rule in client.iter_snaft_rules(device_type="drone"):
+            ...     print(f"{rule['rule_type']}: {rule['reason']}")
+        """
+        if not self.kit_url:
+            raise ValueError("KIT URL required")
+
+        params = {}
+        if device_type:
+            params["device_type"] = device_type
+        if manufacturer:
+            params["manufacturer"] = manufacturer
+
+        return self._iter_pages(self._url_snaft_rules, "rules", params, page_size)
+
     def get_snaft_violations(
         self,
         did: str,
@@ -960,11 +1830,35 @@ class TibetBettiClient:
 
         response = self._request(
             "GET",
-            f"{self.kit_url}/betti/snaft/violations/{did}?limit={limit}"
+            self._url_snaft_violations_prefix + did,
+            params={"limit": limit}
         )
 
         return response.get("violations", [])
 
+    def iter_snaft_violations(
+        self,
+        did: str,
+        limit: int = 100,
+        page_size: int = 200
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate SNAFT violation history for device page by page
+
+        Yields at most `limit` violations, like get_snaft_violations(), but
+        one page (streamed with ijson if installed) at a time.
+        """
+        if not self.kit_url:
+            raise ValueError("KIT URL required")
+
+        return self._iter_pages(
+            self._url_snaft_violations_prefix + did,
+            "violations",
+            {},
+            page_size,
+            limit
+        )
+
     def get_snaft_dashboard(self, days: int = 30) -> Dict[str, Any]:
         """
         Get SNAFT violation analytics
@@ -987,12 +1881,25 @@ class TibetBettiClient:
         if not self.kit_url:
             raise ValueError("KIT URL required")
 
-        response = self._request(
-            "GET",
-            f"{self.kit_url}/betti/snaft/dashboard?days={days}"
-        )
+        return self._cached_get(self._url_snaft_dashboard, {"days": days}, self.DASHBOARD_TTL_S)
 
-        return response
+    def iter_snaft_dashboard(self, section: str, days: int = 30) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate one list section of the SNAFT dashboard, parsed incrementally
+
+        Like iter_balans_dashboard(): stops decoding as soon as the caller
+        stops iterating.
+
+        Example:
+            >>> for v in islice(client.iter_snaft_dashboard("top_violations", days=7), 5):
+            ...     print(v['reason'])
+        """
+        if not self.kit_url:
+            raise ValueError("KIT URL required")
+
+        if not HAS_IJSON or self.transport != "requests":
+            return iter(self.get_snaft_dashboard(days).get(section, []))
+        return self._iter_items(self._url_snaft_dashboard, section, params={"days": days})
 
     # ========================================================================
     # BETTI COMPLEXITY ANALYSIS
@@ -1039,10 +1946,4 @@ class TibetBettiClient:
             "threshold_profile": threshold_profile
         }
 
-        response = self._request(
-            "POST",
-            f"{self.kit_url}/betti/complexity/analyze",
-            payload
-        )
-
-        return response
+        return self._cached_post(self._url_complexity, payload, self.COMPLEXITY_TTL_S)
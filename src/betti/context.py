@@ -2,24 +2,273 @@
 Context and Sense Rule classes for KIT API integration
 """
 
-from typing import Dict, Any, List, Optional
+import bisect
+import functools
+import importlib.util
+import itertools
+import operator
+from collections import OrderedDict
+from typing import Dict, Any, Callable, List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from ._compat import _SLOTS, _intern
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# numba is imported (and the kernel compiled) only once an engine
+# vectorizes, see _kernel(): importing it costs more than the rest of the SDK
+HAS_NUMBA = HAS_NUMPY and importlib.util.find_spec("numba") is not None
+
+
+# Context versions: unique across all contexts, so (rule, version) identifies
+# exactly one context state
+_next_version = itertools.count(1).__next__
+
+# SenseRule fields that change what an engine triggers or returns; assigning any of them
+# on any rule stamps a new _rules_version (see SenseRule.__setattr__)
+_RULE_STATE = frozenset({"conditions", "intent", "priority", "enabled"})
+_rules_version = 0
+
+# Comparison operators understood in conditions ({"temp": {"gte": 20}}),
+# mapped to the comparison that makes them FAIL, exactly as Context.matches
+# tests them (so NaN values behave the same on every evaluation path)
+_FAIL_OPS = {
+    "eq": operator.ne,
+    "ne": operator.eq,
+    "gt": operator.le,
+    "gte": operator.lt,
+    "lt": operator.ge,
+    "lte": operator.gt,
+}
+
+
+# The same failing comparisons as source text, for compiled rules
+_FAIL_SYMBOLS = {
+    "eq": "!=",
+    "ne": "==",
+    "gt": "<=",
+    "gte": "<",
+    "lt": ">=",
+    "lte": ">",
+}
+
+
+def _contains(allowed, value) -> bool:
+    try:
+        return value in allowed
+    except TypeError:
+        # Unhashable value against a frozenset
+        return any(value == a for a in allowed)
+
+
+@functools.lru_cache(maxsize=1024)
+def _matcher_factory(source: str) -> Callable[..., Callable[[Dict[str, Any]], bool]]:
+    # Rules of the same shape (keys' operators) share one compiled factory
+    namespace = {"_contains": _contains}
+    exec(compile(source, "<sense-rule>", "exec"), namespace)
+    return namespace["_make"]
+
+
+def _compile_conditions(conditions: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Compile a conditions dict into one straight-line function of context.data
+
+    Same semantics as Context.matches. Keys and expected values are closure
+    variables of the generated function, never pasted into its source.
+    """
+    names: List[str] = []
+    values: List[Any] = []
+    lines: List[str] = []
+
+    def bind(value: Any) -> str:
+        names.append(f"c{len(names)}")
+        values.append(value)
+        return names[-1]
+
+    for key, condition in conditions.items():
+        lines.append(f"        v = data.get({bind(_intern(key))})")
+        lines.append("        if v is None: return False")
+
+        # Simple equality
+        if not isinstance(condition, dict):
+            lines.append(f"        if v != {bind(condition)}: return False")
+            continue
+
+        for op, expected in condition.items():
+            if op in _FAIL_SYMBOLS:
+                lines.append(f"        if v {_FAIL_SYMBOLS[op]} {bind(expected)}: return False")
+            elif op == "in":
+                if not isinstance(expected, (list, tuple, set, frozenset)):
+                    # str (substring test) and other containers keep their own "in"
+                    lines.append(f"        if v not in {bind(expected)}: return False")
+                    continue
+                try:
+                    allowed = frozenset(expected)
+                except TypeError:
+                    # Unhashable members: keep linear membership
+                    allowed = tuple(expected)
+                lines.append(f"        if not _contains({bind(allowed)}, v): return False")
+
+    source = "\n".join([
+        f"def _make({', '.join(names)}):",
+        "    def _match(data):",
+        *lines,
+        "        return True",
+        "    return _match",
+    ])
+    return _matcher_factory(source)(*values)
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable canonical form: dicts key-order independent, containers tagged"""
+    if isinstance(value, dict):
+        return (dict, _sorted_items((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (list, tuple(_freeze(v) for v in value))
+    return value
+
+
+def _freeze_condition(condition: Any) -> Any:
+    if not isinstance(condition, dict):
+        return _freeze(condition)
+    # "in" lists are membership sets: order and duplicates don't matter
+    return (dict, _sorted_items(
+        (op, (frozenset, frozenset(_freeze(v) for v in expected)))
+        if op == "in" and isinstance(expected, (list, tuple)) else (op, _freeze(expected))
+        for op, expected in condition.items()
+    ))
+
+
+def _sorted_items(items) -> Tuple:
+    return tuple(sorted(items, key=lambda item: repr(item[0])))
+
+
+def _signature(conditions: Dict[str, Any]) -> Optional[Any]:
+    """Canonical cache key for a conditions dict (None if it has unhashable leaves)"""
+    try:
+        signature = _sorted_items((k, _freeze_condition(c)) for k, c in conditions.items())
+        hash(signature)
+    except TypeError:
+        return None
+    return signature
+
+
+def _intern_keys(data: Dict[str, Any]) -> Dict[str, Any]:
+    return {_intern(k): v for k, v in data.items()}
+
+
+# Context value types that cannot change in place
+_SCALAR_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+
+
+class _TrackedDict(dict):
+    """
+    Context.data: a dict that takes a new version on every write
+
+    Direct writes (context.data["loc"] = "work") are seen by SenseEngine's
+    memoization just like Context.set/update. Keys are interned on the way in.
+    Values that can change in place (lists, dicts, ...) change nothing here,
+    so their keys are kept in `volatile` and Context._version is None while
+    any is present.
+    """
 
-@dataclass
+    __slots__ = ("version", "volatile")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self.volatile = set()
+        self.update(*args, **kwargs)
+
+    def __reduce__(self):
+        # Copies and unpickled dicts take a fresh version in this process
+        return (_TrackedDict, (dict(self),))
+
+    def _track(self, key, value):
+        if type(value) in _SCALAR_TYPES:
+            self.volatile.discard(key)
+        else:
+            self.volatile.add(key)
+
+    def __setitem__(self, key, value):
+        key = _intern(key)
+        dict.__setitem__(self, key, value)
+        self._track(key, value)
+        self.version = _next_version()
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self.volatile.discard(key)
+        self.version = _next_version()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs):
+        updates = _intern_keys(dict(*args, **kwargs))
+        dict.update(self, updates)
+        for key, value in updates.items():
+            self._track(key, value)
+        self.version = _next_version()
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return dict.__getitem__(self, key)
+
+    def pop(self, key, *default):
+        value = dict.pop(self, key, *default)
+        self.volatile.discard(key)
+        self.version = _next_version()
+        return value
+
+    def popitem(self):
+        item = dict.popitem(self)
+        self.volatile.discard(item[0])
+        self.version = _next_version()
+        return item
+
+    def clear(self):
+        dict.clear(self)
+        self.volatile.clear()
+        self.version = _next_version()
+
+
+@dataclass(**_SLOTS)
 class Context:
     """
     User context for intent evaluation
 
     Context contains all relevant information about the user's current state,
     which is used by sense rules to determine which intents to trigger.
+
+    data is held in a change-tracking copy of the dict passed in: write to
+    context.data (or use set/update), not to the original dict. Container
+    values (lists, dicts, ...) can also change in place, unseen: while data
+    holds any, SenseEngine does not memoize verdicts for this context.
     """
 
     user_id: str
     data: Dict[str, Any] = field(default_factory=dict)
     updated_at: Optional[datetime] = None
 
+    def __setattr__(self, name: str, value: Any):
+        if name == "data" and type(value) is not _TrackedDict:
+            value = _TrackedDict(value)
+        object.__setattr__(self, name, value)
+
+    @property
+    def _version(self) -> Optional[int]:
+        # Changes on every write to data; used as the change marker for
+        # memoization. None (do not memoize) while a value is a container.
+        data = self.data
+        return None if data.volatile else data.version
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get context value"""
         return self.data.get(key, default)
@@ -101,7 +350,7 @@ class Context:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SenseRule:
     """
     Sense rule for automatic intent triggering
@@ -109,6 +358,10 @@ class SenseRule:
     Sense rules monitor context and automatically trigger intents when
     conditions are met.
 
+    Conditions are compiled once, on construction (so also via from_dict),
+    into a single generated function of straight-line checks; "in" lists,
+    tuples and sets become frozensets, giving O(1) membership per evaluation.
+
     Example:
         >>> rule = SenseRule(
         ...     name="evening_lights",
@@ -130,6 +383,43 @@ class SenseRule:
     enabled: bool = True
     rule_id: Optional[str] = None
 
+    # conditions compiled once to a function of context.data
+    _match: Optional[Callable[[Dict[str, Any]], bool]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _compiled_from: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Canonical form of conditions: equivalent rules share memoized verdicts
+    _signature: Any = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._compile()
+
+    def __setattr__(self, name: str, value: Any):
+        # object.__setattr__: zero-argument super() breaks in slotted dataclasses
+        object.__setattr__(self, name, value)
+        if name in _RULE_STATE:
+            global _rules_version
+            _rules_version = _next_version()
+
+    def _compile(self):
+        self._match = _compile_conditions(self.conditions)
+        self._signature = _signature(self.conditions)
+        self._compiled_from = self.conditions
+
+    def matches(self, context: Context) -> bool:
+        """
+        Check the compiled conditions against context (ignores enabled)
+
+        Equivalent to context.matches(self.conditions). Assigning a new
+        conditions dict recompiles; in-place edits of it are not picked up.
+        """
+        if self._compiled_from is not self.conditions:
+            self._compile()
+
+        return self._match(context.data)
+
     def evaluate(self, context: Context) -> bool:
         """
         Evaluate rule against context
@@ -143,7 +433,7 @@ class SenseRule:
         if not self.enabled:
             return False
 
-        return context.matches(self.conditions)
+        return self.matches(context)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dict"""
@@ -171,24 +461,263 @@ class SenseRule:
         )
 
 
+_MAX_EXACT_INT = 2 ** 53
+
+
+def _is_number(value: Any) -> bool:
+    # int/float that float64 represents exactly (bool, huge ints excluded)
+    return type(value) is float or (
+        type(value) is int and -_MAX_EXACT_INT <= value <= _MAX_EXACT_INT
+    )
+
+
+if HAS_NUMPY:
+    # Vector versions of _FAIL_OPS
+    _NP_FAIL_OPS = {
+        "eq": np.not_equal,
+        "ne": np.equal,
+        "gt": np.less_equal,
+        "gte": np.less,
+        "lt": np.greater_equal,
+        "lte": np.greater,
+    }
+
+    # Operator codes for the numba kernel, in _FAIL_OPS order
+    _OP_CODES = {op: code for code, op in enumerate(_FAIL_OPS)}
+
+if HAS_NUMBA:
+    _packed_kernel = None
+
+    def _scan_packed(values, present, row_keys, row_ops, thresh, starts, out):
+        """out[r] = no row of rule r fails; stops at a rule's first failing row"""
+        n_rules = starts.shape[0]
+        n_rows = row_keys.shape[0]
+        for r in range(n_rules):
+            end = starts[r + 1] if r + 1 < n_rules else n_rows
+            ok = True
+            for i in range(starts[r], end):
+                k = row_keys[i]
+                if not present[k]:
+                    ok = False
+                    break
+                x = values[k]
+                c = thresh[i]
+                op = row_ops[i]
+                if op == 0:
+                    fail = x != c
+                elif op == 1:
+                    fail = x == c
+                elif op == 2:
+                    fail = x <= c
+                elif op == 3:
+                    fail = x < c
+                elif op == 4:
+                    fail = x >= c
+                else:
+                    fail = x > c
+                if fail:
+                    ok = False
+                    break
+            out[r] = ok
+
+    def _kernel():
+        """_scan_packed compiled by numba (or loaded from its cache) on first use"""
+        global _packed_kernel
+        if _packed_kernel is None:
+            import numba
+
+            # No fastmath: it assumes no NaNs, and NaN must fail/pass like Context.matches
+            kernel = numba.njit(cache=True)(_scan_packed)
+            one = np.zeros(1, dtype=np.intp)
+            kernel(
+                np.zeros(1), np.ones(1, dtype=np.bool_), one, np.zeros(1, dtype=np.int8),
+                np.zeros(1), one, np.empty(1, dtype=np.bool_)
+            )
+            _packed_kernel = kernel
+        return _packed_kernel
+
+
+def _numeric_rows(conditions: Dict[str, Any]) -> Optional[List[Tuple[str, str, float]]]:
+    """[(key, op, threshold), ...] if every condition is a numeric comparison, else None"""
+    rows = []
+    for key, condition in conditions.items():
+        if not isinstance(condition, dict):
+            condition = {"eq": condition}
+        if not condition:
+            return None
+        for op, expected in condition.items():
+            if op not in _FAIL_OPS or not _is_number(expected):
+                return None
+            rows.append((key, op, expected))
+    return rows or None
+
+
+class _PackedRules:
+    """
+    Purely numeric rules, flattened to one row per condition (numpy arrays)
+
+    All packed rules are checked with a handful of vector comparisons
+    instead of one Python predicate call per condition.
+    """
+
+    def __init__(self, rules: List[SenseRule]):
+        key_index: Dict[str, int] = {}
+        row_keys, row_ops, row_thresh, starts = [], [], [], []
+        self.positions: List[int] = []      # index of each packed rule in `rules`
+        self.sources: List[Tuple[SenseRule, Dict[str, Any]]] = []
+
+        for pos, rule in enumerate(rules):
+            rows = _numeric_rows(rule.conditions)
+            if rows is None:
+                continue
+            self.positions.append(pos)
+            self.sources.append((rule, rule.conditions))
+            starts.append(len(row_keys))
+            for key, op, threshold in rows:
+                row_keys.append(key_index.setdefault(_intern(key), len(key_index)))
+                row_ops.append(op)
+                row_thresh.append(threshold)
+
+        self.keys = list(key_index)
+        self.row_keys = np.array(row_keys, dtype=np.intp)
+        self.thresh = np.array(row_thresh, dtype=np.float64)
+        self.starts = np.array(starts, dtype=np.intp)
+        if HAS_NUMBA:
+            self.row_ops = np.array([_OP_CODES[op] for op in row_ops], dtype=np.int8)
+        else:
+            ops = np.array(row_ops, dtype=object)
+            self.op_rows = [(_NP_FAIL_OPS[op], np.flatnonzero(ops == op)) for op in _NP_FAIL_OPS]
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def stale(self) -> bool:
+        """A packed rule got a new conditions dict since packing"""
+        return any(rule.conditions is not conditions for rule, conditions in self.sources)
+
+    def verdicts(self, data: Dict[str, Any]) -> Optional[List[bool]]:
+        """Match result per packed rule, or None if a used context value is not a plain number"""
+        values = np.zeros(len(self.keys))
+        present = np.zeros(len(self.keys), dtype=bool)
+        for i, key in enumerate(self.keys):
+            value = data.get(key)
+            if value is None:
+                continue
+            if not _is_number(value):
+                return None
+            values[i] = value
+            present[i] = True
+
+        if HAS_NUMBA:
+            out = np.empty(len(self.starts), dtype=np.bool_)
+            _kernel()(values, present, self.row_keys, self.row_ops, self.thresh, self.starts, out)
+            return out.tolist()
+
+        x = values[self.row_keys]
+        failed = ~present[self.row_keys]
+        for fail, rows in self.op_rows:
+            if len(rows):
+                failed[rows] |= fail(x[rows], self.thresh[rows])
+
+        # A rule matches when none of its rows failed
+        return (~np.logical_or.reduceat(failed, self.starts)).tolist()
+
+
 class SenseEngine:
     """
     Local sense evaluation engine
 
     Can evaluate sense rules locally without calling KIT API.
     Useful for offline operation or reducing API calls.
+
+    Verdicts are memoized per (canonical conditions, context version); every
+    write to Context.data moves the version. Rules with equivalent conditions
+    share one verdict. Contexts holding container values are not memoized
+    (see Context).
+
+    With numpy installed and enough purely numeric rules (only eq/ne/gt/
+    gte/lt/lte on numbers), those rules are evaluated together as arrays
+    (by a numba-compiled kernel if numba is installed too); all other rules
+    take the per-rule path.
     """
 
+    # Max memoized (conditions, context version) verdicts
+    EVAL_CACHE_SIZE = 4096
+
+    # Numeric rules needed before the numpy path beats per-rule predicates
+    VECTORIZE_MIN_RULES = 64
+
     def __init__(self):
         self.rules: List[SenseRule] = []
 
+        # (-priority, insertion seq, rule): kept in evaluation order, so
+        # evaluate() never sorts. Equal priorities keep insertion order.
+        self._sorted_rules: List[Tuple[int, int, SenseRule]] = []
+        self._seq = itertools.count()
+        # _rules_version the order was last checked against (see _sync)
+        self._synced_version = -1
+
+        # (conditions signature, context version) -> verdict, LRU
+        self._eval_cache: "OrderedDict[Tuple[Any, int], bool]" = OrderedDict()
+
+        # Last evaluate(): (context version, rules epoch, rule edits version,
+        # triggered intents). Polling the same unchanged context with unchanged
+        # rules skips all per-rule work.
+        self._epoch = 0
+        self._last: Tuple[Optional[int], int, int, List[str]] = (None, -1, -1, [])
+
+        # Numeric rules packed for numpy, rebuilt lazily when the epoch moves
+        self._packed: Optional[_PackedRules] = None
+        self._packed_epoch = -1
+
     def add_rule(self, rule: SenseRule):
         """Add sense rule"""
         self.rules.append(rule)
+        bisect.insort(self._sorted_rules, (-rule.priority, next(self._seq), rule))
+        self._epoch += 1
+
+        # Pay the JIT compile while rules are loaded, not on the first tick
+        if HAS_NUMBA and len(self._sorted_rules) == self.VECTORIZE_MIN_RULES:
+            _kernel()
 
     def remove_rule(self, rule_name: str):
         """Remove sense rule by name"""
         self.rules = [r for r in self.rules if r.name != rule_name]
+        self._sorted_rules = [e for e in self._sorted_rules if e[2].name != rule_name]
+        self._epoch += 1
+
+    def _sync(self):
+        """Re-sort if a rule's priority was changed after add_rule()"""
+        if self._synced_version == _rules_version:
+            return
+        self._synced_version = _rules_version
+        if any(-rule.priority != priority for priority, _, rule in self._sorted_rules):
+            # seq is unique, so rules themselves are never compared
+            self._sorted_rules = sorted(
+                (-rule.priority, seq, rule) for _, seq, rule in self._sorted_rules
+            )
+            self._epoch += 1
+
+    def _matches(self, rule: SenseRule, context: Context) -> bool:
+        """rule.evaluate(context), memoized while the context is unchanged"""
+        if not rule.enabled:
+            return False
+        if rule._compiled_from is not rule.conditions:
+            rule._compile()
+        version = context._version
+        if rule._signature is None or version is None:
+            return rule.matches(context)
+
+        key = (rule._signature, version)
+        cache = self._eval_cache
+        verdict = cache.get(key)
+        if verdict is None:
+            verdict = cache[key] = rule.matches(context)
+            if len(cache) > self.EVAL_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return verdict
 
     def evaluate(self, context: Context) -> List[str]:
         """
@@ -200,31 +729,67 @@ class SenseEngine:
         Returns:
             List of intents that should be triggered
         """
-        triggered = []
-
-        # Sort by priority (highest first)
-        sorted_rules = sorted(self.rules, key=lambda r: r.priority, reverse=True)
-
-        for rule in sorted_rules:
-            if rule.evaluate(context):
-                triggered.append(rule.intent)
-
-        return triggered
-
-    def get_triggered_rules(self, context: Context) -> List[SenseRule]:
+        version, epoch, rules_version, triggered = self._last
+        if (
+            version is not None
+            and version == context._version
+            and epoch == self._epoch
+            and rules_version == _rules_version
+        ):
+            return list(triggered)
+
+        rules_version = _rules_version
+        triggered = [rule.intent for rule in self._triggered(context)]
+
+        self._last = (context._version, self._epoch, rules_version, triggered)
+        return list(triggered)
+
+    def get_triggered_rules(self, context: Context, top_k: Optional[int] = None) -> List[SenseRule]:
         """
         Get full rule objects that would trigger
 
         Args:
             context: Current context
+            top_k: Only the top_k highest-priority matches (rules are kept in
+                priority order, so evaluation stops at the top_k-th match)
 
         Returns:
             List of SenseRule objects that matched
         """
-        triggered = []
+        return self._triggered(context, top_k)
 
-        for rule in self.rules:
-            if rule.evaluate(context):
+    def _triggered(self, context: Context, limit: Optional[int] = None) -> List[SenseRule]:
+        """Matching rules, already in priority order (highest first)"""
+        self._sync()
+        vector = self._vector_verdicts(context)
+        if not vector:
+            matching = (rule for _, _, rule in self._sorted_rules if self._matches(rule, context))
+            return list(itertools.islice(matching, limit))
+
+        triggered = []
+        for pos, (_, _, rule) in enumerate(self._sorted_rules):
+            if len(triggered) == limit:
+                break
+            verdict = vector.get(pos)
+            if verdict is None:
+                verdict = self._matches(rule, context)
+            if verdict and rule.enabled:
                 triggered.append(rule)
+        return triggered
 
-        return sorted(triggered, key=lambda r: r.priority, reverse=True)
+    def _vector_verdicts(self, context: Context) -> Optional[Dict[int, bool]]:
+        """{rule position: matched} for the numpy-packed rules, or None"""
+        if not HAS_NUMPY or len(self._sorted_rules) < self.VECTORIZE_MIN_RULES:
+            return None
+
+        packed = self._packed
+        if packed is None or self._packed_epoch != self._epoch or packed.stale():
+            packed = self._packed = _PackedRules([rule for _, _, rule in self._sorted_rules])
+            self._packed_epoch = self._epoch
+        if len(packed) < self.VECTORIZE_MIN_RULES:
+            return None
+
+        verdicts = packed.verdicts(context.data)
+        if verdicts is None:
+            return None
+        return dict(zip(packed.positions, verdicts))
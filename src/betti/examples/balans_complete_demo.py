@@ -15,70 +15,164 @@ Author: Jasper van der Meent (BETTI Architecture)
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from tibet_betti_client import TibetBettiClient
+from tibet_betti_client.client import HAS_HTTPX
 
 
-def demo_basic_execution():
-    """Demo 1: Basic Intent Execution with BALANS"""
-    print("=" * 70)
-    print("DEMO 1: Basic Intent Execution")
-    print("=" * 70)
+BETTI_URL = "http://192.168.4.76:8081"
+
+_BANNER = """
+╔═══════════════════════════════════════════════════════════════════════╗
+║                                                                       ║
+║              BETTI BALANS - Complete Feature Demo                    ║
+║                                                                       ║
+║  Demonstrates:                                                        ║
+║  • SNAFT factory firewall (immutable safety rules)                   ║
+║  • BALANS pre-execution decisions (resource checks)                  ║
+║  • Internal TIBET (robot permission requests)                        ║
+║  • Clarification dialogues (ambiguity resolution)                    ║
+║  • Warmth & Color emotional responses                                ║
+║  • Complexity analysis (B0-B5 topological dimensions)                ║
+║  • Analytics dashboards                                              ║
+║                                                                       ║
+║  Author: Jasper van der Meent (BETTI Architecture)                   ║
+║                                                                       ║
+╚═══════════════════════════════════════════════════════════════════════╝
+    """
 
-    client = TibetBettiClient(
-        betti_url="http://192.168.4.76:8081",
-        kit_url="http://192.168.4.76:8081"
+
+def _new_client() -> TibetBettiClient:
+    """Client for a demo called on its own; main() shares one (pooled session)"""
+    # HTTP/2 if available: the concurrent demos then share one multiplexed connection
+    return TibetBettiClient(
+        betti_url=BETTI_URL,
+        kit_url=BETTI_URL,
+        transport="httpx" if HAS_HTTPX else "requests"
     )
 
+
+# Opening intent of each execution demo; main() sends them as one batch
+BASIC_INTENT = dict(
+    intent="turn_on_lights",
+    context={
+        "location": "huiskamer",
+        "device_type": "phone",
+        "manufacturer": "Apple"
+    },
+    user_id="jasper@jtel.nl",
+    urgency=5
+)
+
+CLARIFICATION_INTENT = dict(
+    intent="turn_on_living_lights",
+    context={"device_type": "phone"},
+    user_id="jasper@jtel.nl"
+)
+
+RESOURCE_INTENT = dict(
+    intent="upload_large_file",
+    context={
+        "file_size_mb": 500,
+        "did": "phone_001",
+        "device_type": "phone",
+        "battery_pct": 15,  # Low battery!
+        "urgency": 7
+    },
+    user_id="jasper@jtel.nl",
+    deadline="2025-11-28T18:00:00Z"
+)
+
+SNAFT_INTENT = dict(
+    intent="fly_near_airport_schiphol",
+    context={
+        "did": "drone_dji_001",
+        "device_type": "drone",
+        "manufacturer": "DJI",
+        "latitude": 52.308056,
+        "longitude": 4.764167
+    },
+    user_id="jasper@jtel.nl"
+)
+
+SPLIT_INTENT = dict(
+    intent="organize_entire_smart_home",
+    context={
+        "humans": 5,
+        "devices": 50,
+        "operations": 200,
+        "device_type": "phone"
+    },
+    user_id="jasper@jtel.nl"
+)
+
+TRAVEL_INTENT = dict(
+    intent="navigate_to_krakow",
+    context={
+        "did": "tesla_model_3_001",
+        "device_type": "car",
+        "manufacturer": "Tesla",
+        "battery_pct": 25,
+        "destination": "Krakow, Poland",
+        "distance_km": 450,
+        "current_location": "Utrecht, Netherlands",
+        "urgency": 6
+    },
+    user_id="jasper@jtel.nl"
+)
+
+
+def demo_basic_execution(result=None, client=None):
+    """Demo 1: Basic Intent Execution with BALANS"""
+    out = []
+    out.append("=" * 70)
+    out.append("DEMO 1: Basic Intent Execution")
+    out.append("=" * 70)
+
+    if client is None:
+        client = _new_client()
+
     # Execute simple intent
-    result = client.execute_intent(
-        intent="turn_on_lights",
-        context={
-            "location": "huiskamer",
-            "device_type": "phone",
-            "manufacturer": "Apple"
-        },
-        user_id="jasper@jtel.nl",
-        urgency=5
-    )
+    if result is None:
+        result = client.execute_intent(**BASIC_INTENT)
 
-    print(f"\n✓ Status: {result['status']}")
+    out.append(f"\n✓ Status: {result['status']}")
     if result['status'] == 'executed':
-        print(f"✓ Message: {result['result']['message']}")
-        print(f"✓ Warmth: {result['result']['warmth']}")
-        print(f"✓ Color: {result['result']['color']}")
-        print(f"✓ Complexity: {result['result']['complexity']['score']}")
+        out.append(f"✓ Message: {result['result']['message']}")
+        out.append(f"✓ Warmth: {result['result']['warmth']}")
+        out.append(f"✓ Color: {result['result']['color']}")
+        out.append(f"✓ Complexity: {result['result']['complexity']['score']}")
+
+    return out
 
 
-def demo_clarification():
+def demo_clarification(result=None, client=None):
     """Demo 2: BALANS Clarification Dialogue"""
-    print("\n" + "=" * 70)
-    print("DEMO 2: Clarification Dialogue")
-    print("=" * 70)
+    out = []
+    out.append("\n" + "=" * 70)
+    out.append("DEMO 2: Clarification Dialogue")
+    out.append("=" * 70)
 
-    client = TibetBettiClient(
-        betti_url="http://192.168.4.76:8081",
-        kit_url="http://192.168.4.76:8081"
-    )
+    if client is None:
+        client = _new_client()
 
     # Ambiguous intent - "living" could mean "huiskamer" or "living room"
-    result = client.execute_intent(
-        intent="turn_on_living_lights",
-        context={"device_type": "phone"},
-        user_id="jasper@jtel.nl"
-    )
+    if result is None:
+        result = client.execute_intent(**CLARIFICATION_INTENT)
 
-    print(f"\n✓ Status: {result['status']}")
+    out.append(f"\n✓ Status: {result['status']}")
     if result['status'] == 'clarification_needed':
-        print(f"❓ Question: {result['result']['clarification_question']}")
-        print(f"  Warmth: {result['result']['warmth']}")
-        print(f"  Color: {result['result']['color']}")
+        out.append(f"❓ Question: {result['result']['clarification_question']}")
+        out.append(f"  Warmth: {result['result']['warmth']}")
+        out.append(f"  Color: {result['result']['color']}")
 
         # User clarifies
-        print("\n→ User clarifies: 'huiskamer'")
+        out.append("\n→ User clarifies: 'huiskamer'")
         result = client.clarify_intent(
             intent="turn_on_lights",
             clarification="huiskamer",
@@ -86,46 +180,37 @@ def demo_clarification():
             user_id="jasper@jtel.nl"
         )
 
-        print(f"\n✓ After clarification: {result['status']}")
+        out.append(f"\n✓ After clarification: {result['status']}")
         if result['status'] == 'executed':
-            print(f"✓ {result['result']['message']}")
+            out.append(f"✓ {result['result']['message']}")
+
+    return out
 
 
-def demo_resource_request():
+def demo_resource_request(result=None, client=None):
     """Demo 3: Resource Request (Internal TIBET)"""
-    print("\n" + "=" * 70)
-    print("DEMO 3: Resource Request - Internal TIBET")
-    print("=" * 70)
+    out = []
+    out.append("\n" + "=" * 70)
+    out.append("DEMO 3: Resource Request - Internal TIBET")
+    out.append("=" * 70)
 
-    client = TibetBettiClient(
-        betti_url="http://192.168.4.76:8081",
-        kit_url="http://192.168.4.76:8081"
-    )
+    if client is None:
+        client = _new_client()
 
     # Large upload with low battery - simulated
-    result = client.execute_intent(
-        intent="upload_large_file",
-        context={
-            "file_size_mb": 500,
-            "did": "phone_001",
-            "device_type": "phone",
-            "battery_pct": 15,  # Low battery!
-            "urgency": 7
-        },
-        user_id="jasper@jtel.nl",
-        deadline="2025-11-28T18:00:00Z"
-    )
+    if result is None:
+        result = client.execute_intent(**RESOURCE_INTENT)
 
-    print(f"\n✓ Status: {result['status']}")
+    out.append(f"\n✓ Status: {result['status']}")
     if result['status'] == 'awaiting_resources':
-        print(f"🔋 Robot Request: {result['result']['robot_request']}")
-        print(f"  Reasoning: {result['result']['robot_reasoning']}")
-        print(f"  Delay: {result['result'].get('estimated_delay_minutes')} minutes")
-        print(f"  Warmth: {result['result']['warmth']}")
-        print(f"  Color: {result['result']['color']}")
+        out.append(f"🔋 Robot Request: {result['result']['robot_request']}")
+        out.append(f"  Reasoning: {result['result']['robot_reasoning']}")
+        out.append(f"  Delay: {result['result'].get('estimated_delay_minutes')} minutes")
+        out.append(f"  Warmth: {result['result']['warmth']}")
+        out.append(f"  Color: {result['result']['color']}")
 
         # User approves charging
-        print("\n→ User approves charging")
+        out.append("\n→ User approves charging")
         result = client.approve_resource_request(
             intent="upload_large_file",
             context={
@@ -137,144 +222,131 @@ def demo_resource_request():
             approved=True
         )
 
-        print(f"\n✓ After approval: {result['status']}")
+        out.append(f"\n✓ After approval: {result['status']}")
 
+    return out
 
-def demo_snaft_violation():
+
+def demo_snaft_violation(result=None, client=None):
     """Demo 4: SNAFT Factory Firewall Violation"""
-    print("\n" + "=" * 70)
-    print("DEMO 4: SNAFT Factory Firewall")
-    print("=" * 70)
+    out = []
+    out.append("\n" + "=" * 70)
+    out.append("DEMO 4: SNAFT Factory Firewall")
+    out.append("=" * 70)
 
-    client = TibetBettiClient(
-        betti_url="http://192.168.4.76:8081",
-        kit_url="http://192.168.4.76:8081"
-    )
+    if client is None:
+        client = _new_client()
 
     # Try to fly drone near airport - BLOCKED by SNAFT
-    result = client.execute_intent(
-        intent="fly_near_airport_schiphol",
-        context={
-            "did": "drone_dji_001",
-            "device_type": "drone",
-            "manufacturer": "DJI",
-            "latitude": 52.308056,
-            "longitude": 4.764167
-        },
-        user_id="jasper@jtel.nl"
-    )
+    if result is None:
+        result = client.execute_intent(**SNAFT_INTENT)
 
-    print(f"\n✓ Status: {result['status']}")
+    out.append(f"\n✓ Status: {result['status']}")
     if result['status'] == 'snaft_blocked':
-        print(f"🚫 Blocked: {result['result']['message']}")
-        print(f"  Reason: {result['result']['reason']}")
-        print(f"  Severity: {result['result']['severity']}")
-        print(f"  Immutable: {result['result']['immutable']}")
+        out.append(f"🚫 Blocked: {result['result']['message']}")
+        out.append(f"  Reason: {result['result']['reason']}")
+        out.append(f"  Severity: {result['result']['severity']}")
+        out.append(f"  Immutable: {result['result']['immutable']}")
 
+    return out
 
-def demo_complexity_split():
+
+def demo_complexity_split(result=None, client=None):
     """Demo 5: Task Too Complex - Split Required"""
-    print("\n" + "=" * 70)
-    print("DEMO 5: Complexity Analysis - Split Required")
-    print("=" * 70)
+    out = []
+    out.append("\n" + "=" * 70)
+    out.append("DEMO 5: Complexity Analysis - Split Required")
+    out.append("=" * 70)
 
-    client = TibetBettiClient(
-        betti_url="http://192.168.4.76:8081",
-        kit_url="http://192.168.4.76:8081"
-    )
+    if client is None:
+        client = _new_client()
 
     # Very complex task
-    result = client.execute_intent(
-        intent="organize_entire_smart_home",
-        context={
-            "humans": 5,
-            "devices": 50,
-            "operations": 200,
-            "device_type": "phone"
-        },
-        user_id="jasper@jtel.nl"
-    )
+    if result is None:
+        result = client.execute_intent(**SPLIT_INTENT)
 
-    print(f"\n✓ Status: {result['status']}")
+    out.append(f"\n✓ Status: {result['status']}")
     if result['status'] == 'split_required':
-        print(f"📋 Message: {result['result']['message']}")
-        print(f"  Complexity Score: {result['result']['complexity']['score']}")
-        print(f"  B0 (Humans): {result['result']['complexity']['b0_humans']}")
-        print(f"  B1 (Devices): {result['result']['complexity']['b1_devices']}")
-        print(f"  B2 (Operations): {result['result']['complexity']['b2_ops']}")
-        print(f"  Warmth: {result['result']['warmth']}")
-        print(f"  Color: {result['result']['color']}")
+        out.append(f"📋 Message: {result['result']['message']}")
+        out.append(f"  Complexity Score: {result['result']['complexity']['score']}")
+        out.append(f"  B0 (Humans): {result['result']['complexity']['b0_humans']}")
+        out.append(f"  B1 (Devices): {result['result']['complexity']['b1_devices']}")
+        out.append(f"  B2 (Operations): {result['result']['complexity']['b2_ops']}")
+        out.append(f"  Warmth: {result['result']['warmth']}")
+        out.append(f"  Color: {result['result']['color']}")
 
         if 'suggested_splits' in result['result']:
-            print(f"\n  Suggested Splits:")
+            out.append(f"\n  Suggested Splits:")
             for split in result['result']['suggested_splits']:
-                print(f"    - {split}")
+                out.append(f"    - {split}")
+
+    return out
 
 
-def demo_balans_analytics():
+def demo_balans_analytics(client=None):
     """Demo 6: BALANS Analytics Dashboard"""
-    print("\n" + "=" * 70)
-    print("DEMO 6: BALANS Analytics Dashboard")
-    print("=" * 70)
+    out = []
+    out.append("\n" + "=" * 70)
+    out.append("DEMO 6: BALANS Analytics Dashboard")
+    out.append("=" * 70)
 
-    client = TibetBettiClient(
-        betti_url="http://192.168.4.76:8081",
-        kit_url="http://192.168.4.76:8081"
-    )
+    if client is None:
+        client = _new_client()
 
     # Get BALANS dashboard
     dashboard = client.get_balans_dashboard(days=7)
 
-    print("\nDecision Distribution (last 7 days):")
+    out.append("\nDecision Distribution (last 7 days):")
     for decision in dashboard.get('decision_distribution', []):
-        print(f"  {decision['decision']:20} {decision['count']:4} times "
-              f"(confidence: {float(decision.get('avg_confidence', 0)):.2f})")
+        out.append(f"  {decision['decision']:20} {decision['count']:4} times "
+                   f"(confidence: {float(decision.get('avg_confidence', 0)):.2f})")
 
-    print("\nWarmth & Color Distribution:")
+    out.append("\nWarmth & Color Distribution:")
     for wc in dashboard.get('warmth_color_distribution', [])[:5]:
-        print(f"  {wc['response_warmth']:15} + {wc['response_color']:10} = {wc['count']:4} times")
+        out.append(f"  {wc['response_warmth']:15} + {wc['response_color']:10} "
+                   f"= {wc['count']:4} times")
+
+    return out
 
 
-def demo_snaft_analytics():
+def demo_snaft_analytics(client=None):
     """Demo 7: SNAFT Analytics Dashboard"""
-    print("\n" + "=" * 70)
-    print("DEMO 7: SNAFT Analytics Dashboard")
-    print("=" * 70)
+    out = []
+    out.append("\n" + "=" * 70)
+    out.append("DEMO 7: SNAFT Analytics Dashboard")
+    out.append("=" * 70)
 
-    client = TibetBettiClient(
-        betti_url="http://192.168.4.76:8081",
-        kit_url="http://192.168.4.76:8081"
-    )
+    if client is None:
+        client = _new_client()
 
     # Get SNAFT rules
-    print("\nSNAFT Rules for Drones:")
+    out.append("\nSNAFT Rules for Drones:")
     drone_rules = client.get_snaft_rules(device_type="drone")
     for rule in drone_rules[:3]:
-        print(f"  {rule['rule_type']:20} {rule['manufacturer']:15} - {rule['reason']}")
+        out.append(f"  {rule['rule_type']:20} {rule['manufacturer']:15} - {rule['reason']}")
 
-    # Get SNAFT dashboard
-    dashboard = client.get_snaft_dashboard(days=7)
+    # Only the top 5 of each SNAFT dashboard list: streamed, parsing stops there
+    out.append("\nTop SNAFT Violations (last 7 days):")
+    for v in islice(client.iter_snaft_dashboard("top_violations", days=7), 5):
+        out.append(f"  {v['device_type']:10} {v['reason']:50} {v['violation_count']:4} times")
 
-    print("\nTop SNAFT Violations (last 7 days):")
-    for v in dashboard.get('top_violations', [])[:5]:
-        print(f"  {v['device_type']:10} {v['reason']:50} {v['violation_count']:4} times")
+    out.append("\nDevice Awareness Levels:")
+    for d in islice(client.iter_snaft_dashboard("device_awareness", days=7), 5):
+        out.append(f"  {d['did']:20} awareness: {d['self_awareness_level']}/10  "
+                   f"(learned {d['snaft_violations_learned']} violations)")
 
-    print("\nDevice Awareness Levels:")
-    for d in dashboard.get('device_awareness', [])[:5]:
-        print(f"  {d['did']:20} awareness: {d['self_awareness_level']}/10  "
-              f"(learned {d['snaft_violations_learned']} violations)")
+    return out
 
 
-def demo_complexity_analysis():
+def demo_complexity_analysis(client=None):
     """Demo 8: Complexity Analysis Without Execution"""
-    print("\n" + "=" * 70)
-    print("DEMO 8: Complexity Analysis (What-If)")
-    print("=" * 70)
+    out = []
+    out.append("\n" + "=" * 70)
+    out.append("DEMO 8: Complexity Analysis (What-If)")
+    out.append("=" * 70)
 
-    client = TibetBettiClient(
-        betti_url="http://192.168.4.76:8081",
-        kit_url="http://192.168.4.76:8081"
-    )
+    if client is None:
+        client = _new_client()
 
     # Analyze without executing
     analysis = client.analyze_complexity(
@@ -288,88 +360,78 @@ def demo_complexity_analysis():
         threshold_profile="default"
     )
 
-    print("\nComplexity Analysis:")
+    out.append("\nComplexity Analysis:")
     comp = analysis['complexity']
-    print(f"  B0 (Humans):       {comp['b0_humans']}")
-    print(f"  B1 (Devices):      {comp['b1_devices']}")
-    print(f"  B2 (Operations):   {comp['b2_ops']}")
-    print(f"  B3 (TBET Steps):   {comp['b3_tbet_steps']}")
-    print(f"  B4 (Time Minutes): {comp['b4_time_minutes']}")
-    print(f"  B5 (Channels):     {comp['b5_channels']}")
-    print(f"\n  Total Score:       {comp['score']}")
-    print(f"  Split Required:    {comp['split_required']}")
+    out.append(f"  B0 (Humans):       {comp['b0_humans']}")
+    out.append(f"  B1 (Devices):      {comp['b1_devices']}")
+    out.append(f"  B2 (Operations):   {comp['b2_ops']}")
+    out.append(f"  B3 (TBET Steps):   {comp['b3_tbet_steps']}")
+    out.append(f"  B4 (Time Minutes): {comp['b4_time_minutes']}")
+    out.append(f"  B5 (Channels):     {comp['b5_channels']}")
+    out.append(f"\n  Total Score:       {comp['score']}")
+    out.append(f"  Split Required:    {comp['split_required']}")
+
+    return out
 
 
-def demo_kit_travel_scenario():
+def demo_kit_travel_scenario(result=None, client=None):
     """Demo 9: Real Kit Travel Scenario - Battery Management"""
-    print("\n" + "=" * 70)
-    print("DEMO 9: Kit Travel Scenario - Krakow Trip")
-    print("=" * 70)
-    print("Scenario: User wants to drive to Krakow, but battery is 25%")
-    print("=" * 70)
-
-    client = TibetBettiClient(
-        betti_url="http://192.168.4.76:8081",
-        kit_url="http://192.168.4.76:8081"
-    )
+    out = []
+    out.append("\n" + "=" * 70)
+    out.append("DEMO 9: Kit Travel Scenario - Krakow Trip")
+    out.append("=" * 70)
+    out.append("Scenario: User wants to drive to Krakow, but battery is 25%")
+    out.append("=" * 70)
 
-    result = client.execute_intent(
-        intent="navigate_to_krakow",
-        context={
-            "did": "tesla_model_3_001",
-            "device_type": "car",
-            "manufacturer": "Tesla",
-            "battery_pct": 25,
-            "destination": "Krakow, Poland",
-            "distance_km": 450,
-            "current_location": "Utrecht, Netherlands",
-            "urgency": 6
-        },
-        user_id="jasper@jtel.nl"
-    )
+    if client is None:
+        client = _new_client()
 
-    print(f"\n✓ BALANS Decision: {result['status']}")
-    print(f"  Message: {result['result']['message']}")
-    print(f"  Warmth: {result['result']['warmth']}")
-    print(f"  Color: {result['result']['color']}")
+    if result is None:
+        result = client.execute_intent(**TRAVEL_INTENT)
+
+    out.append(f"\n✓ BALANS Decision: {result['status']}")
+    out.append(f"  Message: {result['result']['message']}")
+    out.append(f"  Warmth: {result['result']['warmth']}")
+    out.append(f"  Color: {result['result']['color']}")
 
     if result['status'] == 'delayed':
-        print(f"\n  Alternative: {result['result'].get('alternative_action')}")
-        print(f"  Suggested Delay: {result['result'].get('suggested_delay_minutes')} minutes")
+        out.append(f"\n  Alternative: {result['result'].get('alternative_action')}")
+        out.append(f"  Suggested Delay: {result['result'].get('suggested_delay_minutes')} minutes")
+
+    return out
 
 
 def main():
     """Run all demos"""
-    print("""
-╔═══════════════════════════════════════════════════════════════════════╗
-║                                                                       ║
-║              BETTI BALANS - Complete Feature Demo                    ║
-║                                                                       ║
-║  Demonstrates:                                                        ║
-║  • SNAFT factory firewall (immutable safety rules)                   ║
-║  • BALANS pre-execution decisions (resource checks)                  ║
-║  • Internal TIBET (robot permission requests)                        ║
-║  • Clarification dialogues (ambiguity resolution)                    ║
-║  • Warmth & Color emotional responses                                ║
-║  • Complexity analysis (B0-B5 topological dimensions)                ║
-║  • Analytics dashboards                                              ║
-║                                                                       ║
-║  Author: Jasper van der Meent (BETTI Architecture)                   ║
-║                                                                       ║
-╚═══════════════════════════════════════════════════════════════════════╝
-    """)
+    print(_BANNER)
 
     try:
-        # Run all demos
-        demo_basic_execution()
-        demo_clarification()
-        demo_resource_request()
-        demo_snaft_violation()
-        demo_complexity_split()
-        demo_balans_analytics()
-        demo_snaft_analytics()
-        demo_complexity_analysis()
-        demo_kit_travel_scenario()
+        # One client for all demos: every call reuses its pooled keep-alive session
+        with _new_client() as client:
+            # Execute the opening intents of all demos in one round-trip
+            (basic, clarification, resource, snaft, split, travel) = client.execute_intents_batch([
+                BASIC_INTENT, CLARIFICATION_INTENT, RESOURCE_INTENT,
+                SNAFT_INTENT, SPLIT_INTENT, TRAVEL_INTENT
+            ])
+
+            # Demos are independent: run them concurrently on the shared
+            # (thread-safe) session, then print their output in order
+            demos = [
+                lambda: demo_basic_execution(basic, client),
+                lambda: demo_clarification(clarification, client),
+                lambda: demo_resource_request(resource, client),
+                lambda: demo_snaft_violation(snaft, client),
+                lambda: demo_complexity_split(split, client),
+                lambda: demo_balans_analytics(client),
+                lambda: demo_snaft_analytics(client),
+                lambda: demo_complexity_analysis(client),
+                lambda: demo_kit_travel_scenario(travel, client),
+            ]
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                outputs = list(pool.map(lambda demo: demo(), demos))
+
+        for out in outputs:
+            print("\n".join(out))
 
         print("\n" + "=" * 70)
         print("✓ All demos completed successfully!")
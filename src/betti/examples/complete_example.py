@@ -18,11 +18,38 @@ from tibet_betti_client import (
     SenseRule
 )
 
+_RULE = "=" * 70
+
+_SUMMARY = """
+Summary:
+✓ Trust relationship established (FIR/A)
+✓ Basic TIBET intent sent
+✓ Scheduled TIBET intent sent
+✓ Context updated in KIT
+✓ Sense rule created
+✓ Combined flow tested (Context → Sense → TIBET)
+✓ WebSocket tested
+
+Your system is ready to:
+1. Establish trust relationships
+2. Send TIBET intents with time windows
+3. Integrate with KIT context/sense system
+4. Receive real-time updates via WebSocket
+
+Next steps:
+- Integrate into your app
+- Add more sense rules
+- Build automation flows
+- Scale to production!
+
+TIBET declares. BETTI coordinates. FIR/A trusts. 🚀
+"""
+
 
 def main():
-    print("="*70)
+    print(_RULE)
     print("  TIBET-BETTI Complete Example")
-    print("="*70)
+    print(_RULE)
 
     # Initialize client
     print("\n1. Initializing client...")
@@ -240,34 +267,11 @@ def main():
     # Done!
     # ========================================================================
 
-    print("\n" + "="*70)
+    print("\n" + _RULE)
     print("  ✅ Example Complete!")
-    print("="*70)
-
-    print(f"""
-Summary:
-✓ Trust relationship established (FIR/A)
-✓ Basic TIBET intent sent
-✓ Scheduled TIBET intent sent
-✓ Context updated in KIT
-✓ Sense rule created
-✓ Combined flow tested (Context → Sense → TIBET)
-✓ WebSocket tested
+    print(_RULE)
 
-Your system is ready to:
-1. Establish trust relationships
-2. Send TIBET intents with time windows
-3. Integrate with KIT context/sense system
-4. Receive real-time updates via WebSocket
-
-Next steps:
-- Integrate into your app
-- Add more sense rules
-- Build automation flows
-- Scale to production!
-
-TIBET declares. BETTI coordinates. FIR/A trusts. 🚀
-    """)
+    print(_SUMMARY)
 
 
 if __name__ == "__main__":
@@ -2,49 +2,105 @@
 TIBET (Time Intent Based Event Token) classes
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
 
+from ._compat import _SLOTS, _dumps
 
-@dataclass
+_NS_PER_S = 1_000_000_000
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_ns(dt: datetime) -> int:
+    """datetime -> ns since epoch (naive datetimes are UTC, as utcnow() gives)"""
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return (dt - _EPOCH) // _MICROSECOND * 1000
+
+
+def _to_datetime(ns: int) -> datetime:
+    """ns since epoch -> naive UTC datetime"""
+    return _EPOCH + timedelta(microseconds=ns // 1000)
+
+
+@dataclass(init=False, **_SLOTS)
 class TimeWindow:
-    """Time window for TIBET intent execution"""
+    """
+    Time window for TIBET intent execution
+
+    Stored as integer ns since the epoch (UTC), so checks like is_active()
+    are plain integer compares; start/end are materialized as naive UTC
+    datetimes on access.
+    """
 
-    start: datetime
-    end: datetime
+    start_ns: int
+    end_ns: int
+
+    # (start_ns, end_ns, start iso, end iso) of the last to_dict()
+    _iso: Optional[Tuple[int, int, str, str]] = field(default=None, repr=False, compare=False)
+
+    def __init__(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        *,
+        start_ns: Optional[int] = None,
+        end_ns: Optional[int] = None
+    ):
+        if (start is None and start_ns is None) or (end is None and end_ns is None):
+            raise TypeError("TimeWindow needs start/end or start_ns/end_ns")
+        self.start_ns = _to_ns(start) if start_ns is None else start_ns
+        self.end_ns = _to_ns(end) if end_ns is None else end_ns
+        self._iso = None
+
+    @property
+    def start(self) -> datetime:
+        return _to_datetime(self.start_ns)
+
+    @start.setter
+    def start(self, value: datetime):
+        self.start_ns = _to_ns(value)
+
+    @property
+    def end(self) -> datetime:
+        return _to_datetime(self.end_ns)
+
+    @end.setter
+    def end(self, value: datetime):
+        self.end_ns = _to_ns(value)
 
     def duration_seconds(self) -> int:
         """Get duration in seconds"""
-        return int((self.end - self.start).total_seconds())
+        ns = self.end_ns - self.start_ns
+        # Truncate toward zero, like int(timedelta.total_seconds())
+        return ns // _NS_PER_S if ns >= 0 else -(-ns // _NS_PER_S)
 
     def is_active(self) -> bool:
         """Check if current time is within window"""
-        now = datetime.utcnow()
-        return self.start <= now <= self.end
+        return self.start_ns <= time.time_ns() <= self.end_ns
 
     def time_until_start(self) -> Optional[timedelta]:
         """Time until window starts (None if already started)"""
-        now = datetime.utcnow()
-        if now >= self.start:
+        now = time.time_ns()
+        if now >= self.start_ns:
             return None
-        return self.start - now
+        return timedelta(microseconds=(self.start_ns - now) // 1000)
 
     def time_until_end(self) -> Optional[timedelta]:
         """Time until window ends (None if already ended)"""
-        now = datetime.utcnow()
-        if now >= self.end:
+        now = time.time_ns()
+        if now >= self.end_ns:
             return None
-        return self.end - now
+        return timedelta(microseconds=(self.end_ns - now) // 1000)
 
     @classmethod
     def immediate(cls) -> "TimeWindow":
         """Create immediate time window (30 seconds)"""
-        now = datetime.utcnow()
-        return cls(
-            start=now,
-            end=now + timedelta(seconds=30)
-        )
+        now = time.time_ns()
+        return cls(start_ns=now, end_ns=now + 30 * _NS_PER_S)
 
     @classmethod
     def from_now(cls, **kwargs) -> "TimeWindow":
@@ -58,9 +114,9 @@ class TimeWindow:
             >>> TimeWindow.from_now(hours=2)  # Next 2 hours
             >>> TimeWindow.from_now(minutes=30)  # Next 30 minutes
         """
-        now = datetime.utcnow()
-        duration = timedelta(**kwargs)
-        return cls(start=now, end=now + duration)
+        now = time.time_ns()
+        duration_ns = timedelta(**kwargs) // _MICROSECOND * 1000
+        return cls(start_ns=now, end_ns=now + duration_ns)
 
     @classmethod
     def scheduled(
@@ -79,23 +135,34 @@ class TimeWindow:
             >>> start = datetime(2025, 11, 28, 14, 30)  # 14:30
             >>> TimeWindow.scheduled(start, duration_minutes=60)
         """
-        return cls(
-            start=start,
-            end=start + timedelta(minutes=duration_minutes)
-        )
+        start_ns = _to_ns(start)
+        return cls(start_ns=start_ns, end_ns=start_ns + duration_minutes * 60 * _NS_PER_S)
 
     def to_dict(self) -> Dict[str, str]:
-        """Convert to dict"""
+        """Convert to dict (ISO strings are formatted once per start/end value)"""
+        iso = self._iso
+        if iso is None or iso[0] != self.start_ns or iso[1] != self.end_ns:
+            iso = self._iso = (
+                self.start_ns,
+                self.end_ns,
+                self.start.isoformat(),
+                self.end.isoformat()
+            )
         return {
-            "start": self.start.isoformat(),
-            "end": self.end.isoformat(),
+            "start": iso[2],
+            "end": iso[3],
             "duration_seconds": self.duration_seconds()
         }
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Constraints:
-    """Constraints for TIBET intent execution"""
+    """
+    Constraints for TIBET intent execution
+
+    Immutable, so to_dict() is built once and reused: one Constraints shared
+    by many TIBETs serializes once. Treat the returned dict as read-only.
+    """
 
     max_retries: int = 3
     max_duration_seconds: Optional[int] = None
@@ -103,18 +170,22 @@ class Constraints:
     safe_fail_action: str = "notify_user"
     priority: int = 5  # 1-10
 
+    _dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dict"""
-        return {
-            "max_retries": self.max_retries,
-            "max_duration_seconds": self.max_duration_seconds,
-            "required_conditions": self.required_conditions,
-            "safe_fail_action": self.safe_fail_action,
-            "priority": self.priority
-        }
-
-
-@dataclass
+        if self._dict is None:
+            object.__setattr__(self, "_dict", {
+                "max_retries": self.max_retries,
+                "max_duration_seconds": self.max_duration_seconds,
+                "required_conditions": self.required_conditions,
+                "safe_fail_action": self.safe_fail_action,
+                "priority": self.priority
+            })
+        return self._dict
+
+
+@dataclass(**_SLOTS)
 class Tibet:
     """
     TIBET = Time Intent Based Event Token
@@ -148,6 +219,10 @@ class Tibet:
             "trust_token_ref": self.trust_token_ref
         }
 
+    def to_json_bytes(self) -> bytes:
+        """JSON-encoded to_dict(), ready for ws.send() or requests.post(data=...)"""
+        return _dumps(self.to_dict())
+
     @classmethod
     def create(
         cls,
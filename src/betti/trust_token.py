@@ -2,12 +2,100 @@
 Trust Token (FIR/A) classes
 """
 
-from typing import Optional, Dict, Any
-from dataclasses import dataclass
+import sys
+import threading
+import weakref
+from enum import IntEnum
+from typing import Optional, Dict, Any, Iterable, List, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
 
+from ._compat import _SLOTS, _dumps, _intern
+from .tibet import _to_datetime, _to_ns
 
-@dataclass
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# TrustToken also needs a __weakref__ slot for the get_or_create() registry,
+# which dataclass only adds on 3.11+ (3.10 keeps a __dict__ instead)
+_TOKEN_SLOTS = {"slots": True, "weakref_slot": True} if sys.version_info >= (3, 11) else {}
+
+# token_id -> live TrustToken, see TrustToken.get_or_create()
+_tokens: "weakref.WeakValueDictionary[str, TrustToken]" = weakref.WeakValueDictionary()
+_tokens_lock = threading.Lock()
+
+
+# Placeholder for a party the server did not name
+_UNKNOWN = sys.intern("unknown")
+
+
+# Missing timestamp in a packed token array (see TrustToken.to_array)
+NO_NS = -(2 ** 63)
+
+if HAS_NUMPY:
+    # One fixed-width record per token; strings are StringTable codes
+    TOKEN_DTYPE = np.dtype([
+        ("token_id", np.int32),
+        ("initiator", np.int32),
+        ("responder", np.int32),
+        ("trust_level", np.uint8),
+        ("established_at_ns", np.int64),
+        ("last_used_ns", np.int64),
+        ("total_interactions", np.int64)
+    ])
+
+
+class StringTable:
+    """
+    Shared str <-> int code table for packed token arrays
+
+    Codes are dense (0, 1, 2, ...) and stable for the table's lifetime, so
+    arrays packed with the same table can be compared and joined on them.
+    """
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.strings: List[str] = []
+
+    def code(self, value: str) -> int:
+        """Code for value, assigning the next one on first sight"""
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.strings)
+            self.strings.append(_intern(value))
+        return code
+
+    def __getitem__(self, code: int) -> str:
+        return self.strings[code]
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+
+class TrustLevel(IntEnum):
+    """Trust levels 0-5 (see papers/TBET-BETTI-ARCHITECTURE.md)"""
+
+    PUBLIC = 0
+    PERSONAL = 1
+    PROFESSIONAL = 2
+    FINANCIAL = 3
+    LEGAL_MEDICAL = 4
+    GOVERNMENT = 5
+
+
+def _ns_iso(ns: Optional[int], memo: Optional[Tuple[int, str]]) -> Optional[Tuple[int, str]]:
+    """(ns, ISO string) for ns, reusing memo while ns is unchanged"""
+    if ns is None:
+        return None
+    if memo is None or memo[0] != ns:
+        memo = (ns, _to_datetime(ns).isoformat())
+    return memo
+
+
+@dataclass(init=False, eq=False, **_TOKEN_SLOTS)
 class TrustToken:
     """
     Trust Token = "Wij Kennen Elkaar"
@@ -18,35 +106,232 @@ class TrustToken:
     - History (how many interactions)
     - Context (what's the relationship about)
     - Constraints (what's allowed)
+
+    Timestamps are stored as integer ns since the epoch (UTC), like
+    TimeWindow; established_at/last_used are materialized as naive UTC
+    datetimes on access.
     """
 
     token_id: str
     initiator: str
     responder: str
-    trust_level: int = 1  # 0-5
-    established_at: Optional[datetime] = None
-    last_used: Optional[datetime] = None
-    total_interactions: int = 0
+    trust_level: TrustLevel
+    established_at_ns: Optional[int]
+    last_used_ns: Optional[int]
+    total_interactions: int
+
+    # (ns, ISO string) of the last to_dict()/to_tuple(), reused while unchanged
+    _established_iso: Optional[Tuple[int, str]] = field(default=None, repr=False, compare=False)
+    _last_used_iso: Optional[Tuple[int, str]] = field(default=None, repr=False, compare=False)
+
+    def __init__(
+        self,
+        token_id: str,
+        initiator: str,
+        responder: str,
+        trust_level: int = TrustLevel.PERSONAL,  # 0-5
+        established_at: Optional[datetime] = None,
+        last_used: Optional[datetime] = None,
+        total_interactions: int = 0,
+        *,
+        established_at_ns: Optional[int] = None,
+        last_used_ns: Optional[int] = None
+    ):
+        self.token_id = token_id
+        self.initiator = _intern(initiator)
+        self.responder = _intern(responder)
+        # Raises ValueError outside 0-5
+        self.trust_level = TrustLevel(trust_level)
+        self.established_at_ns = (
+            established_at_ns if established_at is None else _to_ns(established_at)
+        )
+        self.last_used_ns = last_used_ns if last_used is None else _to_ns(last_used)
+        self.total_interactions = total_interactions
+        self._established_iso = None
+        self._last_used_iso = None
+
+    @classmethod
+    def get_or_create(cls, token_id: str, *args, **kwargs) -> "TrustToken":
+        """
+        The live token for token_id, created from the arguments if there is none
+
+        Code paths that see the same token share one object (and its
+        last_used/total_interactions updates). Arguments are ignored when
+        the token already exists; it is dropped once nothing references it.
+        """
+        token = _tokens.get(token_id)
+        if token is None:
+            with _tokens_lock:
+                token = _tokens.get(token_id)
+                if token is None:
+                    token = _tokens[token_id] = cls(token_id, *args, **kwargs)
+        return token
+
+    @property
+    def established_at(self) -> Optional[datetime]:
+        ns = self.established_at_ns
+        return None if ns is None else _to_datetime(ns)
+
+    @established_at.setter
+    def established_at(self, value: Optional[datetime]):
+        self.established_at_ns = None if value is None else _to_ns(value)
+
+    @property
+    def last_used(self) -> Optional[datetime]:
+        ns = self.last_used_ns
+        return None if ns is None else _to_datetime(ns)
+
+    @last_used.setter
+    def last_used(self, value: Optional[datetime]):
+        self.last_used_ns = None if value is None else _to_ns(value)
+
+    # Identity is token_id: equal ids are the same token, whatever its counters say
+    def __eq__(self, other):
+        if not isinstance(other, TrustToken):
+            return NotImplemented
+        # Shared instances from get_or_create() match on identity alone
+        return self is other or self.token_id == other.token_id
+
+    def __hash__(self):
+        # str caches its own hash, so there is nothing to memoize here
+        return hash(self.token_id)
 
     def is_valid(self) -> bool:
         """Check if token is valid"""
         # TODO: Add expiry, revocation checks
         return True
 
+    # Order of to_tuple(): dict(zip(TrustToken.FIELDS, t)) equals to_dict()
+    FIELDS = (
+        "token_id",
+        "initiator",
+        "responder",
+        "trust_level",
+        "established_at",
+        "last_used",
+        "total_interactions"
+    )
+
+    def _isos(self) -> Tuple[Optional[str], Optional[str]]:
+        established = self._established_iso = _ns_iso(self.established_at_ns, self._established_iso)
+        last_used = self._last_used_iso = _ns_iso(self.last_used_ns, self._last_used_iso)
+        return (
+            None if established is None else established[1],
+            None if last_used is None else last_used[1]
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dict"""
+        established_at, last_used = self._isos()
         return {
             "token_id": self.token_id,
             "initiator": self.initiator,
             "responder": self.responder,
             "trust_level": self.trust_level,
-            "established_at": self.established_at.isoformat() if self.established_at else None,
-            "last_used": self.last_used.isoformat() if self.last_used else None,
+            "established_at": established_at,
+            "last_used": last_used,
             "total_interactions": self.total_interactions
         }
 
+    def to_tuple(self) -> Tuple[Any, ...]:
+        """to_dict() values in FIELDS order, for wire formats that carry the schema once"""
+        established_at, last_used = self._isos()
+        return (
+            self.token_id,
+            self.initiator,
+            self.responder,
+            self.trust_level,
+            established_at,
+            last_used,
+            self.total_interactions
+        )
+
+    def to_json_bytes(self) -> bytes:
+        """JSON-encoded to_dict() (one C call with orjson), like Tibet.to_json_bytes()"""
+        return _dumps(self.to_dict())
+
+    @classmethod
+    def to_columns(cls, tokens: Iterable["TrustToken"]) -> Dict[str, List[Any]]:
+        """
+        Tokens as columns: {field: [value per token]}, for bulk export
+
+        Timestamps stay datetime objects (see to_json_bulk).
+        """
+        tokens = list(tokens)
+        return {
+            "token_id": [t.token_id for t in tokens],
+            "initiator": [t.initiator for t in tokens],
+            "responder": [t.responder for t in tokens],
+            "trust_level": [t.trust_level for t in tokens],
+            "established_at": [t.established_at for t in tokens],
+            "last_used": [t.last_used for t in tokens],
+            "total_interactions": [t.total_interactions for t in tokens]
+        }
+
+    @classmethod
+    def to_array(cls, tokens: Iterable["TrustToken"], table: StringTable) -> "np.ndarray":
+        """
+        Tokens as a packed numpy record array (TOKEN_DTYPE)
+
+        token_id/initiator/responder are stored as table codes and missing
+        timestamps as NO_NS, so graph sweeps (expiry, last use) can run as
+        numpy comparisons on the columns instead of per-token Python.
 
-@dataclass
+        Example:
+            >>> table = StringTable()
+            >>> packed = TrustToken.to_array(tokens, table)
+            >>> stale = packed[packed["last_used_ns"] < cutoff_ns]
+        """
+        if not HAS_NUMPY:
+            raise ImportError(
+                "numpy not installed. "
+                "Install with: pip install numpy"
+            )
+        code = table.code
+        return np.array([
+            (
+                code(t.token_id),
+                code(t.initiator),
+                code(t.responder),
+                t.trust_level,
+                NO_NS if t.established_at_ns is None else t.established_at_ns,
+                NO_NS if t.last_used_ns is None else t.last_used_ns,
+                t.total_interactions
+            )
+            for t in tokens
+        ], dtype=TOKEN_DTYPE)
+
+    @classmethod
+    def from_array(cls, array: "np.ndarray", table: StringTable) -> List["TrustToken"]:
+        """Tokens back from to_array() with the same table"""
+        strings = table.strings
+        return [
+            cls(
+                strings[token_id],
+                strings[initiator],
+                strings[responder],
+                trust_level,
+                total_interactions=total_interactions,
+                established_at_ns=None if established_at_ns == NO_NS else established_at_ns,
+                last_used_ns=None if last_used_ns == NO_NS else last_used_ns
+            )
+            for (token_id, initiator, responder, trust_level,
+                 established_at_ns, last_used_ns, total_interactions) in array.tolist()
+        ]
+
+    @classmethod
+    def to_json_bulk(cls, tokens: Iterable["TrustToken"]) -> bytes:
+        """
+        to_columns() as JSON in one call, timestamps in to_dict()'s ISO format
+
+        Example:
+            >>> body = TrustToken.to_json_bulk(tokens)
+            >>> requests.post(url, data=body, headers={"Content-Type": "application/json"})
+        """
+        return _dumps(cls.to_columns(tokens))
+
+
+@dataclass(**_SLOTS)
 class FIRARelationship:
     """
     FIR/A = Formalized Intent Relationship Acknowledged
@@ -56,19 +341,26 @@ class FIRARelationship:
 
     id: str
     token: str  # Token ID (often same as id)
-    initiator: Optional[str] = None
-    responder: Optional[str] = None
-    trust_level: int = 1
+    initiator: str = _UNKNOWN
+    responder: str = _UNKNOWN
+    trust_level: TrustLevel = TrustLevel.PERSONAL  # 0-5, ints accepted
     continuity_hash: Optional[str] = None
     did_key: Optional[Any] = None  # DIDKey object
     hid_key: Optional[Any] = None  # HIDKey object (never transmitted!)
 
+    def __post_init__(self):
+        # Raises ValueError outside 0-5
+        self.trust_level = TrustLevel(self.trust_level)
+        # None/"" (e.g. missing from a /relation response) become _UNKNOWN once, here
+        self.initiator = _intern(self.initiator or _UNKNOWN)
+        self.responder = _intern(self.responder or _UNKNOWN)
+
     def to_trust_token(self) -> TrustToken:
         """Convert to TrustToken"""
         return TrustToken(
             token_id=self.token,
-            initiator=self.initiator or "unknown",
-            responder=self.responder or "unknown",
+            initiator=self.initiator,
+            responder=self.responder,
             trust_level=self.trust_level
         )
 
@@ -2,19 +2,97 @@
 WebSocket client for real-time TIBET/context updates
 """
 
+import importlib.util
 import json
 import logging
+import queue
+import random
+import socket
 import threading
-from typing import Optional, Callable, Dict, Any
+from collections import deque
+from concurrent.futures import Future, wait
+from typing import Optional, Callable, Dict, Any, Union
 
-try:
-    import websocket
-    HAS_WEBSOCKET = True
-except ImportError:
-    HAS_WEBSOCKET = False
+# _dumps() gives UTF-8 bytes: websocket-client sends bytes in a TEXT frame
+# as-is (it only encodes str), so no decode/re-encode round-trip
+from ._compat import _dumps, _loads
+
+# websocket-client is imported by the first TibetWebSocket(), not with the SDK
+HAS_WEBSOCKET = importlib.util.find_spec("websocket") is not None
+websocket = None
+
+# First character of a frame that should decode to a JSON object/array (either
+# frame type: str or bytes); other frames that fail to decode are heartbeats
+# or plain text, and are not worth an error
+_JSON_START = frozenset("{[ \t\r\n") | frozenset(bytes([b]) for b in b"{[ \t\r\n")
 
 logger = logging.getLogger(__name__)
 
+# Background connections run on reused daemon threads instead of one new
+# thread per start(). Daemon, unlike ThreadPoolExecutor workers, so an open
+# connection never blocks interpreter exit (as the plain thread did not).
+# A connection holds its thread until closed: past WS_MAX_WORKERS busy
+# workers, start() gets a one-off overflow thread rather than waiting.
+WS_MAX_WORKERS = 64
+WS_IDLE_TIMEOUT_S = 60.0
+
+_jobs: "queue.SimpleQueue" = queue.SimpleQueue()
+_pool_lock = threading.Lock()
+_workers = 0
+_idle = 0  # waiting workers not yet claimed by a queued job
+
+
+def _worker():
+    """Run queued connections; exit after WS_IDLE_TIMEOUT_S without work"""
+    global _workers, _idle
+    while True:
+        try:
+            future, fn = _jobs.get(timeout=WS_IDLE_TIMEOUT_S)
+        except queue.Empty:
+            with _pool_lock:
+                # A job put under the lock since the timeout still needs us
+                if _jobs.empty():
+                    _idle -= 1
+                    _workers -= 1
+                    return
+            continue
+
+        _run_job(future, fn)
+
+        with _pool_lock:
+            _idle += 1
+
+
+def _run_job(future: Future, fn: Callable[[], None]):
+    if future.set_running_or_notify_cancel():
+        try:
+            fn()
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(None)
+
+
+def _submit(fn: Callable[[], None]) -> Future:
+    """Run fn on an idle pool thread, a new one, or (at WS_MAX_WORKERS) an overflow thread"""
+    global _workers, _idle
+    future: Future = Future()
+    with _pool_lock:
+        if _idle:
+            _idle -= 1
+        elif _workers < WS_MAX_WORKERS:
+            _workers += 1
+            threading.Thread(target=_worker, name="tibet-ws", daemon=True).start()
+        else:
+            # Queued, it would wait until some other connection closes
+            logger.info(f"All {WS_MAX_WORKERS} WebSocket workers busy, starting an overflow thread")
+            threading.Thread(
+                target=_run_job, args=(future, fn), name="tibet-ws-overflow", daemon=True
+            ).start()
+            return future
+        _jobs.put((future, fn))
+    return future
+
 
 class TibetWebSocket:
     """
@@ -42,7 +120,13 @@ class TibetWebSocket:
         on_tibet: Optional[Callable[[Dict[str, Any]], None]] = None,
         on_context_update: Optional[Callable[[Dict[str, Any]], None]] = None,
         on_error: Optional[Callable[[Exception], None]] = None,
-        on_close: Optional[Callable[[], None]] = None
+        on_close: Optional[Callable[[], None]] = None,
+        tcp_nodelay: bool = True,
+        ping_interval: float = 10,
+        ping_timeout: float = 8,
+        reconnect: bool = True,
+        max_backoff: float = 30,
+        send_queue_size: int = 1024
     ):
         """
         Initialize WebSocket client
@@ -54,12 +138,21 @@ class TibetWebSocket:
             on_context_update: Optional callback for context updates
             on_error: Optional error callback
             on_close: Optional close callback
+            tcp_nodelay: Disable Nagle so small TIBET frames go out immediately
+            ping_interval: Seconds between keep-alive pings (0 disables)
+            ping_timeout: Seconds to wait for a pong (must be < ping_interval)
+            reconnect: Reconnect with exponential backoff when the connection drops
+            max_backoff: Upper bound for the reconnect delay in seconds
+            send_queue_size: Messages buffered while disconnected (oldest dropped)
         """
         if not HAS_WEBSOCKET:
             raise ImportError(
                 "websocket-client not installed. "
                 "Install with: pip install websocket-client"
             )
+        global websocket
+        if websocket is None:
+            import websocket
 
         self.url = url
         self.on_message = on_message
@@ -68,29 +161,54 @@ class TibetWebSocket:
         self.on_error = on_error
         self.on_close = on_close
 
+        # Type-specific callbacks, looked up once per message
+        self._dispatch_table: Dict[str, Callable[[Dict[str, Any]], None]] = {}
+        if on_tibet:
+            self._dispatch_table["tibet"] = on_tibet
+        if on_context_update:
+            self._dispatch_table["context_update"] = on_context_update
+        self.tcp_nodelay = tcp_nodelay
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout if ping_interval else None
+        self.reconnect = reconnect
+        self.max_backoff = max_backoff
+
         self.ws: Optional[websocket.WebSocketApp] = None
-        self.thread: Optional[threading.Thread] = None
         self.running = False
 
+        # Background run on the worker pool, and the thread running it
+        self._future: Optional[Future] = None
+        self._runner: Optional[threading.Thread] = None
+
+        # Outgoing messages while disconnected, flushed FIFO on (re)connect
+        self._send_queue: deque = deque(maxlen=send_queue_size)
+        self._send_lock = threading.Lock()
+        self._shutting_down = threading.Event()
+        self._backoff = 1.0
+
     def _handle_message(self, ws, message):
         """Internal message handler"""
         try:
-            data = json.loads(message)
+            data = _loads(message)
+        except json.JSONDecodeError:
+            # Heartbeats and plain text are expected; a broken object/array is not
+            if message[:1] in _JSON_START:
+                logger.error(f"Invalid JSON: {message}")
+            else:
+                logger.debug(f"Ignoring non-JSON frame: {message[:32]!r}")
+            return
 
-            # Call general message handler
+        try:
+            # Call general message handler (any JSON value, scalars included)
             self.on_message(data)
 
-            # Call specific handlers
-            msg_type = data.get("type")
-
-            if msg_type == "tibet" and self.on_tibet:
-                self.on_tibet(data)
+            # Call specific handler (dict.get: an itemgetter("type") is no faster,
+            # and far slower via KeyError for messages without a type)
+            if data.__class__ is dict:
+                callback = self._dispatch_table.get(data.get("type"))
+                if callback:
+                    callback(data)
 
-            elif msg_type == "context_update" and self.on_context_update:
-                self.on_context_update(data)
-
-        except json.JSONDecodeError:
-            logger.error(f"Invalid JSON: {message}")
         except Exception as e:
             logger.error(f"Error handling message: {e}")
             if self.on_error:
@@ -112,7 +230,28 @@ class TibetWebSocket:
     def _handle_open(self, ws):
         """Internal open handler"""
         logger.info(f"WebSocket connected to {self.url}")
-        self.running = True
+        self._backoff = 1.0
+
+        with self._send_lock:
+            self.running = True
+            while self._send_queue:
+                message = self._send_queue.popleft()
+                try:
+                    ws.send(message)
+                except Exception as e:
+                    logger.warning(f"Flush failed, keeping {len(self._send_queue) + 1} queued: {e}")
+                    self._send_queue.appendleft(message)
+                    break
+
+    def _sockopt(self) -> tuple:
+        """Socket options for run_forever (frames are already sent in one write)"""
+        if not self.tcp_nodelay:
+            return ()
+        opts = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+        # Linux: ack immediately instead of delayed-ack (up to 40ms)
+        if hasattr(socket, "TCP_QUICKACK"):
+            opts.append((socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1))
+        return tuple(opts)
 
     def start(self, block: bool = False):
         """
@@ -126,50 +265,84 @@ class TibetWebSocket:
             >>> # or
             >>> ws.start(block=True)   # Blocks until closed
         """
-        self.ws = websocket.WebSocketApp(
-            self.url,
-            on_open=self._handle_open,
-            on_message=self._handle_message,
-            on_error=self._handle_error,
-            on_close=self._handle_close
-        )
+        self._shutting_down.clear()
 
         if block:
             # Run in current thread (blocking)
-            self.ws.run_forever()
+            self._run()
         else:
-            # Run in background thread
-            self.thread = threading.Thread(
-                target=self.ws.run_forever,
-                daemon=True
-            )
-            self.thread.start()
+            # Run on a pooled background thread
+            self._future = _submit(self._run)
             logger.info("WebSocket started in background")
 
-    def send(self, data: Dict[str, Any]):
+    def _run(self):
+        """Connect, and reconnect with jittered exponential backoff until closed"""
+        self._runner = threading.current_thread()
+        sockopt = self._sockopt()
+
+        while not self._shutting_down.is_set():
+            self.ws = websocket.WebSocketApp(
+                self.url,
+                on_open=self._handle_open,
+                on_message=self._handle_message,
+                on_error=self._handle_error,
+                on_close=self._handle_close
+            )
+            self.ws.run_forever(
+                sockopt=sockopt,
+                ping_interval=self.ping_interval,
+                ping_timeout=self.ping_timeout
+            )
+
+            if not self.reconnect:
+                break
+
+            delay = self._backoff * random.uniform(0.5, 1.0)
+            self._backoff = min(self._backoff * 2, self.max_backoff)
+            logger.info(f"WebSocket reconnecting in {delay:.1f}s")
+            if self._shutting_down.wait(delay):
+                break
+
+    def send(self, data: Union[Dict[str, Any], bytes]):
         """
         Send message through WebSocket
 
+        While disconnected (and reconnect is enabled) the message is queued
+        and sent once the connection is back.
+
         Args:
-            data: Data to send (will be JSON-encoded)
+            data: Data to send (will be JSON-encoded), or already encoded
+                bytes such as Tibet.to_json_bytes()
 
         Example:
             >>> ws.send({"type": "ping"})
         """
-        if not self.ws or not self.running:
-            raise RuntimeError("WebSocket not connected")
+        message = data if isinstance(data, bytes) else _dumps(data)
+
+        with self._send_lock:
+            if self.ws and self.running:
+                try:
+                    self.ws.send(message)
+                    return
+                except websocket.WebSocketConnectionClosedException:
+                    if not self.reconnect:
+                        raise
+            elif not self.reconnect:
+                raise RuntimeError("WebSocket not connected")
 
-        message = json.dumps(data)
-        self.ws.send(message)
+            self._send_queue.append(message)
 
     def close(self):
-        """Close WebSocket connection"""
+        """Close WebSocket connection (stops reconnecting)"""
+        self._shutting_down.set()
+
         if self.ws:
             self.ws.close()
             self.running = False
 
-        if self.thread and self.thread.is_alive():
-            self.thread.join(timeout=2)
+        # Not from a callback on the connection's own thread: it cannot finish while we wait
+        if self._future and self._runner is not threading.current_thread():
+            wait([self._future], timeout=2)
 
         logger.info("WebSocket closed")
 
@@ -0,0 +1,47 @@
+"""
+Regression tests for BETTIGPUBudget queue ordering (gfx.betti_budget)
+"""
+
+from datetime import datetime, timedelta
+
+from gfx.betti_budget import BETTIGPUBudget, ComputeCost
+
+
+def test_equal_wait_scores_keep_registration_order():
+    betti = BETTIGPUBudget()
+    betti.register_actor("zeta", priority_orbit=2)
+    betti.register_actor("alpha", priority_orbit=2)
+    assert betti.get_queue_position("zeta")[0] == 1
+    assert betti.get_queue_position("alpha")[0] == 2
+
+
+def test_reregister_actor_moves_it_in_the_queue():
+    betti = BETTIGPUBudget()
+    betti.register_actor("a", priority_orbit=1)
+    betti.register_actor("b", priority_orbit=3)
+    betti.register_actor("a", priority_orbit=5)
+    assert betti.get_queue_position("b")[0] == 1
+    assert betti.get_queue_position("a")[0] == 2
+
+    betti.register_actor("a", priority_orbit=3)  # Ties with b, registered first
+    assert betti.get_queue_position("a")[0] == 1
+
+
+def test_last_request_derived_from_charge():
+    betti = BETTIGPUBudget()
+    budget = betti.register_actor("a")
+    assert budget.last_request is None
+
+    betti.charge("a", betti.calculate_cost("a", vram_mb=100, duration_seconds=1))
+    assert abs(datetime.now() - budget.last_request) < timedelta(seconds=1)
+
+
+def test_compute_cost_reason():
+    betti = BETTIGPUBudget()
+    betti.register_actor("a", daily_vram_seconds=10)
+    assert betti.calculate_cost("a", vram_mb=1, duration_seconds=1).reason == "Budget OK"
+    denied = betti.calculate_cost("a", vram_mb=100, duration_seconds=1)
+    assert denied.reason == "VRAM budget overschreden: nodig 100, beschikbaar 10"
+
+    cost = ComputeCost(1.0, 1.0, 1.0, 1.0, True, "custom")
+    assert cost.reason == "custom"
@@ -0,0 +1,130 @@
+"""
+Regression tests for TibetBettiClient caching and chaining (betti.client)
+"""
+
+import threading
+import time
+
+import pytest
+
+from betti.client import TibetBettiClient
+
+
+class _FakeServer:
+    """Stands in for TibetBettiClient._send: records calls, answers per URL path"""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.calls = []
+
+    def __call__(self, method, url, json_data, params, parse_json):
+        path = url.split("://", 1)[1].split("/", 1)[1]
+        self.calls.append((method, path, json_data, dict(params or {})))
+        response = self.routes[path]
+        return response(json_data, params or {}) if callable(response) else response
+
+
+def _client(routes):
+    client = TibetBettiClient("http://betti", kit_url="http://kit")
+    client._send = server = _FakeServer(routes)
+    return client, server
+
+
+def test_invalid_trust_level_is_rejected_before_post():
+    client, server = _client({"fira/init": {"fir_a_id": "f1", "continuity_hash": "h0"}})
+
+    with pytest.raises(ValueError):
+        client.establish_trust("app", "device", trust_level=7)
+    assert server.calls == []
+
+
+def test_reused_fira_is_a_copy():
+    client, server = _client({"fira/init": {"fir_a_id": "f1", "continuity_hash": "h0"}})
+
+    first = client.establish_trust("app", "device")
+    first.continuity_hash = "changed"
+    second = client.establish_trust("app", "device")
+
+    assert len(server.calls) == 1
+    assert second is not first
+    assert second.continuity_hash == "h0"
+
+
+def test_cached_reads_return_copies():
+    client, server = _client({"betti/snaft/rules": {"rules": [{"rule_type": "intent_block"}]}})
+
+    rules = client.get_snaft_rules()
+    rules[0]["rule_type"] = "changed"
+    rules.append({})
+
+    assert client.get_snaft_rules() == [{"rule_type": "intent_block"}]
+    assert len(server.calls) == 1
+
+
+def test_coalesced_gets_each_get_their_own_response():
+    release = threading.Event()
+
+    def context(json_data, params):
+        release.wait(5)
+        return {"user_id": "u", "data": {"tags": ["a"]}}
+
+    client, server = _client({"context/u": context})
+    url = "http://kit/context/u"
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(client._request("GET", url)))
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    # Release the leader once both other callers are waiting on it
+    while client._inflight.get((url, None), [None, 0])[1] < 2:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(server.calls) == 1
+    results[0]["data"]["tags"].append("b")
+    assert [r["data"]["tags"] for r in results[1:]] == [["a"], ["a"]]
+
+
+def test_iter_snaft_rules_without_cursor_is_not_truncated():
+    rules = [{"id": i} for i in range(5)]
+    client, server = _client({
+        "betti/snaft/rules": lambda json_data, params: {"rules": rules[:params.get("limit", 5)]}
+    })
+
+    assert list(client.iter_snaft_rules(page_size=2)) == rules
+    assert [call[3] for call in server.calls] == [{"limit": 2}, {}]
+
+
+def test_context_to_tibet_pushes_repeated_updates():
+    client, server = _client({
+        "context/update": None,
+        "sense/evaluate": {"triggered_intents": []},
+    })
+
+    client.context_to_tibet("f1", "u", {"location": "home"})
+    client.context_to_tibet("f1", "u", {"location": "home"})
+
+    assert [call[1] for call in server.calls].count("context/update") == 2
+
+
+def test_tibets_chain_on_the_previous_hash():
+    hashes = iter(["h1", "h2"])
+    client, server = _client({
+        "fira/init": {"fir_a_id": "f1", "continuity_hash": "h0"},
+        "ift": lambda json_data, params: {
+            "fir_a_id": "f1", "continuity_hash": next(hashes), "events": []
+        },
+    })
+
+    client.establish_trust("app", "device")
+    client.send_tibet("f1", "lights_on")
+    client.send_tibet("f1", "lights_off")
+
+    assert [call[2]["continuity_hash_prev"] for call in server.calls[1:]] == ["h0", "h1"]
+
+    client.forget_relationship("f1")
+    assert client._prev_hash("f1") is None
@@ -0,0 +1,89 @@
+"""
+Regression tests for SenseEngine memoization (betti.context)
+"""
+
+from betti.context import Context, SenseEngine, SenseRule
+
+
+def _engine():
+    engine = SenseEngine()
+    lights = SenseRule(name="lights", conditions={"loc": "home"}, intent="lights", priority=8)
+    music = SenseRule(name="music", conditions={"loc": "home"}, intent="music", priority=3)
+    engine.add_rule(lights)
+    engine.add_rule(music)
+    return engine, lights, music
+
+
+def test_evaluate_sees_rule_edits_on_unchanged_context():
+    engine, lights, music = _engine()
+    context = Context(user_id="u", data={"loc": "home"})
+    assert engine.evaluate(context) == ["lights", "music"]
+
+    lights.enabled = False
+    assert engine.evaluate(context) == ["music"]
+
+    lights.enabled = True
+    lights.conditions = {"loc": "work"}
+    assert engine.evaluate(context) == ["music"]
+
+
+def test_intent_change_is_returned_by_evaluate():
+    engine, lights, _ = _engine()
+    context = Context(user_id="u", data={"loc": "home"})
+    assert engine.evaluate(context) == ["lights", "music"]
+
+    lights.intent = "lights_off"
+    assert engine.evaluate(context) == ["lights_off", "music"]
+    assert [rule.intent for rule in engine.get_triggered_rules(context)] == ["lights_off", "music"]
+
+
+def test_priority_change_reorders_added_rules():
+    engine, lights, music = _engine()
+    context = Context(user_id="u", data={"loc": "home"})
+    assert engine.evaluate(context) == ["lights", "music"]
+
+    music.priority = 9
+    assert engine.evaluate(context) == ["music", "lights"]
+    assert [rule.name for rule in engine.get_triggered_rules(context, top_k=1)] == ["music"]
+
+
+def test_direct_data_writes_invalidate_memoized_verdicts():
+    engine, _, _ = _engine()
+    context = Context(user_id="u", data={"loc": "home"})
+    assert engine.evaluate(context) == ["lights", "music"]
+
+    context.data["loc"] = "work"
+    assert engine.evaluate(context) == []
+
+    context.data = {"loc": "home"}
+    assert engine.evaluate(context) == ["lights", "music"]
+
+    del context.data["loc"]
+    assert engine.evaluate(context) == []
+
+
+def test_in_condition_matches_context_semantics():
+    context = Context(user_id="u", data={"room": "living", "tag": 2})
+    for conditions in (
+        {"room": {"in": "living_room"}},
+        {"room": {"in": ["living", "kitchen"]}},
+        {"room": {"in": {"living": 1}}},
+        {"tag": {"in": range(5)}},
+        {"room": {"in": ["hall"]}},
+    ):
+        rule = SenseRule(name="r", conditions=conditions, intent="i")
+        assert rule.evaluate(context) == context.matches(conditions)
+
+
+def test_in_place_container_changes_are_not_memoized():
+    engine = SenseEngine()
+    engine.add_rule(SenseRule(name="t", conditions={"tags": ["x"]}, intent="t"))
+    context = Context(user_id="u", data={"tags": ["x"]})
+    assert engine.evaluate(context) == ["t"]
+
+    context.data["tags"].append("y")
+    assert engine.evaluate(context) == []
+    assert not context.matches({"tags": ["x"]})
+
+    context.data["tags"] = "x"  # Scalar again: memoized
+    assert context._version is not None
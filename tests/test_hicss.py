@@ -0,0 +1,39 @@
+"""
+Regression tests for the Flag2Fail4Intent DO layer (core.security.hicss)
+"""
+
+import asyncio
+import socket
+
+from core.security.hicss import monitor_do_layer, monitor_do_layer_async
+
+
+def _closed_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_did_devices_pass_unchecked():
+    [monitor] = monitor_do_layer(1, ["did:jis:lamp"], conn=None)
+    assert monitor.passed
+    assert not monitor.flagged
+    assert monitor.suggested_action is None
+
+
+def test_unreachable_device_fails_with_switch():
+    [monitor] = monitor_do_layer(1, [f"127.0.0.1:{_closed_port()}"], conn=None)
+    assert monitor.actual_value == "offline"
+    assert monitor.flagged
+    assert monitor.suggested_action == "switch"
+
+
+def test_sync_and_async_entry_points():
+    async def main():
+        # The sync wrapper also works from inside a running loop
+        sync_monitors = monitor_do_layer(1, ["did:jis:lamp"], conn=None)
+        async_monitors = await monitor_do_layer_async(1, ["did:jis:lamp"], conn=None)
+        return sync_monitors, async_monitors
+
+    sync_monitors, async_monitors = asyncio.run(main())
+    assert sync_monitors == async_monitors
@@ -0,0 +1,60 @@
+"""
+Regression tests for IBalance route caching (gfx.i_balance)
+"""
+
+from gfx.i_balance import GPUNodeStatus, IBalance
+
+
+def test_direct_node_write_invalidates_route_cache():
+    balance = IBalance()
+    assert balance.route("inference").target_node == ""
+
+    balance.nodes["oomllama"].status = GPUNodeStatus.IDLE
+    assert balance.route("inference").target_node == "oomllama"
+
+    balance.nodes["oomllama"].status = GPUNodeStatus.OFFLINE
+    assert balance.route("inference").target_node == ""
+
+
+def test_heartbeat_invalidates_route_cache():
+    balance = IBalance()
+    balance.update_status("jtel-brain", {"vram_used_mb": 1000})
+    assert balance.route("inference").target_node == "jtel-brain"
+
+    balance.update_status("jtel-brain", {"vram_used_mb": 5000})  # OVERLOADED
+    balance.update_status("oomllama", {"vram_used_mb": 1000})
+    assert balance.route("inference").target_node == "oomllama"
+
+
+def test_direct_vram_write_updates_load_order():
+    balance = IBalance()
+    balance.update_status("jtel-brain", {"vram_used_mb": 0})
+    balance.update_status("oomllama", {"vram_used_mb": 1000})
+    assert balance.route("inference", vram_needed=100).target_node == "jtel-brain"
+
+    balance.nodes["jtel-brain"].vram_used_mb = 5000
+    decision = balance.route("inference", vram_needed=100)
+    assert decision.target_node == "oomllama"
+    assert decision.fallback_node == "jtel-brain"
+
+
+def test_capabilities_reassignment_updates_routing():
+    balance = IBalance()
+    balance.update_status("jtel-brain", {"vram_used_mb": 0})
+    assert balance.route("transcription").target_node == ""
+
+    node = balance.nodes["jtel-brain"]
+    node.capabilities = ["security", "transcription"]
+    assert node.capabilities == frozenset({"security", "transcription"})
+    assert balance.route("transcription").target_node == "jtel-brain"
+
+
+def test_out_of_range_heartbeat_is_clamped():
+    balance = IBalance()
+    balance.update_status("oomllama", {"vram_used_mb": 1000, "current_tasks": 10_000})
+    node = balance.nodes["oomllama"]
+    assert node.current_tasks == 10_000
+    assert node.ready
+
+    node.vram_used_mb = -5
+    assert node.can_accept(node.vram_mb)
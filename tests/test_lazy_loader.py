@@ -0,0 +1,57 @@
+"""
+Regression tests for LazyGPULoader bookkeeping (gfx.lazy_loader)
+"""
+
+import asyncio
+import threading
+from datetime import datetime, timedelta
+
+from gfx.lazy_loader import LazyGPULoader
+
+
+def _loader(**kwargs):
+    loader = LazyGPULoader(gpu_vram_mb=1000, transfer_fn=lambda layer, channel: None, **kwargs)
+    loader.register_model("m", [
+        {"name": "embed", "size_mb": 400, "type": "embedding"},
+        {"name": "attn", "size_mb": 400, "type": "attention"},
+    ])
+    return loader
+
+
+def test_last_used_derived_from_stamp():
+    loader = _loader()
+    layer = loader._find_layer("m", "embed")
+    assert layer.last_used is None
+
+    loader.load_layer("m", "embed")
+    loaded_ns = layer.last_used_ns
+    assert abs(datetime.now() - layer.last_used) < timedelta(seconds=1)
+
+    loader.load_layer("m", "embed")  # Cache hit re-stamps
+    assert layer.last_used_ns >= loaded_ns
+    assert loader.get_vram_status()["layers"][0]["last_used"] == layer.last_used.isoformat()
+
+
+def test_sync_load_waits_for_inflight_async_load():
+    started = threading.Event()
+    release = threading.Event()
+
+    def transfer(layer, channel):
+        started.set()
+        release.wait(5)
+
+    loader = _loader()
+    loader.transfer_fn = transfer
+
+    async def main():
+        task = asyncio.ensure_future(loader.load_layer_async("m", "embed"))
+        await asyncio.to_thread(started.wait, 5)
+        sync_load = asyncio.get_running_loop().run_in_executor(
+            None, loader.load_layer, "m", "embed")
+        await asyncio.sleep(0.05)
+        release.set()
+        return await task, await sync_load
+
+    assert asyncio.run(main()) == (True, True)
+    assert loader.vram_used == 400
+    assert loader.stats["layers_loaded"] == 1
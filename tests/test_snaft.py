@@ -0,0 +1,78 @@
+"""
+Regression tests for SNAFT rule ordering (core.security.snaft)
+"""
+
+import pytest
+
+pytest.importorskip("psycopg2")
+pytest.importorskip("dotenv")
+
+from core.security.snaft import SNAFTEngine, SNAFTRule, bucket_snaft_rules  # noqa: E402
+
+
+def _rule(rule_id, rule_type, severity, intent_pattern=None, capability_limit=None,
+          constraint_check=None):
+    return SNAFTRule(rule_id, rule_type, intent_pattern, capability_limit,
+                     constraint_check, f"rule {rule_id}", severity, False)
+
+
+def _violation(rules, intent, parameters=None):
+    return SNAFTEngine()._find_violation(bucket_snaft_rules(rules), intent, parameters)
+
+
+def test_first_violation_follows_severity_order_across_rule_types():
+    # SQL order: critical capability limit before a warning intent block
+    rules = [
+        _rule(1, "capability_limit", "critical", capability_limit={"altitude": 120}),
+        _rule(2, "intent_block", "warning", intent_pattern="fly"),
+    ]
+    rule, detail = _violation(rules, "fly_high", {"altitude": 500})
+    assert rule.id == 1
+    assert detail == "Parameter 'altitude' (500) exceeds limit (120)"
+
+    rule, _ = _violation(rules, "fly_high", {"altitude": 100})
+    assert rule.id == 2
+
+
+def test_intent_block_outranks_later_safety_constraint():
+    rules = [
+        _rule(1, "intent_block", "critical", intent_pattern="weapon.*"),
+        _rule(2, "safety_constraint", "error", constraint_check="False"),
+    ]
+    assert _violation(rules, "weaponize")[0].id == 1
+    assert _violation(rules, "walk")[0].id == 2
+
+
+class _FakeConn:
+    """Serves snaft_rules rows and counts the connections opened"""
+
+    def __init__(self, rows, opened):
+        self.rows = rows
+        opened.append(self)
+
+    def cursor(self):
+        return self
+
+    def execute(self, query, params=None):
+        pass
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+
+def test_rule_buckets_load_once_until_invalidated():
+    rows = [tuple(_rule(1, "intent_block", "critical", intent_pattern="weapon"))]
+    opened = []
+    engine = SNAFTEngine()
+    engine.get_security_conn = lambda: _FakeConn(rows, opened)
+
+    assert engine.check_snaft("did:1", "robot", "acme", "walk") == (True, None)
+    assert engine.check_snaft("did:1", "robot", "acme", "wave") == (True, None)
+    assert len(opened) == 1
+
+    engine.invalidate_rules()
+    assert engine.check_snaft("did:1", "robot", "acme", "walk") == (True, None)
+    assert len(opened) == 2
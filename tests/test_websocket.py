@@ -0,0 +1,40 @@
+"""
+Regression tests for incoming frame handling (betti.websocket, betti.async_websocket)
+"""
+
+import pytest
+
+from betti.async_websocket import AsyncTibetWebSocket
+from betti.websocket import TibetWebSocket
+
+
+def _handler(cls, **callbacks):
+    ws = cls("ws://kit/ws/u", **callbacks)
+    if cls is TibetWebSocket:
+        return lambda message: ws._handle_message(None, message)
+    return ws._handle_message
+
+
+@pytest.mark.parametrize("cls", [TibetWebSocket, AsyncTibetWebSocket])
+def test_scalar_frames_reach_on_message(cls):
+    messages, errors = [], []
+    handle = _handler(cls, on_message=messages.append, on_error=errors.append)
+
+    for frame in ["42", '"hi"', "true", "null", b"3.5"]:
+        handle(frame)
+
+    assert messages == [42, "hi", True, None, 3.5]
+    assert errors == []
+
+
+@pytest.mark.parametrize("cls", [TibetWebSocket, AsyncTibetWebSocket])
+def test_typed_frames_dispatch_and_plain_text_is_ignored(cls):
+    messages, tibets = [], []
+    handle = _handler(cls, on_message=messages.append, on_tibet=tibets.append)
+
+    handle("ping")
+    handle('{"type": "tibet", "intent": "lights_on"}')
+    handle(b"[1, 2]")
+
+    assert messages == [{"type": "tibet", "intent": "lights_on"}, [1, 2]]
+    assert tibets == [{"type": "tibet", "intent": "lights_on"}]